@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import difflib
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -219,6 +218,8 @@ def _installed_addon_path(addon_id: str, *, install_dir: str | Path | None = Non
 
 
 def _unified_json_diff(source: Any, target: Any, *, fromfile: str, tofile: str) -> str:
+    import difflib
+
     source_lines = json.dumps(source, indent=2, ensure_ascii=False, sort_keys=True).splitlines()
     target_lines = json.dumps(target, indent=2, ensure_ascii=False, sort_keys=True).splitlines()
     return "\n".join(
@@ -80,8 +80,13 @@ class Config:
         local_llm     – Local LLM server settings
     """
 
+    # Built-in defaults as plain strings, captured on the first reset so
+    # later resets restore them without replaying every ``_add`` call.
+    _default_sections: dict[str, dict[str, str]] | None = None
+
     def __init__(self):
         self.config = configparser.ConfigParser()
+        self._dirty = False
 
         search_paths = [
             Path.cwd() / "config.ini",
@@ -206,6 +211,20 @@ class Config:
         # ── addons ─────────────────────────────────────────────────────────
         self._add("addons", "paths", "")
 
+    def reset_to_defaults(self) -> None:
+        """Replace every value with the built-in defaults (does NOT persist to disk)."""
+        self.config = configparser.ConfigParser()
+        self._dirty = True
+        defaults = Config._default_sections
+        if defaults is not None:
+            self.config.read_dict(defaults)
+            return
+        self._set_defaults()
+        Config._default_sections = {
+            section: dict(self.config.items(section, raw=True))
+            for section in self.config.sections()
+        }
+
     # ── typed access ───────────────────────────────────────────────────────
 
     def get(self, section: str, key: str, fallback: Any = None) -> Any:
@@ -227,11 +246,52 @@ class Config:
         except (configparser.NoSectionError, configparser.NoOptionError):
             return fallback
 
-    def set_value(self, section: str, key: str, value: str):
-        """Set a configuration value at runtime (does NOT persist to disk)."""
+    def snapshot(self, section: str) -> dict[str, Any]:
+        """
+        Return every key of *section* as a dict, converted as :meth:`get` would.
+
+        Callers that read many keys of one section (e.g. when building a GUI
+        tab) take one snapshot instead of issuing a lookup per key.  Values
+        whose conversion fails are kept as raw strings.  The snapshot is a
+        copy and is not updated by later :meth:`set_value` calls.
+        """
+        if not self.config.has_section(section):
+            return {}
+        values: dict[str, Any] = {}
+        for key in self.config.options(section):
+            try:
+                values[key] = self.get(section, key)
+            except ValueError:
+                values[key] = self.config.get(section, key).split("#")[0].strip()
+        return values
+
+    def update(self, section: str, values: dict[str, str]):
+        """Set several values of *section* at runtime (does NOT persist to disk)."""
         if not self.config.has_section(section):
             self.config.add_section(section)
+        for key, value in values.items():
+            self.config.set(section, key, value)
+        if values:
+            self._dirty = True
+
+    def set_value(self, section: str, key: str, value: str) -> bool:
+        """
+        Set a configuration value at runtime (does NOT persist to disk).
+
+        Returns ``True`` when the stored string changed.
+        """
+        if not self.config.has_section(section):
+            self.config.add_section(section)
+        elif self.config.get(section, key, raw=True, fallback=None) == value:
+            return False
         self.config.set(section, key, value)
+        self._dirty = True
+        return True
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """``True`` while runtime changes have not been written by :meth:`save`."""
+        return self._dirty
 
     def save(self):
         """Persist current configuration to disk."""
@@ -239,6 +299,7 @@ class Config:
             self.config_path = Path.cwd() / "config.ini"
         with open(self.config_path, "w", encoding="utf-8") as fh:
             self.config.write(fh)
+        self._dirty = False
 
 
 # Global singleton
@@ -221,14 +221,16 @@ class ReviewSessionState:
     ) -> ReviewSessionState:
         """Build saved-session state from a persisted GUI session payload."""
         issues: list[ReviewIssue] = []
+        append_issue = issues.append
+        parse_timestamp = datetime.fromisoformat
         for raw_issue in data.get("issues", []):
             issue_data = dict(raw_issue)
             if issue_data.get("resolved_at"):
                 try:
-                    issue_data["resolved_at"] = datetime.fromisoformat(issue_data["resolved_at"])
+                    issue_data["resolved_at"] = parse_timestamp(issue_data["resolved_at"])
                 except (ValueError, TypeError):
                     issue_data["resolved_at"] = None
-            issues.append(ReviewIssue(**issue_data))
+            append_issue(ReviewIssue(**issue_data))
 
         return cls.from_report_context(
             cls._report_context_from_serialized_dict(data),
@@ -316,54 +316,75 @@ class ReviewExecutionRuntime:
             thread.start()
 
     def _run_scheduled_job(self, job_id: str) -> None:
+        # Keep draining the queue on this worker rather than starting a new
+        # thread for each job that becomes ready behind it.
+        next_job_id: str | None = job_id
+        while next_job_id is not None:
+            next_job_id = self._run_scheduled_job_once(next_job_id)
+
+    def _run_scheduled_job_once(self, job_id: str) -> str | None:
+        """Run one scheduled job and return the next job id for this thread."""
         with self._lock:
             scheduled = self._jobs[job_id]
         job = scheduled.job
-        sink = CallbackEventSink(self._record_event)
         error: Exception | None = None
+        continue_here = True
+        next_job_id: str | None = None
         try:
-            if scheduled.cancel_event.is_set():
-                self._mark_cancelled(job)
-                return
-            if scheduled.on_started is not None:
-                scheduled.on_started(job, scheduled.cancel_event)
-            if scheduled.executor is not None:
-                scheduled.executor(job, sink, scheduled.cancel_event)
-            else:
-                client = None
-                if not job.request.dry_run:
-                    client = self.backend_factory(job.request.backend_name)
-                result = self.execution_service.execute_job(
-                    job,
-                    client,
-                    sink=sink,
-                    cancel_check=scheduled.cancel_event.is_set,
-                )
-                if scheduled.cancel_event.is_set() and not self._is_terminal_state(job.state):
-                    self._mark_cancelled(job)
-                    return
-                if result.status == "issues_found" and scheduled.auto_finalize:
-                    generated = self.execution_service.generate_report(
-                        job,
-                        result.issues,
-                        scheduled.output_file,
-                        sink=sink,
-                    )
-                    if generated is None:
-                        self._fail_job(job, RuntimeError("Failed to generate report"))
+            self._execute_scheduled_job(scheduled)
         except Exception as exc:
             error = exc
             if scheduled.cancel_event.is_set() and not self._is_terminal_state(job.state):
                 self._mark_cancelled(job)
             elif not self._is_terminal_state(job.state):
                 self._fail_job(job, exc)
+        except BaseException:
+            continue_here = False
+            raise
         finally:
             if scheduled.on_finished is not None:
                 scheduled.on_finished(job, error)
             with self._lock:
                 self._active_job_ids.discard(job_id)
                 start_ids = self._dequeue_ready_job_ids_locked()
+                if continue_here and start_ids:
+                    next_job_id = start_ids.pop(0)
+                    self._jobs[next_job_id].thread = threading.current_thread()
             self._start_job_ids(start_ids)
+        return next_job_id
+
+    def _execute_scheduled_job(self, scheduled: _ScheduledReviewJob) -> None:
+        job = scheduled.job
+        sink = CallbackEventSink(self._record_event)
+        if scheduled.cancel_event.is_set():
+            self._mark_cancelled(job)
+            return
+        if scheduled.on_started is not None:
+            scheduled.on_started(job, scheduled.cancel_event)
+        if scheduled.executor is not None:
+            scheduled.executor(job, sink, scheduled.cancel_event)
+            return
+        client = None
+        if not job.request.dry_run:
+            client = self.backend_factory(job.request.backend_name)
+        result = self.execution_service.execute_job(
+            job,
+            client,
+            sink=sink,
+            cancel_check=scheduled.cancel_event.is_set,
+        )
+        if scheduled.cancel_event.is_set() and not self._is_terminal_state(job.state):
+            self._mark_cancelled(job)
+            return
+        if result.status == "issues_found" and scheduled.auto_finalize:
+            generated = self.execution_service.generate_report(
+                job,
+                result.issues,
+                scheduled.output_file,
+                sink=sink,
+            )
+            if generated is None:
+                self._fail_job(job, RuntimeError("Failed to generate report"))
 
     def _collect_event_records_locked(
         self,
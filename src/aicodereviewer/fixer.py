@@ -61,8 +61,15 @@ def generate_ai_fix_result(
     client: AIBackend,
     review_type: str,
     lang: str,
+    *,
+    current_code: str | None = None,
 ) -> FixGenerationResult:
-    """Ask the AI backend to produce a fixed version of the file with failure diagnostics."""
+    """Ask the AI backend to produce a fixed version of the file with failure diagnostics.
+
+    Callers that already hold the file contents (for example a batch fixing
+    several issues in one file) can pass them as *current_code* to skip the
+    read; the size limits are still enforced.
+    """
     file_path = issue.file_path or ""
     issue_feedback = issue.ai_feedback or issue.description or ""
     try:
@@ -83,8 +90,9 @@ def generate_ai_fix_result(
                 ),
             )
 
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as fh:
-            current_code = fh.read()
+        if current_code is None:
+            with open(file_path, "r", encoding="utf-8", errors="ignore") as fh:
+                current_code = fh.read()
 
         max_content = config.get("performance", "max_fix_content_length")
         if not current_code or len(current_code) > max_content:
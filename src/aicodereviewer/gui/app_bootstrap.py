@@ -206,4 +206,7 @@ class AppBootstrapHelper:
         self.host._detached_addon_review_redock_btn = None
         self.host._current_addon_review_surface = None
         self.host._current_addon_review_diffs = {}
-        self.host._active_toasts = []
\ No newline at end of file
+        self.host._active_toasts = []
+        self.host._retired_result_widgets = []
+        self.host._retired_result_widget_set = set()
+        self.host._retired_result_widgets_job = None
\ No newline at end of file
@@ -22,12 +22,20 @@ class AppLifecycleHelper:
         self.host._app_destroying = True
         self.host._app_helpers().surfaces().prepare_detached_windows_for_shutdown()
         self.host._log_polling = False
+        if getattr(self.host, "_config_flush_after_id", None) is not None:
+            # Write debounced form settings before their timer is cancelled.
+            self.host._flush_config()
         self.host._cancel_widget_after_callbacks(self.host)
         self.host._stop_local_http_server()
         if hasattr(self.host, "_queue_handler"):
             logging.getLogger().removeHandler(self.host._queue_handler)
         self._release_active_ai_fix_client()
         self._finish_active_health_check()
+        if hasattr(self.host, "_shutdown_editor_spawn_pool"):
+            self.host._shutdown_editor_spawn_pool()
+        review_execution_facade = getattr(self.host, "_review_execution_facade", None)
+        if review_execution_facade is not None:
+            review_execution_facade.shutdown()
         if hasattr(self.host, "_release_review_client"):
             self.host._release_review_client()
         self.host._app_helpers().runtime().clear_ui_call_queue()
@@ -14,7 +14,6 @@ import sys
 import threading
 import time
 from tkinter import filedialog
-import difflib
 from types import ModuleType
 from typing import Any, Sequence
 import webbrowser
@@ -1736,6 +1735,8 @@ class BenchmarkTabMixin:
         primary_text: str,
         compare_text: str,
     ) -> str:
+        import difflib
+
         semantic_summary = self._build_issue_level_diff_summary(primary_report_path, compare_report_path)
         diff_lines = list(
             difflib.unified_diff(
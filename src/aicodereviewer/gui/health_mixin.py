@@ -6,7 +6,7 @@ import logging
 import re
 import threading
 import webbrowser
-from typing import Any
+from typing import Any, Callable
 
 import customtkinter as ctk  # type: ignore[import-untyped]
 
@@ -91,6 +91,26 @@ class HealthMixin:
         """Return the runtime owner for backend model-refresh state."""
         return getattr(self, "_active_model_refresh")
 
+    def _begin_model_refresh(
+        self,
+        backend_name: str,
+        on_done: Callable[[], None] | None,
+    ) -> bool:
+        """Start a model refresh for *backend_name*; return False when one is running.
+
+        *on_done* runs on the UI thread once the refresh that covers this
+        request finishes, whether it was started here or was already running.
+        """
+        controller = self._model_refresh_controller()
+        started = controller.begin(backend_name)
+        if on_done is not None and not controller.add_done_callback(backend_name, on_done):
+            self._dispatch_health_ui(on_done)
+        return started
+
+    def _finish_model_refresh(self, backend_name: str) -> None:
+        for callback in self._model_refresh_controller().finish(backend_name):
+            self._dispatch_health_ui(callback)
+
     def _schedule_titlebar_fix(self, window: Any) -> None:
         """Defer titlebar tweaks for popup windows without leaking fragile Tk callbacks in tests."""
         schedule_titlebar_fix(window, host=self)
@@ -305,14 +325,13 @@ class HealthMixin:
 
     def _refresh_copilot_model_list(self):
         models = get_copilot_models()
-        if models and hasattr(self, "_copilot_model_combo"):
+        if models and getattr(self, "_copilot_model_combo", None) is not None:
             current = self._copilot_model_combo.get()
             self._copilot_model_combo.configure(values=["auto"] + models)
             self._copilot_model_combo.set(current)
 
-    def _refresh_copilot_model_list_async(self):
-        controller = self._model_refresh_controller()
-        if not controller.begin("copilot"):
+    def _refresh_copilot_model_list_async(self, on_done: Callable[[], None] | None = None):
+        if not self._begin_model_refresh("copilot", on_done):
             return
 
         def _worker():
@@ -320,21 +339,20 @@ class HealthMixin:
                 models = get_copilot_models()
                 self._dispatch_health_ui(self._apply_copilot_models, models)
             finally:
-                controller.finish("copilot")
+                self._finish_model_refresh("copilot")
 
         threading.Thread(target=_worker, daemon=True).start()
 
     def _apply_copilot_models(self, models: list):
-        if models and hasattr(self, "_copilot_model_combo"):
+        if models and getattr(self, "_copilot_model_combo", None) is not None:
             current = self._copilot_model_combo.get()
             self._copilot_model_combo.configure(values=["auto"] + models)
             self._copilot_model_combo.set(current)
 
     # ── Kiro CLI ────────────────────────────────────────────────────────────
 
-    def _refresh_kiro_model_list_async(self):
-        controller = self._model_refresh_controller()
-        if not controller.begin("kiro"):
+    def _refresh_kiro_model_list_async(self, on_done: Callable[[], None] | None = None):
+        if not self._begin_model_refresh("kiro", on_done):
             return
 
         def _worker():
@@ -344,12 +362,12 @@ class HealthMixin:
                 models = get_kiro_models(kiro_path, wsl_distro)
                 self._dispatch_health_ui(self._apply_kiro_models, models)
             finally:
-                controller.finish("kiro")
+                self._finish_model_refresh("kiro")
 
         threading.Thread(target=_worker, daemon=True).start()
 
     def _apply_kiro_models(self, models: list):
-        if hasattr(self, "_kiro_model_combo"):
+        if getattr(self, "_kiro_model_combo", None) is not None:
             current = self._kiro_model_combo.get()
             self._kiro_model_combo.configure(values=models)
             if current and current in models:
@@ -359,15 +377,14 @@ class HealthMixin:
 
     def _refresh_bedrock_model_list(self):
         models = get_bedrock_models()
-        if models and hasattr(self, "_bedrock_model_combo"):
+        if models and getattr(self, "_bedrock_model_combo", None) is not None:
             current = self._bedrock_model_combo.get()
             self._bedrock_model_combo.configure(values=models)
             if current:
                 self._bedrock_model_combo.set(current)
 
-    def _refresh_bedrock_model_list_async(self):
-        controller = self._model_refresh_controller()
-        if not controller.begin("bedrock"):
+    def _refresh_bedrock_model_list_async(self, on_done: Callable[[], None] | None = None):
+        if not self._begin_model_refresh("bedrock", on_done):
             return
 
         def _worker():
@@ -375,12 +392,12 @@ class HealthMixin:
                 models = get_bedrock_models()
                 self._dispatch_health_ui(self._apply_bedrock_models, models)
             finally:
-                controller.finish("bedrock")
+                self._finish_model_refresh("bedrock")
 
         threading.Thread(target=_worker, daemon=True).start()
 
     def _apply_bedrock_models(self, models: list):
-        if models and hasattr(self, "_bedrock_model_combo"):
+        if models and getattr(self, "_bedrock_model_combo", None) is not None:
             current = self._bedrock_model_combo.get()
             self._bedrock_model_combo.configure(values=models)
             if current:
@@ -392,15 +409,14 @@ class HealthMixin:
         api_url = config.get("local_llm", "api_url", "http://localhost:1234")
         api_type = config.get("local_llm", "api_type", "lmstudio")
         models = get_local_models(api_url, api_type)
-        if models and hasattr(self, "_local_model_combo"):
+        if models and getattr(self, "_local_model_combo", None) is not None:
             current = self._local_model_combo.get()
             self._local_model_combo.configure(values=models)
             if current:
                 self._local_model_combo.set(current)
 
-    def _refresh_local_model_list_async(self):
-        controller = self._model_refresh_controller()
-        if not controller.begin("local"):
+    def _refresh_local_model_list_async(self, on_done: Callable[[], None] | None = None):
+        if not self._begin_model_refresh("local", on_done):
             return
 
         def _worker():
@@ -410,12 +426,12 @@ class HealthMixin:
                 models = get_local_models(api_url, api_type)
                 self._dispatch_health_ui(self._apply_local_models, models)
             finally:
-                controller.finish("local")
+                self._finish_model_refresh("local")
 
         threading.Thread(target=_worker, daemon=True).start()
 
     def _apply_local_models(self, models: list):
-        if models and hasattr(self, "_local_model_combo"):
+        if models and getattr(self, "_local_model_combo", None) is not None:
             current = self._local_model_combo.get()
             self._local_model_combo.configure(values=models)
             if current:
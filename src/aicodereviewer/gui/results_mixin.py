@@ -7,10 +7,14 @@ session save / load, and report finalization.
 from __future__ import annotations
 
 import datetime
+import io
 import json
 import logging
 import subprocess
 import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Any, Dict, List, Optional, TypedDict
@@ -27,7 +31,7 @@ from aicodereviewer.models import ReviewIssue
 from aicodereviewer.reviewer import verify_issue_resolved
 
 from .dialogs import ConfirmDialog
-from .popup_surfaces import ResultsPopupSurfaceController
+from .popup_surfaces import ResultsPopupSurfaceController, _atomic_replacement
 from .results_builder import ResultsTabBuilder
 from .results_layout import ResultsLayoutHelper
 from .results_popups import ResultsPopupHelper
@@ -37,6 +41,12 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["ResultsTabMixin", "IssueCard", "_NUMERIC_SETTINGS"]
 
+# Upper bound on concurrent fix requests when parallel processing is enabled.
+AI_FIX_MAX_PARALLEL_REQUESTS = 4
+# Retired issue-card widgets destroyed per idle tick after the list is reset.
+RESULTS_WIDGET_DESTROY_BATCH = 25
+REVIEW_CHANGES_REFRESH_INTERVAL_S = 0.05
+
 
 class IssueCard(TypedDict):
     """Type-safe record stored in ``App._issue_cards``."""
@@ -127,8 +137,7 @@ class ResultsTabMixin:
         # Ensure the Results tab is built before accessing its widgets
         self._build_tab_if_needed(t("gui.tab.results"))
         self._issues = issues
-        for w in self.results_frame.winfo_children():
-            w.destroy()
+        self._retire_result_widgets()
         self._issue_cards.clear()
 
         if not issues:
@@ -196,6 +205,45 @@ class ResultsTabMixin:
         self._update_bottom_buttons()
         self.tabs.set(t("gui.tab.results"))
 
+    def _retire_result_widgets(self) -> None:
+        """Detach the current issue cards and destroy them in idle-time batches.
+
+        Tearing down hundreds of CTk cards synchronously stalls the Results
+        tab; hiding them first lets the next list render straight away.
+        """
+        widgets = list(self.results_frame.winfo_children())
+        if not widgets:
+            return
+        if self._testing_mode:
+            for widget in widgets:
+                widget.destroy()
+            return
+        # Retired widgets stay children of results_frame until their batch is
+        # destroyed, so skip the ones an earlier retire already queued.
+        queued = self._retired_result_widget_set
+        for widget in widgets:
+            if widget in queued:
+                continue
+            widget.grid_forget()
+            queued.add(widget)
+            self._retired_result_widgets.append(widget)
+        if self._retired_result_widgets_job is None:
+            self._retired_result_widgets_job = self._schedule_app_after(0, self._destroy_retired_result_widgets)
+
+    def _destroy_retired_result_widgets(self) -> None:
+        self._retired_result_widgets_job = None
+        retired = self._retired_result_widgets
+        batch = retired[:RESULTS_WIDGET_DESTROY_BATCH]
+        del retired[:RESULTS_WIDGET_DESTROY_BATCH]
+        self._retired_result_widget_set.difference_update(batch)
+        for widget in batch:
+            try:
+                widget.destroy()
+            except Exception:
+                logger.debug("Retired result widget was already destroyed", exc_info=True)
+        if retired:
+            self._retired_result_widgets_job = self._schedule_app_after(0, self._destroy_retired_result_widgets)
+
     def _populate_filter_bar(self, issues: "List[ReviewIssue]") -> None:
         types = sorted({
             itype
@@ -562,6 +610,20 @@ class ResultsTabMixin:
         return m.get(issue.status, ("gui.results.pending", default_color))
 
     def _refresh_status(self, idx: int):
+        self._refresh_card_status(idx)
+        self._update_bottom_buttons()
+        self._apply_filters()
+
+    def _refresh_many(self, indices: List[int]) -> None:
+        """Refresh several cards, then recompute buttons and filters once."""
+        if not indices:
+            return
+        for idx in indices:
+            self._refresh_card_status(idx)
+        self._update_bottom_buttons()
+        self._apply_filters()
+
+    def _refresh_card_status(self, idx: int) -> None:
         rec = self._issue_cards[idx]
         issue = rec["issue"]
         s_key, s_color = self._status_display(issue, rec["color"])
@@ -574,8 +636,6 @@ class ResultsTabMixin:
             rec["resolve_btn"].grid_remove()
             rec["skip_btn"].grid_remove()
             rec["undo_btn"].grid(row=0, column=2, padx=2, pady=(0, 0))
-        self._update_bottom_buttons()
-        self._apply_filters()
 
     def _get_runner_report_context(self) -> dict[str, Any]:
         """Return deferred report metadata from the active runner if available."""
@@ -634,21 +694,52 @@ class ResultsTabMixin:
         editor_cmd = config.get("gui", "editor_command", "").strip()
 
         if editor_cmd and not self._testing_mode:
-            try:
-                subprocess.Popen([editor_cmd, issue.file_path])
-            except Exception as exc:
-                logger.error("Cannot open editor '%s': %s", editor_cmd, exc)
-                self._show_toast(str(exc), error=True)
-                return
-            issue.set_resolution(
-                status="resolved",
-                provenance="external_editor",
-                resolved_at=datetime.datetime.now(),
+            future = self._editor_spawn_pool().submit(subprocess.Popen, [editor_cmd, issue.file_path])
+            future.add_done_callback(
+                lambda done, _idx=idx, _cmd=editor_cmd: self._run_on_ui_thread(
+                    self._on_external_editor_spawned, _idx, issue, _cmd, done,
+                )
             )
-        else:
-            self._open_builtin_editor(idx)
             return
 
+        self._open_builtin_editor(idx)
+
+    def _editor_spawn_pool(self) -> ThreadPoolExecutor:
+        """Return the shared pool that launches external editors off the Tk thread."""
+        pool: ThreadPoolExecutor | None = getattr(self, "_editor_pool", None)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aicr-editor")
+            self._editor_pool = pool
+        return pool
+
+    def _shutdown_editor_spawn_pool(self) -> None:
+        pool: ThreadPoolExecutor | None = getattr(self, "_editor_pool", None)
+        if pool is None:
+            return
+        self._editor_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_external_editor_spawned(
+        self,
+        idx: int,
+        issue: ReviewIssue,
+        editor_cmd: str,
+        future: Future,
+    ) -> None:
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Cannot open editor '%s': %s", editor_cmd, exc)
+            self._show_toast(str(exc), error=True)
+            return
+        if idx >= len(self._issue_cards) or self._issue_cards[idx]["issue"] is not issue:
+            return
+        issue.set_resolution(
+            status="resolved",
+            provenance="external_editor",
+            resolved_at=datetime.datetime.now(),
+        )
         self._refresh_status(idx)
 
     def _open_builtin_editor(
@@ -824,76 +915,31 @@ class ResultsTabMixin:
                     self._attach_active_ai_fix_client(client)
 
                 results: dict[int, dict[str, Any]] = {}
-                for idx, rec in selected:
-                    if ai_fix_cancel_event.is_set():
-                        logger.info("AI Fix cancelled by user")
-                        cancelled = True
-                        break
-                    issue = rec["issue"]
-                    try:
-                        logger.info("  AI Fix: %s …", issue.file_path)
-                        if Path(issue.file_path).exists() or not issue.code_snippet:
-                            fix_result = generate_ai_fix_result(
-                                issue,
-                                client,
-                                issue.issue_type,
-                                review_language,
-                            )
-                        else:
-                            fix = client.get_fix(
-                                code_content=issue.code_snippet,
-                                issue_feedback=issue.ai_feedback or issue.description,
-                                review_type=issue.issue_type,
-                                lang=review_language,
-                            )
-                            if fix and not fix.startswith("Error:"):
-                                fix_result = {
-                                    "content": fix.strip(),
-                                    "diagnostic": None,
-                                }
-                            else:
-                                detail = str(fix).strip() if isinstance(fix, str) and fix.strip() else "Backend returned no usable fix content."
-                                fix_result = {
-                                    "content": None,
-                                    "diagnostic": build_failure_diagnostic(
-                                        category="provider",
-                                        origin="fix_generation",
-                                        detail=detail,
-                                    ),
-                                }
-                        if ai_fix_cancel_event.is_set():
-                            logger.info("AI Fix cancelled by user")
-                            cancelled = True
-                            break
-                        content = fix_result.content if hasattr(fix_result, "content") else fix_result["content"]
-                        diagnostic = fix_result.diagnostic if hasattr(fix_result, "diagnostic") else fix_result["diagnostic"]
-                        if isinstance(content, str) and content:
-                            results[idx] = {
-                                "status": "generated",
-                                "content": content.strip(),
-                                "diagnostic": None,
-                            }
-                            logger.info("    → fix generated")
-                        else:
-                            results[idx] = {
-                                "status": "failed",
-                                "content": None,
-                                "diagnostic": diagnostic.to_dict() if diagnostic else None,
-                            }
-                            logger.warning("    → no fix returned")
-                    except Exception as exc:
-                        logger.error("  AI Fix error for %s: %s",
-                                     issue.file_path, exc)
-                        diagnostic = diagnostic_from_exception(exc, origin="fix_generation")
-                        results[idx] = {
-                            "status": "failed",
-                            "content": None,
-                            "diagnostic": diagnostic.to_dict(),
-                        }
+                source_cache = self._read_batch_fix_sources(selected)
+                pool = ThreadPoolExecutor(
+                    max_workers=self._batch_ai_fix_worker_count(len(selected)),
+                    thread_name_prefix="aicr-ai-fix",
+                )
+                try:
+                    futures = {
+                        pool.submit(
+                            self._generate_batch_fix_entry,
+                            rec["issue"],
+                            client,
+                            review_language,
+                            source_cache.get(rec["issue"].file_path),
+                        ): idx
+                        for idx, rec in selected
+                    }
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
                         if ai_fix_cancel_event.is_set():
                             logger.info("AI Fix cancelled by user")
                             cancelled = True
                             break
+                finally:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                results = {idx: results[idx] for idx, _rec in selected if idx in results}
                 if cancelled:
                     self._run_on_ui_thread(self._on_ai_fix_cancelled, selected)
                 else:
@@ -905,6 +951,92 @@ class ResultsTabMixin:
 
         threading.Thread(target=_worker, daemon=True).start()
 
+    @staticmethod
+    def _batch_ai_fix_worker_count(selected_count: int) -> int:
+        if not config.get("processing", "enable_parallel_processing", False):
+            return 1
+        return max(1, min(AI_FIX_MAX_PARALLEL_REQUESTS, selected_count))
+
+    @staticmethod
+    def _read_batch_fix_sources(selected) -> dict[str, str]:
+        """Read each distinct target file once for a batch of fixes."""
+        path_counts = Counter(rec["issue"].file_path for _idx, rec in selected)
+        repeated = [path for path, count in path_counts.items() if count > 1]
+        max_fix_size = config.get("performance", "max_fix_file_size_mb")
+        sources: dict[str, str] = {}
+        for file_path in repeated:
+            try:
+                if not file_path or Path(file_path).stat().st_size > max_fix_size:
+                    continue
+                with open(file_path, "r", encoding="utf-8", errors="ignore") as fh:
+                    sources[file_path] = fh.read()
+            except OSError:
+                continue
+        return sources
+
+    @staticmethod
+    def _generate_batch_fix_entry(
+        issue: ReviewIssue,
+        client: Any,
+        review_language: str,
+        current_code: str | None = None,
+    ) -> dict[str, Any]:
+        try:
+            logger.info("  AI Fix: %s …", issue.file_path)
+            if current_code is not None or Path(issue.file_path).exists() or not issue.code_snippet:
+                fix_result = generate_ai_fix_result(
+                    issue,
+                    client,
+                    issue.issue_type,
+                    review_language,
+                    current_code=current_code,
+                )
+            else:
+                fix = client.get_fix(
+                    code_content=issue.code_snippet,
+                    issue_feedback=issue.ai_feedback or issue.description,
+                    review_type=issue.issue_type,
+                    lang=review_language,
+                )
+                if fix and not fix.startswith("Error:"):
+                    fix_result = {
+                        "content": fix.strip(),
+                        "diagnostic": None,
+                    }
+                else:
+                    detail = str(fix).strip() if isinstance(fix, str) and fix.strip() else "Backend returned no usable fix content."
+                    fix_result = {
+                        "content": None,
+                        "diagnostic": build_failure_diagnostic(
+                            category="provider",
+                            origin="fix_generation",
+                            detail=detail,
+                        ),
+                    }
+            content = fix_result.content if hasattr(fix_result, "content") else fix_result["content"]
+            diagnostic = fix_result.diagnostic if hasattr(fix_result, "diagnostic") else fix_result["diagnostic"]
+            if isinstance(content, str) and content:
+                logger.info("    → fix generated")
+                return {
+                    "status": "generated",
+                    "content": content.strip(),
+                    "diagnostic": None,
+                }
+            logger.warning("    → no fix returned")
+            return {
+                "status": "failed",
+                "content": None,
+                "diagnostic": diagnostic.to_dict() if diagnostic else None,
+            }
+        except Exception as exc:
+            logger.error("  AI Fix error for %s: %s",
+                         issue.file_path, exc)
+            return {
+                "status": "failed",
+                "content": None,
+                "diagnostic": diagnostic_from_exception(exc, origin="fix_generation").to_dict(),
+            }
+
     def _on_ai_fix_cancelled(self, selected):
         logger.info("AI Fix operation cancelled.")
         self.status_var.set(t("common.ready"))
@@ -961,8 +1093,7 @@ class ResultsTabMixin:
             for rec in self._issue_cards:
                 if rec["issue"].status == "resolved":
                     rec["issue"].status = "fixed"
-            for i in range(len(self._issue_cards)):
-                self._refresh_status(i)
+            self._refresh_many(list(range(len(self._issue_cards))))
             self._show_toast("Testing mode: resolved issues marked as fixed")
             return
         self._review_changes_controller().begin()
@@ -984,7 +1115,22 @@ class ResultsTabMixin:
         logger.info("Review Changes: verifying %d resolved issues…",
                      len(resolved_cards))
 
+        def _finish_ui(auto_finalize: bool, error_message: str | None) -> None:
+            # All completion state changes run in one UI callback so the
+            # main loop wakes once when the pass ends.
+            if error_message is not None:
+                self._show_toast(error_message, error=True)
+            if auto_finalize:
+                self._auto_finalize()
+            else:
+                self._update_bottom_buttons()
+                self.status_var.set(t("common.ready"))
+            self._set_action_buttons_state("normal")
+            self.cancel_btn.configure(state="disabled")
+
         def _worker():
+            auto_finalize = False
+            error_message: str | None = None
             try:
                 client = self._active_review_client()
                 if client is None:
@@ -995,6 +1141,16 @@ class ResultsTabMixin:
                     client = create_backend(verification_backend)
                     self._bind_active_review_client(client)
 
+                pending_refresh: list[int] = []
+                last_flush = time.monotonic()
+
+                def _flush_refreshes() -> None:
+                    nonlocal last_flush
+                    if pending_refresh:
+                        self._run_on_ui_thread(self._refresh_many, pending_refresh.copy())
+                        pending_refresh.clear()
+                    last_flush = time.monotonic()
+
                 for i, rec in resolved_cards:
                     issue = rec["issue"]
                     try:
@@ -1009,38 +1165,32 @@ class ResultsTabMixin:
                         else:
                             issue.status = "fix_failed"
                             logger.info("  → fix NOT verified: %s", issue.file_path)
-                        self._run_on_ui_thread(self._refresh_status, i)
                     except Exception as exc:
                         logger.error("Verify failed for %s: %s", issue.file_path, exc)
                         issue.status = "fix_failed"
-                        self._run_on_ui_thread(self._refresh_status, i)
-
-                fixed_count = sum(1 for c in self._issue_cards
-                                  if c["issue"].status == "fixed")
-                failed_count = sum(1 for c in self._issue_cards
-                                   if c["issue"].status == "fix_failed")
+                    pending_refresh.append(i)
+                    if time.monotonic() - last_flush >= REVIEW_CHANGES_REFRESH_INTERVAL_S:
+                        _flush_refreshes()
+                _flush_refreshes()
+
+                status_counts = Counter(c["issue"].status for c in self._issue_cards)
+                fixed_count = status_counts["fixed"]
+                failed_count = status_counts["fix_failed"]
                 logger.info("Review Changes complete: %d fixed, %d failed.",
                              fixed_count, failed_count)
 
-                all_done = all(
-                    c["issue"].status in ("fixed", "skipped", "fix_failed")
-                    for c in self._issue_cards
+                auto_finalize = (
+                    fixed_count + failed_count + status_counts["skipped"]
+                    == len(self._issue_cards)
                 )
-                if all_done:
-                    self._run_on_ui_thread(self._auto_finalize)
-                else:
-                    self._run_on_ui_thread(self._update_bottom_buttons)
-                    self._run_on_ui_thread(self.status_var.set, t("common.ready"))
             except Exception as exc:
                 logger.error("Review Changes failed: %s", exc)
-                self._run_on_ui_thread(self._show_toast, str(exc), error=True)
-                self._run_on_ui_thread(self._update_bottom_buttons)
-                self._run_on_ui_thread(self.status_var.set, t("common.ready"))
+                auto_finalize = False
+                error_message = str(exc)
             finally:
                 self._review_changes_controller().finish()
                 self._release_review_client()
-                self._run_on_ui_thread(self._set_action_buttons_state, "normal")
-                self._run_on_ui_thread(self.cancel_btn.configure, state="disabled")
+                self._run_on_ui_thread(_finish_ui, auto_finalize, error_message)
 
         threading.Thread(target=_worker, daemon=True).start()
 
@@ -1109,10 +1259,13 @@ class ResultsTabMixin:
 
         data = self._get_session_state().to_serialized_dict(saved_at=datetime.datetime.now())
         try:
-            self._session_path.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            # Stream into a temporary file that is swapped in atomically, so a
+            # failure never leaves a truncated session behind and the encoded
+            # document is never held in memory as one string.
+            with _atomic_replacement(str(self._session_path)) as raw_handle, io.TextIOWrapper(
+                raw_handle, encoding="utf-8"
+            ) as handle:
+                json.dump(data, handle, indent=2, ensure_ascii=False)
             self._show_toast(t("gui.results.session_saved",
                                path=str(self._session_path)))
         except Exception as exc:
@@ -1162,12 +1315,18 @@ class ResultsTabMixin:
     def _validate_loaded_session_state(self, session_state: ReviewSessionState) -> ReviewSessionState:
         allowed_roots = self._session_issue_allowed_roots(session_state, self._session_path.parent)
         validated_issues: list[ReviewIssue] = []
+        # Sessions usually hold many findings per file; resolve each path once.
+        validated_paths: dict[str, str] = {}
         for issue in session_state.issues:
+            validated_path = validated_paths.get(issue.file_path)
+            if validated_path is None:
+                validated_path = self._validate_session_issue_file_path(
+                    issue.file_path,
+                    allowed_roots=allowed_roots,
+                )
+                validated_paths[issue.file_path] = validated_path
             issue_payload = dict(vars(issue))
-            issue_payload["file_path"] = self._validate_session_issue_file_path(
-                issue.file_path,
-                allowed_roots=allowed_roots,
-            )
+            issue_payload["file_path"] = validated_path
             validated_issues.append(ReviewIssue(**issue_payload))
         return ReviewSessionState(
             issues=validated_issues,
@@ -1194,7 +1353,7 @@ class ResultsTabMixin:
                 return
         try:
             session_path = self._validate_session_file_path(path_str)
-            raw = json.loads(session_path.read_text(encoding="utf-8"))
+            raw = json.loads(session_path.read_bytes())
             session_state = self._validate_loaded_session_state(
                 ReviewSessionState.from_serialized_dict(raw)
             )
@@ -1244,8 +1403,7 @@ class ResultsTabMixin:
                     self._show_toast(message, error=True)
                     return
 
-        for w in self.results_frame.winfo_children():
-            w.destroy()
+        self._retire_result_widgets()
         self._issue_cards.clear()
         self.results_summary.configure(text=t("gui.results.no_results"))
         self.review_changes_btn.configure(state="disabled")
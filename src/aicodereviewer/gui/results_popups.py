@@ -609,25 +609,27 @@ class ResultsPopupHelper:
                 provenance_label = issue.resolution_provenance.replace("_", " ").title()
             lines.append(t("gui.detail.resolution_path", resolution_path=provenance_label))
 
-        content = "\n".join(lines) + "\n"
-
         related_issues = getattr(issue, "related_issues", None) or []
         interaction_summary = getattr(issue, "interaction_summary", None) or ""
         if related_issues or interaction_summary:
-            content += f"\n{t('gui.detail.related', count=len(related_issues))}\n"
+            lines.extend(("", t("gui.detail.related", count=len(related_issues))))
             if interaction_summary:
-                content += f"{interaction_summary}\n"
+                lines.append(interaction_summary)
 
         if issue.ai_fix_suggested:
-            content += f"\n{t('gui.detail.ai_fix_suggested')}\n{issue.ai_fix_suggested}\n"
+            lines.extend(("", t("gui.detail.ai_fix_suggested"), issue.ai_fix_suggested))
         if issue.ai_fix_applied:
-            content += f"\n{t('gui.detail.ai_fix_applied')}\n{issue.ai_fix_applied}\n"
-
-        content += (
-            f"\n{t('gui.detail.ai_feedback')}\n{issue.ai_feedback}\n"
-            f"\n{t('gui.detail.code_snippet')}\n{issue.code_snippet}\n"
-        )
-        return content
+            lines.extend(("", t("gui.detail.ai_fix_applied"), issue.ai_fix_applied))
+
+        lines.extend((
+            "",
+            t("gui.detail.ai_feedback"),
+            str(issue.ai_feedback),
+            "",
+            t("gui.detail.code_snippet"),
+            str(issue.code_snippet),
+        ))
+        return "\n".join(lines) + "\n"
 
     @staticmethod
     def _normalize_int_keyed_map(source: Any) -> dict[int, Any]:
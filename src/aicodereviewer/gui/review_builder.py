@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import functools
 from typing import Any, List
 
 import customtkinter as ctk  # type: ignore[import-untyped]
 
 from aicodereviewer.config import config
-from aicodereviewer.i18n import t
+from aicodereviewer.i18n import get_locale, t
 from aicodereviewer.registries import get_backend_registry, get_review_registry
 from aicodereviewer.review_presets import (
     REVIEW_TYPE_PRESETS,
@@ -19,11 +20,27 @@ from .shared_ui import add_section_header, build_autohide_scroller
 from .widgets import InfoTooltip, _Tooltip
 
 
+@functools.lru_cache(maxsize=4)
+def _review_language_label_maps(locale: str) -> tuple[dict[str, str], dict[str, str]]:
+    """Return the review-language menu labels and their reverse map for *locale*.
+
+    The maps are shared between tab builds and must not be mutated.
+    """
+    labels = {
+        "system": t("gui.review.lang_system", lang=locale),
+        "en": t("gui.review.lang_en", lang=locale),
+        "ja": t("gui.review.lang_ja", lang=locale),
+    }
+    return labels, {value: key for key, value in labels.items()}
+
+
 class ReviewTabBuilder:
     def __init__(self, host: Any) -> None:
         self.host = host
 
     def build(self) -> None:
+        # Saved form values are read from one snapshot of the [gui] section.
+        self._gui_settings = config.snapshot("gui")
         tab = self.host._ensure_tab(t("gui.tab.review"))
         tab.grid_columnconfigure(0, weight=1)
         tab.grid_rowconfigure(0, weight=1)
@@ -134,10 +151,10 @@ class ReviewTabBuilder:
         )
         path_frame.grid(row=row, column=0, sticky="ew", padx=6, pady=(0, 4))
         path_frame.grid_columnconfigure(2, weight=1)
-        InfoTooltip.add(path_frame, t("gui.tip.project_path"), row=0, column=0)
+        InfoTooltip.lazy_add(path_frame, t("gui.tip.project_path"), row=0, column=0)
         ctk.CTkLabel(path_frame, text=t("gui.review.project_path")).grid(row=0, column=1, padx=(0, 4))
 
-        saved_path = config.get("gui", "project_path", "").strip()
+        saved_path = self._gui_settings.get("project_path", "").strip()
         self.host.path_entry = ctk.CTkEntry(path_frame, placeholder_text=t("gui.review.placeholder_path"))
         if saved_path:
             self.host.path_entry.insert(0, saved_path)
@@ -166,9 +183,10 @@ class ReviewTabBuilder:
         )
         scope_frame.grid(row=row, column=0, sticky="ew", padx=6, pady=3)
         scope_frame.grid_columnconfigure(4, weight=1)
-        InfoTooltip.add(scope_frame, t("gui.tip.scope"), row=0, column=0)
+        InfoTooltip.lazy_add(scope_frame, t("gui.tip.scope"), row=0, column=0)
         ctk.CTkLabel(scope_frame, text=t("gui.review.scope")).grid(row=0, column=1, padx=(0, 4))
         self.host.scope_var = ctk.StringVar(value="project")
+        self.host._applied_review_scope = "project"
         self.host.scope_var.trace_add("write", self.host._on_scope_changed)
         ctk.CTkRadioButton(
             scope_frame,
@@ -193,8 +211,9 @@ class ReviewTabBuilder:
         self.host.file_select_frame = ctk.CTkFrame(scope_frame)
         self.host.file_select_frame.grid(row=1, column=0, columnspan=5, sticky="ew", padx=6, pady=3)
         self.host.file_select_frame.grid_columnconfigure(4, weight=1)
-        saved_file_mode = config.get("gui", "file_select_mode", "all")
+        saved_file_mode = self._gui_settings.get("file_select_mode", "all")
         self.host.file_select_mode_var = ctk.StringVar(value=saved_file_mode)
+        self.host._applied_file_select_mode = saved_file_mode
         self.host.file_select_mode_var.trace_add("write", self.host._on_file_select_mode_changed)
         ctk.CTkRadioButton(
             self.host.file_select_frame,
@@ -217,7 +236,7 @@ class ReviewTabBuilder:
         )
         self.host.select_files_btn.grid(row=0, column=2, padx=6, sticky="w")
 
-        saved_files_raw = config.get("gui", "selected_files", "").strip()
+        saved_files_raw = self._gui_settings.get("selected_files", "").strip()
         self.host.selected_files = [path for path in saved_files_raw.split("|") if path]
         self.host._file_count_lbl = ctk.CTkLabel(
             self.host.file_select_frame,
@@ -242,6 +261,7 @@ class ReviewTabBuilder:
         self.host.diff_filter_frame.grid(row=2, column=0, columnspan=5, sticky="ew", padx=6, pady=3)
         self.host.diff_filter_frame.grid_columnconfigure(3, weight=1)
         self.host.diff_filter_var = ctk.BooleanVar(value=False)
+        self.host._applied_diff_filter = False
         self.host.diff_filter_var.trace_add("write", self.host._on_diff_filter_changed)
         self.host.diff_filter_cb = ctk.CTkCheckBox(
             self.host.diff_filter_frame,
@@ -249,7 +269,7 @@ class ReviewTabBuilder:
             variable=self.host.diff_filter_var,
         )
         self.host.diff_filter_cb.grid(row=0, column=0, columnspan=4, padx=6, pady=(2, 0), sticky="w")
-        InfoTooltip.add(self.host.diff_filter_frame, t("gui.tip.diff_file"), row=1, column=0)
+        InfoTooltip.lazy_add(self.host.diff_filter_frame, t("gui.tip.diff_file"), row=1, column=0)
         ctk.CTkLabel(self.host.diff_filter_frame, text=t("gui.review.diff_file")).grid(row=1, column=1, padx=4)
         self.host.diff_filter_file_entry = ctk.CTkEntry(
             self.host.diff_filter_frame,
@@ -265,7 +285,7 @@ class ReviewTabBuilder:
             state="disabled",
         )
         self.host.diff_filter_browse_btn.grid(row=1, column=4, padx=4)
-        InfoTooltip.add(self.host.diff_filter_frame, t("gui.tip.commits"), row=2, column=0)
+        InfoTooltip.lazy_add(self.host.diff_filter_frame, t("gui.tip.commits"), row=2, column=0)
         ctk.CTkLabel(self.host.diff_filter_frame, text=t("gui.review.commits")).grid(
             row=2,
             column=1,
@@ -279,10 +299,16 @@ class ReviewTabBuilder:
         )
         self.host.diff_filter_commits_entry.grid(row=2, column=2, columnspan=2, sticky="ew", padx=4, pady=(3, 0))
 
+        # The diff-scope inputs are hidden until diff scope is chosen, so they
+        # are built on first reveal by build_diff_frame().
+        self.host._review_scope_frame = scope_frame
+        return row + 1
+
+    def build_diff_frame(self, scope_frame: Any) -> None:
         self.host.diff_frame = ctk.CTkFrame(scope_frame)
         self.host.diff_frame.grid(row=3, column=0, columnspan=5, sticky="ew", padx=6, pady=3)
         self.host.diff_frame.grid_columnconfigure(2, weight=1)
-        InfoTooltip.add(self.host.diff_frame, t("gui.tip.diff_file"), row=0, column=0)
+        InfoTooltip.lazy_add(self.host.diff_frame, t("gui.tip.diff_file"), row=0, column=0)
         ctk.CTkLabel(self.host.diff_frame, text=t("gui.review.diff_file")).grid(row=0, column=1, padx=4)
         self.host.diff_file_entry = ctk.CTkEntry(self.host.diff_frame, placeholder_text=t("gui.review.diff_placeholder"))
         self.host.diff_file_entry.grid(row=0, column=2, sticky="ew", padx=4)
@@ -291,7 +317,7 @@ class ReviewTabBuilder:
             column=3,
             padx=4,
         )
-        InfoTooltip.add(self.host.diff_frame, t("gui.tip.commits"), row=1, column=0)
+        InfoTooltip.lazy_add(self.host.diff_frame, t("gui.tip.commits"), row=1, column=0)
         ctk.CTkLabel(self.host.diff_frame, text=t("gui.review.commits")).grid(
             row=1,
             column=1,
@@ -300,13 +326,11 @@ class ReviewTabBuilder:
         )
         self.host.commits_entry = ctk.CTkEntry(self.host.diff_frame, placeholder_text=t("gui.review.commits_placeholder"))
         self.host.commits_entry.grid(row=1, column=2, sticky="ew", padx=4, pady=(3, 0))
-        self.host.diff_frame.grid_remove()
-        return row + 1
 
     def _build_review_types_section(self, parent: Any, row: int) -> int:
         types_hdr = ctk.CTkFrame(parent, fg_color="transparent")
         types_hdr.grid(row=row, column=0, sticky="w", padx=6, pady=(4, 1))
-        InfoTooltip.add(types_hdr, t("gui.tip.review_types"), row=0, column=0)
+        InfoTooltip.lazy_add(types_hdr, t("gui.tip.review_types"), row=0, column=0)
         ctk.CTkLabel(types_hdr, text=t("gui.review.types_label"), anchor="w").grid(row=0, column=1)
         row += 1
 
@@ -333,11 +357,12 @@ class ReviewTabBuilder:
         self.host.review_types_scrollbar = types_scrollbar
         self.host.type_vars = {}
         self.host.type_checkboxes = {}
+        self.host._review_type_checkbox_slots = {}
         self.host._review_type_depths = {}
         self.host._ordered_review_type_keys = []
         review_registry = get_review_registry()
 
-        saved_types = config.get("gui", "review_types", "").strip()
+        saved_types = self._gui_settings.get("review_types", "").strip()
         selected_types = set(self.host._parse_review_type_selection(saved_types))
         pinned_types, pinned_preset = self.host._load_pinned_review_selection()
         self.host._pinned_review_types = list(pinned_types)
@@ -437,8 +462,6 @@ class ReviewTabBuilder:
         self.host.review_type_controls_frame = sel_frame
 
         selection_frame = ctk.CTkFrame(sel_frame, fg_color="transparent")
-        selection_frame.grid_columnconfigure(0, weight=0)
-        selection_frame.grid_columnconfigure(1, weight=0)
         self.host.review_type_selection_actions_frame = selection_frame
         ctk.CTkButton(
             selection_frame,
@@ -498,9 +521,8 @@ class ReviewTabBuilder:
             border_color=self.host._SECTION_BORDER,
         )
         be_frame.grid(row=row, column=0, sticky="ew", padx=6, pady=3)
-        be_frame.grid_columnconfigure(2, weight=1)
-        be_frame.grid_columnconfigure(3, weight=1)
-        InfoTooltip.add(be_frame, t("gui.tip.backend_select"), row=0, column=0)
+        be_frame.grid_columnconfigure((2, 3), weight=1)
+        InfoTooltip.lazy_add(be_frame, t("gui.tip.backend_select"), row=0, column=0)
         ctk.CTkLabel(be_frame, text=t("gui.review.backend_label")).grid(row=0, column=1, padx=(0, 4))
         self.host.backend_var = ctk.StringVar(value=config.get("backend", "type", "bedrock"))
         self.host.backend_var.trace_add("write", self.host._on_backend_changed)
@@ -542,35 +564,29 @@ class ReviewTabBuilder:
             border_color=self.host._SECTION_BORDER,
         )
         meta_frame.grid(row=row, column=0, sticky="ew", padx=6, pady=3)
-        meta_frame.grid_columnconfigure(2, weight=1)
-        meta_frame.grid_columnconfigure(5, weight=1)
+        meta_frame.grid_columnconfigure((2, 5), weight=1)
 
-        InfoTooltip.add(meta_frame, t("gui.tip.programmers"), row=0, column=0)
+        InfoTooltip.lazy_add(meta_frame, t("gui.tip.programmers"), row=0, column=0)
         ctk.CTkLabel(meta_frame, text=t("gui.review.programmers")).grid(row=0, column=1, padx=(0, 4))
-        saved_programmers = config.get("gui", "programmers", "").strip()
+        saved_programmers = self._gui_settings.get("programmers", "").strip()
         self.host.programmers_entry = ctk.CTkEntry(meta_frame, placeholder_text=t("gui.review.programmers_ph"))
         if saved_programmers:
             self.host.programmers_entry.insert(0, saved_programmers)
         self.host.programmers_entry.grid(row=0, column=2, sticky="ew", padx=4)
 
-        InfoTooltip.add(meta_frame, t("gui.tip.reviewers"), row=0, column=3)
+        InfoTooltip.lazy_add(meta_frame, t("gui.tip.reviewers"), row=0, column=3)
         ctk.CTkLabel(meta_frame, text=t("gui.review.reviewers")).grid(row=0, column=4, padx=(0, 4))
-        saved_reviewers = config.get("gui", "reviewers", "").strip()
+        saved_reviewers = self._gui_settings.get("reviewers", "").strip()
         self.host.reviewers_entry = ctk.CTkEntry(meta_frame, placeholder_text=t("gui.review.reviewers_ph"))
         if saved_reviewers:
             self.host.reviewers_entry.insert(0, saved_reviewers)
         self.host.reviewers_entry.grid(row=0, column=5, sticky="ew", padx=4)
 
-        InfoTooltip.add(meta_frame, t("gui.tip.language"), row=1, column=0)
+        InfoTooltip.lazy_add(meta_frame, t("gui.tip.language"), row=1, column=0)
         ctk.CTkLabel(meta_frame, text=t("gui.review.language")).grid(row=1, column=1, padx=(0, 4), pady=(3, 0))
-        saved_review_lang = config.get("gui", "review_language", "").strip() or "system"
-        self.host._review_lang_labels = {
-            "system": t("gui.review.lang_system"),
-            "en": t("gui.review.lang_en"),
-            "ja": t("gui.review.lang_ja"),
-        }
-        self.host._review_lang_reverse = {value: key for key, value in self.host._review_lang_labels.items()}
-        lang_display = self.host._review_lang_labels.get(saved_review_lang, t("gui.review.lang_system"))
+        saved_review_lang = self._gui_settings.get("review_language", "").strip() or "system"
+        self.host._review_lang_labels, self.host._review_lang_reverse = _review_language_label_maps(get_locale())
+        lang_display = self.host._review_lang_labels.get(saved_review_lang, self.host._review_lang_labels["system"])
         self.host.lang_var = ctk.StringVar(value=lang_display)
         ctk.CTkOptionMenu(
             meta_frame,
@@ -579,9 +595,9 @@ class ReviewTabBuilder:
             width=160,
         ).grid(row=1, column=2, sticky="w", padx=4, pady=(3, 0))
 
-        InfoTooltip.add(meta_frame, t("gui.tip.spec_file"), row=1, column=3)
+        InfoTooltip.lazy_add(meta_frame, t("gui.tip.spec_file"), row=1, column=3)
         ctk.CTkLabel(meta_frame, text=t("gui.review.spec_file")).grid(row=1, column=4, padx=(0, 4), pady=(3, 0))
-        saved_spec = config.get("gui", "spec_file", "").strip()
+        saved_spec = self._gui_settings.get("spec_file", "").strip()
         self.host.spec_entry = ctk.CTkEntry(meta_frame, placeholder_text=t("gui.review.spec_placeholder"))
         if saved_spec:
             self.host.spec_entry.insert(0, saved_spec)
@@ -606,7 +622,7 @@ class ReviewTabBuilder:
         arch_frame.grid(row=run_row, column=0, sticky="ew", padx=6, pady=(2, 2))
         saved_arch = config.get("processing", "enable_architectural_review", "false")
         self.host.arch_analysis_var = ctk.BooleanVar(value=str(saved_arch).lower() in ("true", "1", "yes"))
-        InfoTooltip.add(arch_frame, t("gui.tip.arch_analysis"), row=0, column=0)
+        InfoTooltip.lazy_add(arch_frame, t("gui.tip.arch_analysis"), row=0, column=0)
         ctk.CTkCheckBox(
             arch_frame,
             text=t("gui.review.arch_analysis"),
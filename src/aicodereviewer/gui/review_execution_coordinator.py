@@ -7,6 +7,8 @@ review state itself.
 
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, Callable
 
@@ -14,6 +16,15 @@ from aicodereviewer.execution import CallbackEventSink, ExecutionEvent, JobProgr
 
 from .review_runtime import ActiveReviewController
 
+_PROGRESS_PUBLISH_INTERVAL_SECS = 1.0 / 30
+
+
+def _start_daemon_timer(delay: float, callback: Callable[[], None]) -> None:
+    """Run *callback* on a daemon timer thread after *delay* seconds."""
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+
 
 @dataclass
 class ReviewExecutionCoordinator:
@@ -45,14 +56,56 @@ class ReviewExecutionCoordinator:
     def build_event_sink(
         self,
         publish_progress: Callable[[float, str], None],
+        *,
+        min_interval: float = _PROGRESS_PUBLISH_INTERVAL_SECS,
+        clock: Callable[[], float] = time.monotonic,
+        schedule: Callable[[float, Callable[[], None]], Any] = _start_daemon_timer,
     ) -> CallbackEventSink:
-        """Return an event sink that publishes controller-owned progress state."""
+        """Return an event sink that publishes controller-owned progress state.
+
+        Every event updates the controller snapshot, but intermediate updates
+        for the same message are only published every *min_interval* seconds.
+        The first update, message changes, and the final ``current == total``
+        update are always published. When an update is held back, *schedule*
+        arranges a trailing publish of the latest snapshot once the interval
+        has passed, unless a newer publish happens first or the run finished.
+        """
+        controller = self.controller
+        record_progress_event = controller.record_progress_event
+        last_published: list[Any] = [None, None]
+        trailing_pending = [False]
+        lock = threading.Lock()
+
+        def _publish_trailing() -> None:
+            with lock:
+                # A finished run's UI already shows its outcome.
+                if not trailing_pending[0] or not controller.running:
+                    return
+                trailing_pending[0] = False
+                last_published[0] = clock()
+            publish_progress(controller.progress_fraction, controller.progress_status_text)
 
         def _handle(event: ExecutionEvent) -> None:
             if not isinstance(event, JobProgressUpdated):
                 return
-            self.controller.record_progress_event(event)
-            publish_progress(self.controller.progress_fraction, self.controller.progress_status_text)
+            record_progress_event(event)
+            now = clock()
+            with lock:
+                last_at, last_message = last_published
+                if (
+                    last_at is not None
+                    and event.message == last_message
+                    and event.current < event.total
+                    and now - last_at < min_interval
+                ):
+                    if not trailing_pending[0]:
+                        trailing_pending[0] = True
+                        schedule(min_interval - (now - last_at), _publish_trailing)
+                    return
+                trailing_pending[0] = False
+                last_published[0] = now
+                last_published[1] = event.message
+            publish_progress(controller.progress_fraction, controller.progress_status_text)
 
         return CallbackEventSink(_handle)
 
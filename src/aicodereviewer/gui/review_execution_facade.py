@@ -7,18 +7,176 @@ construction for one review run.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 from .review_execution_coordinator import ReviewExecutionCoordinator, ReviewExecutionOutcome
 
+logger = logging.getLogger(__name__)
+
+# Diffs at least this many characters are parsed in a helper process so the
+# pure-Python parse does not hold the GIL the Tk main loop needs.
+_DIFF_PARSE_PROCESS_THRESHOLD = 8 * 1024 * 1024
+
+# Diffs larger than this many characters are not kept between runs, so the
+# facade never pins more than one moderately sized diff and its parse.
+_DIFF_CACHE_MAX_CHARS = 32 * 1024 * 1024
+
+# Diff filenames use '/'; only hosts with another separator need translating.
+_TO_POSIX_SEPARATORS = str.maketrans(os.sep, "/") if os.sep != "/" else None
+
+
+def _path_key(file_path: Any) -> str:
+    """Return the absolute, case-normalized form of *file_path* for set lookups."""
+    return os.path.normcase(os.path.abspath(os.fspath(file_path)))
+
+
+def _resolved_path_key(file_path: Any) -> str:
+    """Return :func:`_path_key` with symlinks resolved."""
+    return os.path.normcase(os.path.realpath(os.fspath(file_path)))
+
+
+def _intersect_diff_with_files(
+    files_by_name: dict[str, Any],
+    diff_by_name: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Return the diff-filter entries for the scanned files that appear in the diff."""
+    # Walk whichever side is smaller and probe the other; a pull request's
+    # diff is usually far smaller than the project. filter() runs the probe
+    # loop in C while keeping the walked side's order, which a set
+    # intersection of the key views would not.
+    if len(diff_by_name) < len(files_by_name):
+        matched_names = filter(files_by_name.__contains__, diff_by_name)
+    else:
+        matched_names = filter(diff_by_name.__contains__, files_by_name)
+    # Entries stay plain dicts: the reviewer's FileInfo contract tells diff
+    # entries apart from scanned paths with isinstance(..., dict).
+    return [
+        {"path": _as_path(files_by_name[name]), "content": _diff_content(diff_by_name, name), "filename": name}
+        for name in matched_names
+    ]
+
+
+def _as_path(file_path: Any) -> Path:
+    """Return *file_path* as a :class:`Path`, reusing scanner-built paths."""
+    return file_path if isinstance(file_path, Path) else Path(file_path)
+
+
+def _files_by_relative_name(all_files: list[Any], directory: Optional[str]) -> dict[str, Any]:
+    """Map each scanned file's '/'-separated path relative to *directory* to the file."""
+    # Scanned paths are joined onto the run directory, so a string prefix
+    # check finds the relative path without building a Path per file.
+    prefix = os.path.join(os.fspath(directory), "") if directory else ""
+    absolute_prefix = os.path.normcase(os.path.join(os.path.abspath(directory), "")) if directory else ""
+    files_by_name: dict[str, Any] = {}
+    for file_path in all_files:
+        path_text = os.fspath(file_path)
+        if prefix and path_text.startswith(prefix):
+            relative_path = path_text[len(prefix):]
+        else:
+            relative_path = _relative_path_text(path_text, absolute_prefix)
+        if _TO_POSIX_SEPARATORS is not None:
+            relative_path = relative_path.translate(_TO_POSIX_SEPARATORS)
+        files_by_name.setdefault(relative_path, file_path)
+    return files_by_name
+
+
+def _relative_path_text(path_text: str, absolute_prefix: str) -> str:
+    """Return *path_text* relative to the directory behind *absolute_prefix* when inside it.
+
+    *absolute_prefix* is the case-normalized absolute directory with a
+    trailing separator, or empty when there is no run directory.
+    """
+    if absolute_prefix:
+        absolute_path = os.path.abspath(path_text)
+        # normcase keeps the length, so the slice applies to the original text.
+        if os.path.normcase(absolute_path).startswith(absolute_prefix):
+            return absolute_path[len(absolute_prefix):]
+    return os.path.normpath(path_text)
+
+
+def _diff_content(diff_by_name: dict[str, Any], name: str) -> str:
+    """Return the content text for *name*, joining its kept lines if needed.
+
+    Joined text replaces the line list in *diff_by_name*, so a re-run on
+    the cached parse hands out the same string instead of joining again.
+    """
+    entry = diff_by_name[name]
+    if isinstance(entry, str):
+        return entry
+    content = "\n".join(entry)
+    diff_by_name[name] = content
+    return content
+
+
+class _PrefetchedScan:
+    """Scan function that serves one result scanned ahead on a helper thread."""
+
+    def __init__(self, scan_fn: Callable[..., list[Any]], args: tuple[Any, ...]) -> None:
+        self._scan_fn = scan_fn
+        self._args = args
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="review-scan")
+        self._future: Optional[Future[list[Any]]] = executor.submit(scan_fn, *args)
+        executor.shutdown(wait=False)
+
+    def __call__(self, *call_args: Any) -> list[Any]:
+        future = self._future
+        if future is not None and call_args == self._args:
+            self._future = None
+            return future.result()
+        return self._scan_fn(*call_args)
+
+    def discard(self) -> None:
+        """Drop the prefetched result, logging the scan's failure if it had one."""
+        future, self._future = self._future, None
+        if future is not None and not future.cancel():
+            future.add_done_callback(_log_discarded_scan)
+
+
+def _log_discarded_scan(future: Future[list[Any]]) -> None:
+    """Log the exception of a prefetched scan nobody will wait for."""
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Discarded project scan failed", exc_info=exc)
+
 
 @dataclass
 class ReviewExecutionFacade:
     """Coordinate one GUI review run above the execution coordinator."""
 
     coordinator: ReviewExecutionCoordinator
+    _selected_keys_cache: dict[tuple[str, ...], frozenset[str]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _commit_diff_cache: Optional[tuple[tuple[str, str, str], str]] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _parsed_diff_cache: Optional[tuple[bytes, Callable[[str], Any], dict[str, Any]]] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _diff_parse_pool: Optional[ProcessPoolExecutor] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _diff_parse_pool_lock: threading.Lock = field(
+        default_factory=threading.Lock,
+        init=False,
+        repr=False,
+    )
 
     def build_event_sink(
         self,
@@ -37,9 +195,20 @@ class ReviewExecutionFacade:
         scan_project_with_scope_fn: Callable[..., list[Any]],
         get_diff_from_commits_fn: Callable[[str, str], Optional[str]],
         parse_diff_file_fn: Callable[[str], list[dict[str, Any]]],
+        resolve_commit_range_fn: Optional[Callable[[str, str], Optional[str]]] = None,
+        parse_diff_lines_fn: Optional[Callable[[str], dict[str, list[str]]]] = None,
     ) -> Callable[..., list[Any]]:
-        """Build the scan function used by one review execution."""
+        """Build the scan function used by one review execution.
+
+        When *parse_diff_lines_fn* is given the diff filter uses it instead of
+        *parse_diff_file_fn* and only joins the content of matching files.
+        """
         has_diff_filter = bool(diff_filter_file or diff_filter_commits)
+        if not has_diff_filter:
+            # The diff caches only help a repeated diff-filtered run.
+            self.release_diff_caches()
+        selected_keys = self._selected_path_keys(selected_files or [])
+        resolved_selected_keys: Optional[frozenset[str]] = None
 
         def _scan_fn(
             run_directory: Optional[str],
@@ -47,13 +216,24 @@ class ReviewExecutionFacade:
             diff_file: Optional[str] = None,
             commits: Optional[str] = None,
         ) -> list[Any]:
+            nonlocal resolved_selected_keys
             if scope == "diff":
                 return scan_project_with_scope_fn(run_directory, scope, diff_file, commits)
 
             all_files: list[Any] = scan_project_with_scope_fn(run_directory, "project")
             if selected_files:
-                selected_set = {Path(file_path).resolve() for file_path in selected_files}
-                all_files = [file_path for file_path in all_files if Path(file_path).resolve() in selected_set]
+                scanned_files = all_files
+                all_files = [file_path for file_path in scanned_files if _path_key(file_path) in selected_keys]
+                if len(all_files) < len(selected_keys):
+                    # Some selections did not match lexically (symlinked
+                    # project root, deleted files); fall back to resolving.
+                    if resolved_selected_keys is None:
+                        resolved_selected_keys = frozenset(_resolved_path_key(key) for key in selected_keys)
+                    all_files = [
+                        file_path
+                        for file_path in scanned_files
+                        if _resolved_path_key(file_path) in resolved_selected_keys
+                    ]
 
             if not has_diff_filter:
                 return all_files
@@ -63,36 +243,153 @@ class ReviewExecutionFacade:
                 with open(diff_filter_file, "r", encoding="utf-8") as handle:
                     diff_content = handle.read()
             elif diff_filter_commits and directory:
-                diff_content = get_diff_from_commits_fn(directory, diff_filter_commits)
+                diff_content = self._commit_diff(
+                    directory,
+                    diff_filter_commits,
+                    get_diff_from_commits_fn,
+                    resolve_commit_range_fn,
+                )
 
-            if not diff_content:
+            if not diff_content or diff_content.isspace():
                 return []
 
-            diff_entries = parse_diff_file_fn(diff_content)
-            diff_by_name = {entry["filename"]: entry["content"] for entry in diff_entries}
-            intersected: list[Any] = []
-            for file_path in all_files:
-                resolved_path = Path(file_path)
-                if run_directory:
-                    try:
-                        relative_path = str(resolved_path.relative_to(run_directory))
-                    except ValueError:
-                        relative_path = str(resolved_path)
-                else:
-                    relative_path = str(resolved_path)
-                normalized_path = relative_path.replace("\\", "/")
-                if normalized_path in diff_by_name:
-                    intersected.append(
-                        {
-                            "path": resolved_path,
-                            "content": diff_by_name[normalized_path],
-                            "filename": normalized_path,
-                        }
-                    )
-            return intersected
+            diff_by_name = self._parsed_diff(diff_content, parse_diff_file_fn, parse_diff_lines_fn)
+            files_by_name = _files_by_relative_name(all_files, run_directory)
+            return _intersect_diff_with_files(files_by_name, diff_by_name)
 
         return _scan_fn
 
+    def release_diff_caches(self) -> None:
+        """Drop the diff text and parsed diff kept between runs."""
+        self._commit_diff_cache = None
+        self._parsed_diff_cache = None
+
+    def _selected_path_keys(self, selected_files: list[str]) -> frozenset[str]:
+        """Return lookup keys for *selected_files*, reusing the last selection's keys."""
+        cache_key = tuple(selected_files)
+        keys = self._selected_keys_cache.get(cache_key)
+        if keys is None:
+            keys = frozenset(_path_key(file_path) for file_path in selected_files)
+            # A new selection replaces the cached one rather than piling up.
+            self._selected_keys_cache = {cache_key: keys}
+        return keys
+
+    def _commit_diff(
+        self,
+        directory: str,
+        commits: str,
+        get_diff_from_commits_fn: Callable[[str, str], Optional[str]],
+        resolve_commit_range_fn: Optional[Callable[[str, str], Optional[str]]],
+    ) -> Optional[str]:
+        """Return the diff for *commits*, reusing the last one while the range is unchanged."""
+        resolved = resolve_commit_range_fn(directory, commits) if resolve_commit_range_fn else None
+        if resolved is None:
+            return get_diff_from_commits_fn(directory, commits)
+
+        cache_key = (os.path.realpath(directory), commits, resolved)
+        cached = self._commit_diff_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        diff_content = get_diff_from_commits_fn(directory, commits)
+        # Diffs can be large, so only the most recent one is kept, and only
+        # when it is under the retention cap.
+        if diff_content is not None and len(diff_content) <= _DIFF_CACHE_MAX_CHARS:
+            self._commit_diff_cache = (cache_key, diff_content)
+        else:
+            self._commit_diff_cache = None
+        return diff_content
+
+    def _parsed_diff(
+        self,
+        diff_content: str,
+        parse_diff_file_fn: Callable[[str], list[dict[str, Any]]],
+        parse_diff_lines_fn: Optional[Callable[[str], dict[str, list[str]]]],
+    ) -> dict[str, Any]:
+        """Return the diff filter's filename map, reusing it for identical diff text."""
+        parser: Callable[[str], Any] = parse_diff_lines_fn or parse_diff_file_fn
+        digest = hashlib.blake2b(diff_content.encode("utf-8"), digest_size=16).digest()
+        cached = self._parsed_diff_cache
+        if cached is not None and cached[0] == digest and cached[1] is parser:
+            return cached[2]
+
+        diff_by_name: dict[str, Any]
+        if parse_diff_lines_fn is not None:
+            if len(diff_content) >= _DIFF_PARSE_PROCESS_THRESHOLD:
+                diff_by_name = self._parse_diff_in_process(parse_diff_lines_fn, diff_content)
+            else:
+                diff_by_name = parse_diff_lines_fn(diff_content)
+        else:
+            diff_by_name = {entry["filename"]: entry["content"] for entry in parse_diff_file_fn(diff_content)}
+        if len(diff_content) <= _DIFF_CACHE_MAX_CHARS:
+            self._parsed_diff_cache = (digest, parser, diff_by_name)
+        else:
+            self._parsed_diff_cache = None
+        return diff_by_name
+
+    def _parse_diff_in_process(
+        self,
+        parse_diff_lines_fn: Callable[[str], dict[str, list[str]]],
+        diff_content: str,
+    ) -> dict[str, list[str]]:
+        """Run *parse_diff_lines_fn* in the shared helper process, or inline if that fails."""
+        pool: Optional[ProcessPoolExecutor] = None
+        try:
+            with self._diff_parse_pool_lock:
+                pool = self._diff_parse_pool
+                if pool is None:
+                    # Spawn rather than fork: the GUI process runs Tk and worker threads.
+                    pool = self._diff_parse_pool = ProcessPoolExecutor(
+                        max_workers=1,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+            return pool.submit(parse_diff_lines_fn, diff_content).result()
+        except Exception as exc:
+            logger.warning("Parsing the diff in a helper process failed; parsing inline: %s", exc)
+            with self._diff_parse_pool_lock:
+                if self._diff_parse_pool is not pool:
+                    pool = None
+                else:
+                    self._diff_parse_pool = None
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+            return parse_diff_lines_fn(diff_content)
+
+    def shutdown(self) -> None:
+        """Stop the diff-parse helper process, if one was started, and drop the diff caches."""
+        self.release_diff_caches()
+        with self._diff_parse_pool_lock:
+            pool, self._diff_parse_pool = self._diff_parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def prefetch_scan(
+        self,
+        scan_fn: Callable[..., list[Any]],
+        *args: Any,
+    ) -> _PrefetchedScan:
+        """Start ``scan_fn(*args)`` on a helper thread and wrap *scan_fn*.
+
+        The first call to the returned function with the same arguments
+        waits for and returns the prefetched result, so backend activation
+        can overlap the project scan. Any other call scans as usual. Call
+        ``discard()`` on it when the run ends before scanning.
+        """
+        return _PrefetchedScan(scan_fn, args)
+
+    def activate_client(
+        self,
+        prefetched_scan: _PrefetchedScan,
+        backend_name: str,
+        create_client: Callable[[str], Any],
+        publish_status: Callable[[str], None],
+    ) -> Any:
+        """Activate the backend client, discarding *prefetched_scan* if that fails."""
+        try:
+            return self.coordinator.activate_client(backend_name, create_client, publish_status)
+        except Exception:
+            prefetched_scan.discard()
+            raise
+
     def execute_run(
         self,
         *,
@@ -106,6 +403,8 @@ class ReviewExecutionFacade:
         scan_project_with_scope_fn: Callable[..., list[Any]],
         get_diff_from_commits_fn: Callable[[str, str], Optional[str]],
         parse_diff_file_fn: Callable[[str], list[dict[str, Any]]],
+        resolve_commit_range_fn: Optional[Callable[[str, str], Optional[str]]] = None,
+        parse_diff_lines_fn: Optional[Callable[[str], dict[str, list[str]]]] = None,
     ) -> ReviewExecutionOutcome:
         """Execute one review run and return its classified outcome."""
         run_params = dict(params)
@@ -114,10 +413,6 @@ class ReviewExecutionFacade:
         diff_filter_file: Optional[str] = run_params.pop("diff_filter_file", None)
         diff_filter_commits: Optional[str] = run_params.pop("diff_filter_commits", None)
 
-        client = None
-        if not dry_run:
-            client = self.coordinator.activate_client(backend_name, create_client, publish_status)
-
         scan_fn = self.build_scan_function(
             directory=run_params.get("path"),
             selected_files=selected_files,
@@ -126,8 +421,25 @@ class ReviewExecutionFacade:
             scan_project_with_scope_fn=scan_project_with_scope_fn,
             get_diff_from_commits_fn=get_diff_from_commits_fn,
             parse_diff_file_fn=parse_diff_file_fn,
+            resolve_commit_range_fn=resolve_commit_range_fn,
+            parse_diff_lines_fn=parse_diff_lines_fn,
         )
 
+        client = None
+        if not dry_run:
+            prefetched_scan = self.prefetch_scan(
+                scan_fn,
+                run_params.get("path"),
+                run_params.get("scope"),
+                run_params.get("diff_file"),
+                run_params.get("commits"),
+            )
+            scan_fn = prefetched_scan
+            client = self.activate_client(prefetched_scan, backend_name, create_client, publish_status)
+            if cancel_check():
+                prefetched_scan.discard()
+                return ReviewExecutionOutcome(kind="cancelled")
+
         runner = create_runner(client, scan_fn=scan_fn, backend_name=backend_name)
         result = runner.run(
             **run_params,
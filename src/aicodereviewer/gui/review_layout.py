@@ -129,19 +129,15 @@ class ReviewLayoutHelper:
             body.grid_columnconfigure(1, weight=0, minsize=0)
             body.grid_columnconfigure(2, weight=3, minsize=320)
             body.grid_rowconfigure(0, weight=1)
-            body.grid_rowconfigure(1, weight=0)
-            body.grid_rowconfigure(2, weight=0)
+            body.grid_rowconfigure((1, 2), weight=0)
             setup_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 12), pady=0)
             divider.configure(width=2, height=0)
             divider.grid(row=0, column=1, sticky="ns", padx=0, pady=4)
             run_panel.grid(row=0, column=2, sticky="nsew", padx=(12, 0), pady=0)
         else:
             body.grid_columnconfigure(0, weight=1, minsize=0)
-            body.grid_columnconfigure(1, weight=0, minsize=0)
-            body.grid_columnconfigure(2, weight=0, minsize=0)
-            body.grid_rowconfigure(0, weight=0)
-            body.grid_rowconfigure(1, weight=0)
-            body.grid_rowconfigure(2, weight=0)
+            body.grid_columnconfigure((1, 2), weight=0, minsize=0)
+            body.grid_rowconfigure((0, 1, 2), weight=0)
             setup_panel.grid(row=0, column=0, columnspan=3, sticky="ew", padx=0, pady=0)
             divider.configure(width=0, height=2)
             divider.grid(row=1, column=0, columnspan=3, sticky="ew", padx=6, pady=(10, 10))
@@ -203,7 +199,8 @@ class ReviewLayoutHelper:
     def _update_type_checkbox_widths(self, state: ReviewTypeLayoutState) -> None:
         for checkbox in getattr(self.host, "type_checkboxes", {}).values():
             try:
-                checkbox.configure(width=state.checkbox_width)
+                if checkbox.cget("width") != state.checkbox_width:
+                    checkbox.configure(width=state.checkbox_width)
             except Exception:
                 continue
 
@@ -226,22 +223,28 @@ class ReviewLayoutHelper:
             )
             state = self.build_type_state(logical_width, len(ordered_keys))
 
-        for column in range(3):
-            types_frame.grid_columnconfigure(column, weight=0, minsize=0)
-        for column in range(state.checkbox_columns):
-            types_frame.grid_columnconfigure(column, weight=1, minsize=0)
-
-        for checkbox in getattr(self.host, "type_checkboxes", {}).values():
-            checkbox.grid_forget()
+        # Tk accepts a list of column indices, so each weight is one call.
+        types_frame.grid_columnconfigure(tuple(range(state.checkbox_columns)), weight=1, minsize=0)
+        if state.checkbox_columns < 3:
+            types_frame.grid_columnconfigure(tuple(range(state.checkbox_columns, 3)), weight=0, minsize=0)
 
+        # Re-grid only the checkboxes whose slot moved; grid() on a managed
+        # widget updates it in place, so no grid_forget() pass is needed.
         review_type_depths = getattr(self.host, "_review_type_depths", {})
         type_checkboxes = getattr(self.host, "type_checkboxes", {})
+        previous_slots = getattr(self.host, "_review_type_checkbox_slots", {})
+        slots: dict[str, tuple[int, int, int]] = {}
         for index, key in enumerate(ordered_keys):
             checkbox = type_checkboxes[key]
             depth = int(review_type_depths.get(key, 0))
             column = index // state.checkbox_rows_per_column
             row = index % state.checkbox_rows_per_column
-            checkbox.configure(width=state.checkbox_width)
+            if checkbox.cget("width") != state.checkbox_width:
+                checkbox.configure(width=state.checkbox_width)
+            slot = (row, column, depth)
+            slots[key] = slot
+            if previous_slots.get(key) == slot:
+                continue
             checkbox.grid(
                 row=row,
                 column=column,
@@ -249,6 +252,7 @@ class ReviewLayoutHelper:
                 padx=(8 + depth * 18, 12),
                 pady=2,
             )
+        self.host._review_type_checkbox_slots = slots
 
     def refresh_type_controls_layout(self, state: ReviewTypeLayoutState | None = None) -> None:
         container = getattr(self.host, "review_type_controls_frame", None)
@@ -277,29 +281,27 @@ class ReviewLayoutHelper:
         for child in (selection_frame, preset_frame, pin_frame):
             child.grid_forget()
 
-        for column in range(3):
-            container.grid_columnconfigure(column, weight=0, minsize=0)
-
         if state.controls_mode == "inline":
+            container.grid_columnconfigure((0, 2), weight=0, minsize=0)
             container.grid_columnconfigure(1, weight=1, minsize=0)
             selection_frame.grid(row=0, column=0, sticky="w", padx=(0, 12), pady=2)
             preset_frame.grid(row=0, column=1, sticky="ew", padx=(0, 12), pady=2)
             pin_frame.grid(row=0, column=2, sticky="e", pady=2)
         elif state.controls_mode == "two_row":
             container.grid_columnconfigure(0, weight=1, minsize=0)
-            container.grid_columnconfigure(1, weight=0, minsize=0)
+            container.grid_columnconfigure((1, 2), weight=0, minsize=0)
             selection_frame.grid(row=0, column=0, sticky="w", padx=(0, 12), pady=2)
             pin_frame.grid(row=0, column=1, sticky="e", pady=2)
             preset_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(6, 2))
         else:
             container.grid_columnconfigure(0, weight=1, minsize=0)
+            container.grid_columnconfigure((1, 2), weight=0, minsize=0)
             selection_frame.grid(row=0, column=0, sticky="w", pady=2)
             preset_frame.grid(row=1, column=0, sticky="ew", pady=(6, 2))
             pin_frame.grid(row=2, column=0, sticky="w", pady=(6, 2))
 
-        preset_frame.grid_columnconfigure(0, weight=0, minsize=0)
+        preset_frame.grid_columnconfigure((0, 2), weight=0, minsize=0)
         preset_frame.grid_columnconfigure(1, weight=1, minsize=0)
-        preset_frame.grid_columnconfigure(2, weight=0, minsize=0)
         self.host.review_preset_label.grid_forget()
         self.host.review_preset_menu.grid_forget()
         self.host.recommend_btn.grid_forget()
@@ -7,13 +7,17 @@ tickers.
 """
 from __future__ import annotations
 
+import functools
 import inspect
+import io
 import logging
+import re
 import threading
 import time
+import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, cast
 
 import customtkinter as ctk  # type: ignore[import-untyped]
 
@@ -39,7 +43,9 @@ from aicodereviewer.review_presets import (
 from aicodereviewer.scanner import (
     scan_project_with_scope,
     parse_diff_file,
+    parse_diff_file_lines,
     get_diff_from_commits,
+    resolve_commit_range,
 )
 
 from .dialogs import FileSelector
@@ -71,6 +77,9 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["ReviewTabMixin"]
 
+# Splits a stripped comma-separated name list and trims each name in one pass.
+_NAME_LIST_SPLIT = re.compile(r"\s*,\s*")
+
 
 class ReviewTabMixin:
     """Mixin supplying Review-tab construction and review execution."""
@@ -85,6 +94,8 @@ class ReviewTabMixin:
     _REVIEW_TYPE_ACTIONS_INLINE_MIN_WIDTH = 1180
     _REVIEW_TYPE_ACTIONS_TWO_ROW_MIN_WIDTH = 760
     _REVIEW_QUEUE_POLL_MS = 250
+    _CONFIG_FLUSH_DELAY_MS = 500
+    _MAX_SPEC_BYTES = 4 * 1024 * 1024
 
     def _review_logical_width(self, *candidates: Any) -> float:
         available_width = 0
@@ -647,16 +658,31 @@ class ReviewTabMixin:
     #  ACTIONS – file browsing, validation, review execution
     # ══════════════════════════════════════════════════════════════════════
 
+    def _open_native_dialog(self, kind: str, **kwargs: Any) -> str:
+        """Run one ``filedialog`` function parented to a throwaway Toplevel.
+
+        The hidden transient window is destroyed as soon as the dialog
+        returns so no native dialog state outlives the browse.
+        """
+        holder = tk.Toplevel(self)
+        holder.withdraw()
+        holder.transient(self)
+        try:
+            return getattr(filedialog, kind)(parent=holder, **kwargs) or ""
+        finally:
+            holder.destroy()
+
     def _browse_path(self):
         if self._testing_mode:
             return
-        d = filedialog.askdirectory()
+        d = self._open_native_dialog("askdirectory")
         if d:
             self.path_entry.delete(0, "end")
             self.path_entry.insert(0, d)
 
     def _browse_diff(self):
-        f = filedialog.askopenfilename(
+        f = self._open_native_dialog(
+            "askopenfilename",
             filetypes=[
                 (t("common.filetype_diff_patch"), "*.diff *.patch"),
                 (t("common.filetype_all"), "*.*"),
@@ -708,26 +734,45 @@ class ReviewTabMixin:
             summary = t("gui.review.preset_custom_summary")
         self.review_preset_summary_label.configure(text=summary)
 
+    def _ensure_review_diff_frame(self) -> Any:
+        if not hasattr(self, "diff_frame"):
+            ReviewTabBuilder(self).build_diff_frame(self._review_scope_frame)
+        return self.diff_frame
+
     def _on_scope_changed(self, *_args: object) -> None:
+        # Variable traces also fire for writes that keep the same value;
+        # only re-grid the scope frames when the scope actually changed.
         scope = self.scope_var.get()
+        if scope == getattr(self, "_applied_review_scope", None):
+            return
+        self._applied_review_scope = scope
         if scope == "project":
             self.file_select_frame.grid()
             self.diff_filter_frame.grid()
-            self.diff_frame.grid_remove()
+            if hasattr(self, "diff_frame"):
+                self.diff_frame.grid_remove()
         else:
             self.file_select_frame.grid_remove()
             self.diff_filter_frame.grid_remove()
-            self.diff_frame.grid()
+            if hasattr(self, "diff_frame"):
+                self.diff_frame.grid()
+            else:
+                # build_diff_frame() grids the new frame in its final cell.
+                self._ensure_review_diff_frame()
 
     def _on_diff_filter_changed(self, *_args: object) -> None:
         enabled = self.diff_filter_var.get()
+        if enabled == getattr(self, "_applied_diff_filter", None):
+            return
+        self._applied_diff_filter = enabled
         state = "normal" if enabled else "disabled"
         self.diff_filter_file_entry.configure(state=state)
         self.diff_filter_browse_btn.configure(state=state)
         self.diff_filter_commits_entry.configure(state=state)
 
     def _browse_diff_filter(self) -> None:
-        path = filedialog.askopenfilename(
+        path = self._open_native_dialog(
+            "askopenfilename",
             filetypes=[
                 (t("common.filetype_diff_patch"), "*.diff *.patch"),
                 (t("common.filetype_all"), "*.*"),
@@ -738,6 +783,9 @@ class ReviewTabMixin:
 
     def _on_file_select_mode_changed(self, *_args: object):
         mode = self.file_select_mode_var.get()
+        if mode == getattr(self, "_applied_file_select_mode", None):
+            return
+        self._applied_file_select_mode = mode
         if mode == "selected":
             self.select_files_btn.configure(state="normal")
         else:
@@ -757,96 +805,133 @@ class ReviewTabMixin:
         selector = FileSelector(self, path, self.selected_files)
         self.wait_window(selector)
         if hasattr(selector, 'result') and selector.result:
-            self.selected_files = list(selector.result)
+            selected_files = list(selector.result)
+            self._show_toast(t("gui.review.selected_file_count", count=len(selected_files)))
+            if selected_files == self.selected_files:
+                # Closing the selector without changes leaves nothing to save.
+                return
+            self.selected_files = selected_files
             self._file_count_lbl.configure(
                 text=self._selected_file_count_text(len(self.selected_files)))
-            self._show_toast(t("gui.review.selected_file_count", count=len(self.selected_files)))
             try:
                 config.set_value("gui", "selected_files",
                                  "|".join(self.selected_files))
-                config.save()
+                self._schedule_config_flush()
             except Exception as exc:
                 logger.warning("Could not save selected files: %s", exc)
 
+    def _schedule_config_flush(self) -> None:
+        """Persist pending form settings once the form has been quiet briefly.
+
+        Start, Dry Run and file selection each update the config; debouncing
+        the write turns their back-to-back saves into one disk write.
+        """
+        self._schedule_debounced(
+            "_config_flush_after_id",
+            0 if self._testing_mode else self._CONFIG_FLUSH_DELAY_MS,
+            self._flush_config,
+        )
+
+    def _flush_config(self) -> None:
+        self._config_flush_after_id = None
+        try:
+            config.save()
+        except Exception as exc:
+            logger.warning("Failed to save form values: %s", exc)
+
     def _get_selected_types(self) -> List[str]:
         return [k for k, v in self.type_vars.items() if v.get()]
 
-    def _save_form_values(self):
+    def _read_review_form_entries(self) -> Dict[str, str]:
+        """Return the stripped text of the entries shared by validation and saving.
+
+        Start and Dry Run read these once and hand the same values to
+        ``_validate_inputs`` and ``_save_form_values``.
+        """
+        return {
+            "project_path": self.path_entry.get().strip(),
+            "programmers": self.programmers_entry.get().strip(),
+            "reviewers": self.reviewers_entry.get().strip(),
+            "spec_file": self.spec_entry.get().strip(),
+        }
+
+    def _save_form_values(self, entries: Optional[Dict[str, str]] = None):
         try:
-            config.set_value("gui", "project_path", self.path_entry.get().strip())
-            config.set_value("gui", "programmers", self.programmers_entry.get().strip())
-            config.set_value("gui", "reviewers", self.reviewers_entry.get().strip())
-            config.set_value("gui", "spec_file", self.spec_entry.get().strip())
-            selected_types = self._get_selected_types()
-            config.set_value("gui", "review_types", ",".join(selected_types))
-            config.set_value("gui", "file_select_mode",
-                             self.file_select_mode_var.get())
-            config.set_value("gui", "selected_files",
-                             "|".join(self.selected_files))
+            entries = entries or self._read_review_form_entries()
+            config.update("gui", {
+                **entries,
+                "review_types": ",".join(self._get_selected_types()),
+                "file_select_mode": self.file_select_mode_var.get(),
+                "selected_files": "|".join(self.selected_files),
+            })
             config.set_value("processing", "enable_architectural_review",
                              str(self.arch_analysis_var.get()).lower())
-            config.save()
+            self._schedule_config_flush()
         except Exception as exc:
             logger.warning("Failed to save form values: %s", exc)
 
-    def _validate_inputs(self, dry_run: bool = False) -> Optional[Dict[str, Any]]:
+    def _validate_inputs(
+        self,
+        dry_run: bool = False,
+        entries: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Validate form and return a params dict, or None on failure."""
-        path = self.path_entry.get().strip()
+        entries = entries or self._read_review_form_entries()
+        path = entries["project_path"]
         scope = self.scope_var.get()
         diff_file: Optional[str] = None
         commits: Optional[str] = None
         diff_filter_file: Optional[str] = None
         diff_filter_commits: Optional[str] = None
-
-        if scope == "diff":
-            diff_file = self.diff_file_entry.get().strip() or None
-            commits = self.commits_entry.get().strip() or None
-        elif scope == "project" and self.diff_filter_var.get():
-            diff_filter_file = self.diff_filter_file_entry.get().strip() or None
-            diff_filter_commits = self.diff_filter_commits_entry.get().strip() or None
-
-        if scope == "project" and not path:
-            self._show_toast(t("gui.val.path_required"), error=True)
-            return None
-
         selected_files: Optional[List[str]] = None
+
+        # Each scope branch checks what is already in hand before reading
+        # further entries; the toast order matches the form's layout.
         if scope == "project":
-            file_mode = self.file_select_mode_var.get()
-            if file_mode == "selected":
+            if not path:
+                self._show_toast(t("gui.val.path_required"), error=True)
+                return None
+            if self.file_select_mode_var.get() == "selected":
                 if not self.selected_files:
                     self._show_toast(t("gui.review.select_files_required"), error=True)
                     return None
                 selected_files = self.selected_files
-
-        if scope == "project" and self.diff_filter_var.get():
-            if not diff_filter_file and not diff_filter_commits:
-                self._show_toast(t("gui.review.diff_filter_required"), error=True)
+            if self.diff_filter_var.get():
+                diff_filter_file = self.diff_filter_file_entry.get().strip() or None
+                diff_filter_commits = self.diff_filter_commits_entry.get().strip() or None
+                if not diff_filter_file and not diff_filter_commits:
+                    self._show_toast(t("gui.review.diff_filter_required"), error=True)
+                    return None
+        elif scope == "diff":
+            diff_file = self.diff_file_entry.get().strip() or None
+            commits = self.commits_entry.get().strip() or None
+            if not diff_file and not commits:
+                self._show_toast(t("gui.val.diff_required"), error=True)
                 return None
 
-        if scope == "diff" and not diff_file and not commits:
-            self._show_toast(t("gui.val.diff_required"), error=True)
-            return None
-
         review_types = self._get_selected_types()
         if not review_types:
             self._show_toast(t("gui.val.type_required"), error=True)
             return None
 
-        programmers = [n.strip() for n in self.programmers_entry.get().split(",") if n.strip()] if not dry_run else []
-        reviewers = [n.strip() for n in self.reviewers_entry.get().split(",") if n.strip()] if not dry_run else []
-
-        if not dry_run and (not programmers or not reviewers):
-            self._show_toast(t("gui.val.meta_required"), error=True)
-            return None
+        programmers: List[str] = []
+        reviewers: List[str] = []
+        if not dry_run:
+            programmers = [n for n in _NAME_LIST_SPLIT.split(entries["programmers"]) if n]
+            reviewers = [n for n in _NAME_LIST_SPLIT.split(entries["reviewers"]) if n]
+            if not programmers or not reviewers:
+                self._show_toast(t("gui.val.meta_required"), error=True)
+                return None
 
+        # Runtime validation needs the spec text at submission time; the read
+        # is capped at ``_MAX_SPEC_BYTES`` so it stays cheap on the UI thread.
         spec_content = None
-        spec_path = self.spec_entry.get().strip()
+        spec_path = entries["spec_file"]
         if "specification" in review_types and spec_path:
             try:
-                with open(spec_path, "r", encoding="utf-8") as fh:
-                    spec_content = fh.read()
-            except Exception as exc:
-                self._show_toast(t("gui.val.spec_read_error", error=exc), error=True)
+                spec_content = self._load_spec_content(spec_path)
+            except ValueError as exc:
+                self._show_toast(str(exc), error=True)
                 return None
 
         lang_display = self.lang_var.get()
@@ -855,10 +940,7 @@ class ReviewTabMixin:
             review_lang = self._ui_lang
         config.set_value("gui", "review_language",
                          self._review_lang_reverse.get(lang_display, "system"))
-        try:
-            config.save()
-        except Exception:
-            pass
+        self._schedule_config_flush()
 
         return dict(
             path=path or None,
@@ -876,6 +958,26 @@ class ReviewTabMixin:
             diff_filter_commits=diff_filter_commits,
         )
 
+    def _load_spec_content(self, spec_path: str) -> str:
+        """Read the specification file for a review, bounded by ``_MAX_SPEC_BYTES``.
+
+        Newlines are translated as a text-mode read would.
+        """
+        try:
+            with open(spec_path, "rb") as fh:
+                data = fh.read(self._MAX_SPEC_BYTES + 1)
+        except OSError as exc:
+            raise ValueError(t("gui.val.spec_read_error", error=exc)) from exc
+        if len(data) > self._MAX_SPEC_BYTES:
+            raise ValueError(
+                t("gui.val.spec_too_large", limit=self._MAX_SPEC_BYTES // (1024 * 1024))
+            )
+        try:
+            with io.TextIOWrapper(io.BytesIO(data), encoding="utf-8") as reader:
+                return reader.read()
+        except UnicodeDecodeError as exc:
+            raise ValueError(t("gui.val.spec_read_error", error=exc)) from exc
+
     def _start_review(self):
         if not self._can_submit_review():
             return
@@ -883,20 +985,22 @@ class ReviewTabMixin:
             self._show_toast(
                 t("gui.review.testing_mode_start"), error=False)
             return
-        params = self._validate_inputs()
+        entries = self._read_review_form_entries()
+        params = self._validate_inputs(entries=entries)
         if not params:
             return
-        self._save_form_values()
+        self._save_form_values(entries)
         self._run_review(params, dry_run=False)
 
     def _start_dry_run(self):
         if not self._can_submit_review():
             return
-        params = self._validate_inputs(dry_run=True)
+        entries = self._read_review_form_entries()
+        params = self._validate_inputs(dry_run=True, entries=entries)
         if not params:
             return
         if not self._testing_mode:
-            self._save_form_values()
+            self._save_form_values(entries)
         self._run_review(params, dry_run=True)
 
     def _set_action_buttons_state(self, state: str):
@@ -1023,9 +1127,9 @@ class ReviewTabMixin:
                 return
             logger.warning("Failed to generate review recommendation: %s", exc)
             if self._testing_mode:
-                self._handle_review_recommendation_failure(exc)
+                self._handle_review_recommendation_failure(str(exc))
             else:
-                self._dispatch_review_ui(self._handle_review_recommendation_failure, exc)
+                self._dispatch_review_ui(self._handle_review_recommendation_failure, str(exc))
         finally:
             if client is not None and hasattr(client, "close"):
                 try:
@@ -1040,10 +1144,10 @@ class ReviewTabMixin:
         self._show_toast(t("gui.review.recommendation_cancelled_short"), error=False)
         self._set_review_recommendation_running(False)
 
-    def _handle_review_recommendation_failure(self, exc: Exception) -> None:
+    def _handle_review_recommendation_failure(self, error_text: str) -> None:
         self._set_review_recommendation_running(False)
         self.review_recommendation_label.configure(
-            text=t("gui.review.recommendation_failed", error=exc)
+            text=t("gui.review.recommendation_failed", error=error_text)
         )
         self.status_var.set(t("gui.review.recommendation_failed_short"))
         self._show_toast(t("gui.review.recommendation_failed_short"), error=True)
@@ -1119,6 +1223,7 @@ class ReviewTabMixin:
     # ── Health-check countdown ticker ─────────────────────────────────────
 
     _HEALTH_TIMEOUT_SECS = 60
+    _HEALTH_COUNTDOWN_TEXTS = tuple(f"⏱ {remaining}s" for remaining in range(_HEALTH_TIMEOUT_SECS + 1))
 
     def _start_health_countdown(self) -> None:
         controller = self._health_check_controller()
@@ -1133,7 +1238,12 @@ class ReviewTabMixin:
         if controller.countdown_ends_at is None:
             return
         remaining = max(0, int(controller.countdown_ends_at - time.monotonic()))
-        self._health_countdown_lbl.configure(text=f"⏱ {remaining}s")
+        texts = self._HEALTH_COUNTDOWN_TEXTS
+        text = texts[remaining] if remaining < len(texts) else f"⏱ {remaining}s"
+        # Ticks can land twice in the same second; skip the redundant Tk call.
+        if text != getattr(self, "_health_countdown_text", None):
+            self._health_countdown_lbl.configure(text=text)
+            self._health_countdown_text = text
         if remaining > 0:
             schedule_after = getattr(self, "_schedule_app_after", self.after)
             controller.bind_countdown_after(schedule_after(1000, self._tick_health_countdown))
@@ -1146,6 +1256,7 @@ class ReviewTabMixin:
             self.after_cancel(controller.countdown_after_id)
         controller.clear_countdown()
         self._health_countdown_lbl.configure(text="")
+        self._health_countdown_text = ""
 
     # ── Elapsed-time ticker ────────────────────────────────────────────────
 
@@ -1156,6 +1267,7 @@ class ReviewTabMixin:
             controller.bind_elapsed_after(None)
         controller.start_elapsed(time.monotonic())
         self._elapsed_lbl.configure(text="0:00")
+        self._elapsed_text = "0:00"
         self._tick_elapsed()
 
     def _tick_elapsed(self) -> None:
@@ -1164,7 +1276,10 @@ class ReviewTabMixin:
             return
         elapsed = int(time.monotonic() - controller.elapsed_started_at)
         m, s = divmod(elapsed, 60)
-        self._elapsed_lbl.configure(text=f"{m}:{s:02d}")
+        text = f"{m}:{s:02d}"
+        if text != getattr(self, "_elapsed_text", None):
+            self._elapsed_lbl.configure(text=text)
+            self._elapsed_text = text
         schedule_after = getattr(self, "_schedule_app_after", self.after)
         controller.bind_elapsed_after(schedule_after(1000, self._tick_elapsed))
 
@@ -1174,28 +1289,52 @@ class ReviewTabMixin:
             self.after_cancel(controller.elapsed_after_id)
         controller.clear_elapsed()
         self._elapsed_lbl.configure(text="")
+        self._elapsed_text = ""
 
     def _make_gui_review_event_sink(self) -> CallbackEventSink:
         """Return a Tk-safe execution event sink for review progress."""
         facade = self._review_execution_facade_handle()
-        schedule_after = getattr(self, "_schedule_app_after", self.after)
-        return facade.build_event_sink(
-            lambda fraction, status_text: schedule_after(
-                0,
-                lambda f=fraction, s=status_text: (
-                    self.progress.set(f) if f > 0 else None,
-                    self.status_var.set(s),
-                ),
-            )
-        )
+        return facade.build_event_sink(self._bind_review_progress_publisher())
 
-    def _run_review(self, params: Dict[str, Any], dry_run: bool):
-        """Execute the review in a background thread."""
+    def _bind_review_progress_publisher(self) -> Callable[[float, str], None]:
+        """Return a progress publisher with its Tk hooks bound once per run."""
+        schedule_after = getattr(self, "_schedule_app_after", self.after)
+        apply_progress = self._apply_review_progress
+        partial = functools.partial
+
+        def _publish(fraction: float, status_text: str) -> None:
+            schedule_after(0, partial(apply_progress, fraction, status_text))
+
+        return _publish
+
+    def _apply_review_progress(self, fraction: float, status_text: str) -> None:
+        if fraction > 0:
+            self.progress.set(fraction)
+        self.status_var.set(status_text)
+
+    def _begin_review_run_ui(self) -> None:
+        """Reset the progress widgets once a review submission starts."""
+        self.progress.set(0)
+        self.status_var.set(t("common.running"))
+        self._start_elapsed_timer()
+        self._sync_review_run_controls()
+
+    def _finalize_review_run_ui(self, started: bool) -> None:
+        """Settle the progress widgets once a review submission finishes."""
+        if started:
+            self._stop_elapsed_timer()
+            self.progress.set(1.0)
+        self._sync_review_run_controls()
+
+    def _sync_review_run_controls(self) -> None:
+        self._sync_global_cancel_button()
         self._review_submission_queue.on_submission_sync_requested()
         self._sync_review_submission_controls()
-        started_submission_id: dict[str, str | None] = {"value": None}
 
-        request = ReviewRequest(
+    @staticmethod
+    def _build_review_request(params: Dict[str, Any], dry_run: bool) -> ReviewRequest:
+        """Build the runtime request for validated review form *params*."""
+        return ReviewRequest(
             path=params.get("path"),
             scope=str(params.get("scope") or "project"),
             diff_file=params.get("diff_file"),
@@ -1209,9 +1348,18 @@ class ReviewTabMixin:
             dry_run=dry_run,
         )
 
+    def _run_review(self, params: Dict[str, Any], dry_run: bool):
+        """Execute the review in a background thread."""
+        self._review_submission_queue.on_submission_sync_requested()
+        self._sync_review_submission_controls()
+        started_submission_id: dict[str, str | None] = {"value": None}
+
+        request = self._build_review_request(params, dry_run)
+
         def _execute_run(job: ReviewJob, cancel_event: threading.Event, event_sink: CallbackEventSink) -> Any:
             facade = self._review_execution_facade_handle()
             coordinator = self._review_execution_coordinator()
+            cancel_requested = cancel_event.is_set
             run_params = dict(params)
             backend_name = str(run_params.get("backend") or "bedrock")
             selected_files = cast(Optional[list[str]], run_params.get("selected_files"))
@@ -1220,10 +1368,6 @@ class ReviewTabMixin:
             schedule_after = getattr(self, "_schedule_app_after", self.after)
             publish_status = lambda status_text: schedule_after(0, lambda s=status_text: self.status_var.set(s))
 
-            client = None
-            if not dry_run:
-                client = coordinator.activate_client(backend_name, create_backend, publish_status)
-
             scan_fn = facade.build_scan_function(
                 directory=cast(Optional[str], run_params.get("path")),
                 selected_files=selected_files,
@@ -1232,7 +1376,30 @@ class ReviewTabMixin:
                 scan_project_with_scope_fn=scan_project_with_scope,
                 get_diff_from_commits_fn=get_diff_from_commits,
                 parse_diff_file_fn=parse_diff_file,
+                resolve_commit_range_fn=resolve_commit_range,
+                parse_diff_lines_fn=parse_diff_file_lines,
             )
+
+            client = None
+            if not dry_run:
+                # Scan the project while the backend is being set up.
+                prefetched_scan = facade.prefetch_scan(
+                    scan_fn,
+                    job.request.path,
+                    job.request.scope,
+                    job.request.diff_file,
+                    job.request.commits,
+                )
+                scan_fn = prefetched_scan
+                client = facade.activate_client(prefetched_scan, backend_name, create_backend, publish_status)
+                if cancel_requested():
+                    prefetched_scan.discard()
+                    return coordinator.classify_run_result(
+                        dry_run=dry_run,
+                        result=None,
+                        runner=None,
+                        cancel_requested=True,
+                    )
             runner = self._build_review_runner(
                 client,
                 scan_fn=scan_fn,
@@ -1243,7 +1410,7 @@ class ReviewTabMixin:
                     job,
                     client,
                     sink=event_sink,
-                    cancel_check=cancel_event.is_set,
+                    cancel_check=cancel_requested,
                 )
                 runner._set_execution_result(result, job=job)
                 if result.status == "issues_found":
@@ -1264,13 +1431,13 @@ class ReviewTabMixin:
                 dry_run=dry_run,
                 event_sink=event_sink,
                 interactive=False,
-                cancel_check=cancel_event.is_set,
+                cancel_check=cancel_requested,
             )
             return coordinator.classify_run_result(
                 dry_run=dry_run,
                 result=result,
                 runner=runner,
-                cancel_requested=cancel_event.is_set(),
+                cancel_requested=cancel_requested(),
             )
 
         def _handle_outcome(outcome: Any) -> None:
@@ -1293,34 +1460,23 @@ class ReviewTabMixin:
         def _handle_error(exc: Exception) -> None:
             logger.error("Review failed: %s", exc)
             if not self._testing_mode:
-                error_text = str(exc)
                 schedule_after = getattr(self, "_schedule_app_after", self.after)
-                schedule_after(0, lambda e=error_text: messagebox.showerror(t("common.error"), e))
+                schedule_after(0, functools.partial(messagebox.showerror, t("common.error"), str(exc)))
 
         def _handle_started(submission: Any) -> None:
             started_submission_id["value"] = getattr(submission, "submission_id", None)
             schedule_after = getattr(self, "_schedule_app_after", self.after)
-            schedule_after(0, lambda: self.progress.set(0))
-            schedule_after(0, lambda: self.status_var.set(t("common.running")))
-            schedule_after(0, self._start_elapsed_timer)
-            schedule_after(0, self._sync_global_cancel_button)
-            schedule_after(
-                0,
-                self._review_submission_queue.on_submission_sync_requested,
-            )
-            schedule_after(0, self._sync_review_submission_controls)
+            schedule_after(0, self._begin_review_run_ui)
 
         def _handle_finished() -> None:
             schedule_after = getattr(self, "_schedule_app_after", self.after)
-            if started_submission_id["value"] is not None:
-                schedule_after(0, self._stop_elapsed_timer)
-                schedule_after(0, lambda: self.progress.set(1.0))
-            schedule_after(0, self._sync_global_cancel_button)
             schedule_after(
                 0,
-                self._review_submission_queue.on_submission_sync_requested,
+                functools.partial(
+                    self._finalize_review_run_ui,
+                    started_submission_id["value"] is not None,
+                ),
             )
-            schedule_after(0, self._sync_review_submission_controls)
 
         submission = self._review_execution_scheduler_handle().submit_run(
             request=request,
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import threading
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Mapping, Sequence
 
 from aicodereviewer.execution import JobProgressUpdated
 
@@ -192,17 +192,30 @@ class ActiveModelRefreshController:
     """Own backend model-refresh deduplication for GUI combobox updates."""
 
     in_progress: set[str] = field(default_factory=set)
+    done_callbacks: dict[str, list[Callable[[], None]]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def begin(self, backend_name: str) -> bool:
         """Return False when the backend is already refreshing, else mark it active."""
-        if backend_name in self.in_progress:
-            return False
-        self.in_progress.add(backend_name)
-        return True
-
-    def finish(self, backend_name: str) -> None:
-        """Mark backend model refresh as finished."""
-        self.in_progress.discard(backend_name)
+        with self._lock:
+            if backend_name in self.in_progress:
+                return False
+            self.in_progress.add(backend_name)
+            return True
+
+    def add_done_callback(self, backend_name: str, callback: Callable[[], None]) -> bool:
+        """Queue *callback* for the active refresh; return False when none is running."""
+        with self._lock:
+            if backend_name not in self.in_progress:
+                return False
+            self.done_callbacks.setdefault(backend_name, []).append(callback)
+            return True
+
+    def finish(self, backend_name: str) -> list[Callable[[], None]]:
+        """Mark backend model refresh as finished and return its queued callbacks."""
+        with self._lock:
+            self.in_progress.discard(backend_name)
+            return self.done_callbacks.pop(backend_name, [])
 
     def is_refreshing(self, backend_name: str) -> bool:
         """Return True when the given backend model list is already refreshing."""
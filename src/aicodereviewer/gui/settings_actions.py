@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import configparser
 from tkinter import messagebox
 from typing import Any
 
@@ -8,7 +7,9 @@ import customtkinter as ctk  # type: ignore[import-untyped]
 
 from aicodereviewer.auth import clear_config_credential, store_config_credential
 from aicodereviewer.config import config
-from aicodereviewer.i18n import t
+from aicodereviewer.i18n import get_locale, t
+
+from .settings_builder import _settings_choice_label_maps
 
 
 class SettingsPersistenceController:
@@ -17,22 +18,13 @@ class SettingsPersistenceController:
         self._numeric_settings = numeric_settings
 
     def save(self) -> None:
-        validation_error = self._validate_numeric_fields()
-        if validation_error is not None:
-            self._host._show_toast(validation_error, error=True)
-            return
-
-        theme_reverse = {
-            t("gui.settings.ui_theme_system"): "system",
-            t("gui.settings.ui_theme_dark"): "dark",
-            t("gui.settings.ui_theme_light"): "light",
-        }
-        lang_reverse = {
-            t("gui.settings.ui_lang_system"): "system",
-            t("gui.settings.ui_lang_en"): "en",
-            t("gui.settings.ui_lang_ja"): "ja",
-        }
+        _theme_labels, theme_reverse, _lang_labels, lang_reverse = _settings_choice_label_maps(get_locale())
+        backend_reverse = getattr(self._host, "_backend_reverse_map", {})
+        numeric_settings = self._numeric_settings
 
+        # Read and validate every widget before writing anything, so an
+        # invalid number leaves both config and stored credentials untouched.
+        values: list[tuple[str, str, str]] = []
         for (section, key), widget in self._host._setting_entries.items():
             if isinstance(widget, ctk.StringVar):
                 raw = widget.get()
@@ -41,17 +33,23 @@ class SettingsPersistenceController:
                 elif section == "gui" and key == "language":
                     raw = lang_reverse.get(raw, "system")
                 elif section == "backend" and key == "type":
-                    raw = getattr(self._host, "_backend_reverse_map", {}).get(raw, "bedrock")
-                elif section == "local_llm" and key == "api_key":
-                    raw = store_config_credential(section, key, raw)
-                config.set_value(section, key, raw)
+                    raw = backend_reverse.get(raw, "bedrock")
             elif isinstance(widget, ctk.BooleanVar):
-                config.set_value(section, key, "true" if widget.get() else "false")
+                raw = "true" if widget.get() else "false"
             else:
                 raw = widget.get().strip()
-                if section == "local_llm" and key == "api_key":
-                    raw = store_config_credential(section, key, raw)
-                config.set_value(section, key, raw)
+                rule = numeric_settings.get((section, key))
+                if rule is not None:
+                    validation_error = self._numeric_field_error(raw, *rule)
+                    if validation_error is not None:
+                        self._host._show_toast(validation_error, error=True)
+                        return
+            values.append((section, key, raw))
+
+        for section, key, raw in values:
+            if section == "local_llm" and key == "api_key":
+                raw = store_config_credential(section, key, raw)
+            config.set_value(section, key, raw)
 
         selected_formats = [fmt for fmt, var in self._host._format_vars.items() if var.get()]
         if not selected_formats:
@@ -68,7 +66,10 @@ class SettingsPersistenceController:
         ctk.set_appearance_mode(theme_map.get(theme_val, "System"))
 
         try:
-            config.save()
+            # The dirty flag is only cleared by a successful write, so a
+            # retry after a failed save still writes the file.
+            if config.has_unsaved_changes or config.config_path is None or not config.config_path.exists():
+                config.save()
             self._host._refresh_local_http_discovery_ui()
             self._host._show_toast(t("gui.settings.saved_ok"))
         except Exception as exc:
@@ -105,10 +106,9 @@ class SettingsPersistenceController:
         ):
             return
 
-        config.config = configparser.ConfigParser()
-        config._set_defaults()  # type: ignore[reportPrivateUsage]
+        config.reset_to_defaults()
 
-        self._host._rebuild_settings_surface_from_config()
+        self._host._reset_settings_surface_from_config()
 
         try:
             config.save()
@@ -116,22 +116,18 @@ class SettingsPersistenceController:
         except Exception as exc:
             self._host._show_toast(t("gui.settings.reset_error", error=exc), error=True)
 
-    def _validate_numeric_fields(self) -> str | None:
-        for (section, key), (label, num_type, min_val) in self._numeric_settings.items():
-            widget = self._host._setting_entries.get((section, key))
-            if widget is None:
-                continue
-            raw = widget.get().strip()
-            try:
-                value = num_type(raw)
-                if value < min_val:
-                    raise ValueError(f"{value} < {min_val}")
-            except (ValueError, TypeError):
-                return (
-                    f'{label}: "{raw}" is not a valid '
-                    f"{'integer' if num_type is int else 'number'} "
-                    f"(minimum {min_val})"
-                )
+    @staticmethod
+    def _numeric_field_error(raw: str, label: str, num_type: type, min_val: int | float) -> str | None:
+        try:
+            value = num_type(raw)
+            if value < min_val:
+                raise ValueError(f"{value} < {min_val}")
+        except (ValueError, TypeError):
+            return (
+                f'{label}: "{raw}" is not a valid '
+                f"{'integer' if num_type is int else 'number'} "
+                f"(minimum {min_val})"
+            )
         return None
 
     def _clear_entry_value(self, section: str, key: str) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import threading
 import tkinter as tk
 from typing import Any, List
@@ -8,12 +9,92 @@ import customtkinter as ctk  # type: ignore[import-untyped]
 
 from aicodereviewer.auth import resolve_credential_value
 from aicodereviewer.config import config
-from aicodereviewer.i18n import t
+from aicodereviewer.i18n import get_locale, t
 from aicodereviewer.path_utils import get_wsl_distros
 
 from .widgets import InfoTooltip, _Tooltip
 
 
+# Last WSL distribution list seen this session; ``None`` until the first
+# background fetch finishes. Listing distros spawns ``wsl.exe``, so tab
+# builds reuse this instead of blocking the Tk main loop.
+_known_wsl_distros: tuple[str, ...] | None = None
+
+# Grid rows reserved for each backend section so a section built after the
+# first layout pass still lands in its place. Unused rows collapse to zero.
+_BACKEND_SECTION_ROWS = 16
+
+# Host attributes owned by backend sections; cleared on each build so a
+# deferred section never leaves a widget from a previous build behind.
+_BACKEND_SECTION_WIDGET_ATTRS = (
+    "_bedrock_model_combo",
+    "_bedrock_refresh_btn",
+    "_kiro_distro_combo",
+    "_wsl_refresh_btn",
+    "_kiro_model_combo",
+    "_kiro_refresh_btn",
+    "_copilot_model_combo",
+    "_copilot_refresh_btn",
+    "_local_model_combo",
+    "_local_api_key_rotate_btn",
+    "_local_api_key_revoke_btn",
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _settings_choice_label_maps(
+    locale: str,
+) -> tuple[dict[str, str], dict[str, str], dict[str, str], dict[str, str]]:
+    """Return the UI theme and UI language menu labels and reverse maps for *locale*.
+
+    The result is ``(theme_labels, theme_reverse, lang_labels, lang_reverse)``;
+    the maps are shared between tab builds and saves and must not be mutated.
+    """
+    theme_labels = {
+        "system": t("gui.settings.ui_theme_system", lang=locale),
+        "dark": t("gui.settings.ui_theme_dark", lang=locale),
+        "light": t("gui.settings.ui_theme_light", lang=locale),
+    }
+    lang_labels = {
+        "system": t("gui.settings.ui_lang_system", lang=locale),
+        "en": t("gui.settings.ui_lang_en", lang=locale),
+        "ja": t("gui.settings.ui_lang_ja", lang=locale),
+    }
+    return (
+        theme_labels,
+        {value: key for key, value in theme_labels.items()},
+        lang_labels,
+        {value: key for key, value in lang_labels.items()},
+    )
+
+
+def _settings_display_value(
+    section: str,
+    key: str,
+    value: Any,
+    *,
+    backend_display_map: dict[str, str],
+) -> Any:
+    """Return how the settings form shows the config *value* of (*section*, *key*)."""
+    if section == "gui" and key in ("theme", "language"):
+        theme_labels, _theme_reverse, lang_labels, _lang_reverse = _settings_choice_label_maps(get_locale())
+        labels = theme_labels if key == "theme" else lang_labels
+        return labels.get(str(value or "").strip() or "system", labels["system"])
+    if section == "backend" and key == "type":
+        return backend_display_map.get(value, backend_display_map.get("bedrock", "bedrock"))
+    if section == "performance" and key == "max_file_size_mb":
+        return value // (1024 * 1024) if isinstance(value, int) and value > 100 else value
+    if section == "local_llm" and key == "api_key":
+        return resolve_credential_value(str(value or "")).secret
+    return value
+
+
+def _restore_refresh_button(button: Any) -> None:
+    """Re-enable a model refresh button unless its tab was rebuilt meanwhile."""
+    if button.winfo_exists():
+        button.configure(state="normal", text="↻")
+
+
 class SettingsTabBuilder:
     def __init__(self, host: Any, *, parent: Any | None = None, detached: bool = False) -> None:
         self.host = host
@@ -21,6 +102,7 @@ class SettingsTabBuilder:
         self.detached = detached
         self.scroll: Any = None
         self.row = 0
+        self._config_sections: dict[str, dict[str, Any]] = {}
 
     def build(self) -> None:
         if self.parent is None:
@@ -34,27 +116,44 @@ class SettingsTabBuilder:
         tab.grid_rowconfigure(0, weight=1)
 
         scroll = ctk.CTkFrame(tab) if self.host._testing_mode else ctk.CTkScrollableFrame(tab)
-        scroll.grid(row=0, column=0, sticky="nsew", padx=6, pady=6)
         scroll.grid_columnconfigure(2, weight=1)
         self.scroll = scroll
         self.host.settings_scroll_frame = scroll
 
         self.host._setting_entries = {}
         self.host._backend_section_labels = {}
+        self.host._settings_pending_sections = {}
+        for attr in _BACKEND_SECTION_WIDGET_ATTRS:
+            setattr(self.host, attr, None)
 
         self._build_general_section()
-        self._build_bedrock_section()
-        self._build_kiro_section()
-        self._build_copilot_section()
-        self._build_local_llm_section()
+        self._build_backend_sections()
         self._build_local_http_section()
         self._build_performance_section()
         self._build_editor_section()
         self._build_addons_section()
         self._build_output_formats_section()
         self._build_footer_buttons()
+        # Map the frame only once it is filled so Tk lays the form out in one
+        # pass instead of re-flowing the visible tab for every added row.
+        scroll.grid(row=0, column=0, sticky="nsew", padx=6, pady=6)
         self._finalize()
 
+    def _config_value(self, section: str, key: str, fallback: Any = None) -> Any:
+        """Return a config value from a per-build snapshot of its section."""
+        values = self._config_sections.get(section)
+        if values is None:
+            values = self._config_sections[section] = config.snapshot(section)
+        return values.get(key, fallback)
+
+    def _display_value(self, section: str, key: str, fallback: Any = None) -> Any:
+        return _settings_display_value(
+            section,
+            key,
+            self._config_value(section, key, fallback),
+            backend_display_map=getattr(self.host, "_backend_display_map", {}),
+        )
+
     def _section_header(self, text: str, backend_key: str = "") -> None:
         header_frame = ctk.CTkFrame(self.scroll, fg_color="transparent")
         header_frame.grid(row=self.row, column=0, columnspan=4, sticky="ew", padx=6, pady=(12, 4))
@@ -104,7 +203,7 @@ class SettingsTabBuilder:
         tooltip_key: str = "",
         actions: list[dict[str, Any]] | None = None,
     ) -> None:
-        InfoTooltip.add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
+        InfoTooltip.lazy_add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
         ctk.CTkLabel(self.scroll, text=label + ":").grid(
             row=self.row,
             column=1,
@@ -148,7 +247,7 @@ class SettingsTabBuilder:
         tooltip_key: str = "",
         var_store_name: str = "",
     ) -> None:
-        InfoTooltip.add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
+        InfoTooltip.lazy_add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
         ctk.CTkLabel(self.scroll, text=label + ":").grid(
             row=self.row,
             column=1,
@@ -177,7 +276,7 @@ class SettingsTabBuilder:
         refresh_button_tooltip: str = "",
         refresh_button_store_name: str = "",
     ) -> None:
-        InfoTooltip.add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
+        InfoTooltip.lazy_add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
         ctk.CTkLabel(self.scroll, text=label + ":").grid(
             row=self.row,
             column=1,
@@ -208,7 +307,7 @@ class SettingsTabBuilder:
         self.row += 1
 
     def _add_checkbox(self, label: str, section: str, key: str, default: bool, tooltip_key: str = "") -> None:
-        InfoTooltip.add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
+        InfoTooltip.lazy_add(self.scroll, t(tooltip_key) if tooltip_key else label, row=self.row, column=0)
         var = ctk.BooleanVar(value=default)
         cb = ctk.CTkCheckBox(self.scroll, text=label, variable=var)
         cb.grid(row=self.row, column=1, columnspan=2, sticky="w", padx=(0, 4), pady=3)
@@ -218,13 +317,8 @@ class SettingsTabBuilder:
     def _build_general_section(self) -> None:
         self._section_header(t("gui.settings.section_general"))
 
-        saved_theme = config.get("gui", "theme", "").strip() or "system"
-        theme_labels = {
-            "system": t("gui.settings.ui_theme_system"),
-            "dark": t("gui.settings.ui_theme_dark"),
-            "light": t("gui.settings.ui_theme_light"),
-        }
-        theme_display = theme_labels.get(saved_theme, t("gui.settings.ui_theme_system"))
+        theme_labels, _theme_reverse, lang_labels, _lang_reverse = _settings_choice_label_maps(get_locale())
+        theme_display = self._display_value("gui", "theme", "")
         self._add_dropdown(
             t("gui.settings.ui_theme"),
             "gui",
@@ -235,13 +329,7 @@ class SettingsTabBuilder:
             var_store_name="_theme_var",
         )
 
-        saved_ui_lang = config.get("gui", "language", "").strip() or "system"
-        lang_labels = {
-            "system": t("gui.settings.ui_lang_system"),
-            "en": t("gui.settings.ui_lang_en"),
-            "ja": t("gui.settings.ui_lang_ja"),
-        }
-        lang_display = lang_labels.get(saved_ui_lang, t("gui.settings.ui_lang_system"))
+        lang_display = self._display_value("gui", "language", "")
         self._add_dropdown(
             t("gui.settings.ui_language"),
             "gui",
@@ -252,13 +340,8 @@ class SettingsTabBuilder:
             var_store_name="_lang_setting_var",
         )
 
-        self.host._backend_display_map = self.host._build_backend_display_map()
-        self.host._backend_reverse_map = {v: k for k, v in self.host._backend_display_map.items()}
-        saved_backend = config.get("backend", "type", "bedrock")
-        backend_display = self.host._backend_display_map.get(
-            saved_backend,
-            self.host._backend_display_map.get("bedrock", "bedrock"),
-        )
+        self.host._backend_display_map, self.host._backend_reverse_map = self.host._backend_display_maps()
+        backend_display = self._display_value("backend", "type", "bedrock")
         self._add_dropdown(
             t("gui.settings.backend"),
             "backend",
@@ -269,22 +352,57 @@ class SettingsTabBuilder:
             var_store_name="_settings_backend_var",
         )
 
+    def _build_backend_sections(self) -> None:
+        """Build the selected backend's section now and defer the others.
+
+        Deferred sections are registered in ``host._settings_pending_sections``
+        and built by the host the first time their backend is selected. Test
+        mode builds every section so the whole form is inspectable.
+        """
+        active_backend = self._config_value("backend", "type", "bedrock")
+        sections = (
+            ("bedrock", self._build_bedrock_section),
+            ("kiro", self._build_kiro_section),
+            ("copilot", self._build_copilot_section),
+            ("local", self._build_local_llm_section),
+        )
+        for backend_key, build_section in sections:
+            start_row = self.row
+            if self.host._testing_mode or backend_key == active_backend:
+                build_section()
+            else:
+                self.host._settings_pending_sections[backend_key] = functools.partial(
+                    self._build_deferred_section, start_row, build_section
+                )
+            self.row = start_row + _BACKEND_SECTION_ROWS
+
+    def _build_deferred_section(self, start_row: int, build_section: Any) -> None:
+        # The config may have changed (saved or reset) since the tab was built.
+        self._config_sections.clear()
+        end_row = self.row
+        self.row = start_row
+        try:
+            build_section()
+        finally:
+            self.row = end_row
+        self.host._refresh_settings_tab_layout()
+
     def _build_bedrock_section(self) -> None:
         self._section_header(t("gui.settings.section_bedrock"), backend_key="bedrock")
 
         def _refresh_bedrock_with_spinner() -> None:
-            if hasattr(self.host, "_bedrock_refresh_btn"):
-                btn = self.host._bedrock_refresh_btn
-                btn.configure(state="disabled", text="…")
-                schedule_after = getattr(self.host, "_schedule_app_after", self.host.after)
-                schedule_after(1000, lambda: btn.configure(state="normal", text="↻"))
-            self.host._refresh_bedrock_model_list_async()
+            btn = getattr(self.host, "_bedrock_refresh_btn", None)
+            if btn is None:
+                self.host._refresh_bedrock_model_list_async()
+                return
+            btn.configure(state="disabled", text="…")
+            self.host._refresh_bedrock_model_list_async(on_done=functools.partial(_restore_refresh_button, btn))
 
         self._add_combobox(
             t("gui.settings.model_id"),
             "model",
             "model_id",
-            config.get("model", "model_id", ""),
+            self._config_value("model", "model_id", ""),
             [],
             tooltip_key="gui.tip.model_id",
             widget_store_name="_bedrock_model_combo",
@@ -296,21 +414,21 @@ class SettingsTabBuilder:
             t("gui.settings.aws_region"),
             "aws",
             "region",
-            config.get("aws", "region", "us-east-1"),
+            self._config_value("aws", "region", "us-east-1"),
             tooltip_key="gui.tip.aws_region",
         )
         self._add_entry(
             t("gui.settings.aws_sso_session"),
             "aws",
             "sso_session",
-            config.get("aws", "sso_session", ""),
+            self._config_value("aws", "sso_session", ""),
             tooltip_key="gui.tip.aws_sso_session",
         )
         self._add_entry(
             t("gui.settings.aws_access_key"),
             "aws",
             "access_key_id",
-            config.get("aws", "access_key_id", ""),
+            self._config_value("aws", "access_key_id", ""),
             tooltip_key="gui.tip.aws_access_key",
         )
 
@@ -318,33 +436,38 @@ class SettingsTabBuilder:
         self._section_header(t("gui.settings.section_kiro"), backend_key="kiro")
 
         def _refresh_wsl_distros_with_spinner() -> None:
-            if hasattr(self.host, "_wsl_refresh_btn"):
+            if getattr(self.host, "_wsl_refresh_btn", None) is not None:
                 btn = self.host._wsl_refresh_btn
                 btn.configure(state="disabled", text="…")
 
             def _worker() -> None:
+                global _known_wsl_distros
                 distros = get_wsl_distros()
+                _known_wsl_distros = tuple(distros)
                 values = distros if distros else ["(none available)"]
 
                 def _apply() -> None:
-                    if hasattr(self.host, "_kiro_distro_combo"):
+                    if getattr(self.host, "_kiro_distro_combo", None) is not None:
                         current = self.host._kiro_distro_combo.get()
                         self.host._kiro_distro_combo.configure(values=values)
                         if current and current in values:
                             self.host._kiro_distro_combo.set(current)
-                    if hasattr(self.host, "_wsl_refresh_btn"):
+                    if getattr(self.host, "_wsl_refresh_btn", None) is not None:
                         self.host._wsl_refresh_btn.configure(state="normal", text="↻")
 
                 self.host._run_on_ui_thread(_apply)
 
             threading.Thread(target=_worker, daemon=True).start()
 
-        kiro_distros = get_wsl_distros()
+        if _known_wsl_distros is None:
+            kiro_distros: list[str] = []
+        else:
+            kiro_distros = list(_known_wsl_distros) or ["(none available)"]
         self._add_combobox(
             t("gui.settings.kiro_distro"),
             "kiro",
             "wsl_distro",
-            config.get("kiro", "wsl_distro", ""),
+            self._config_value("kiro", "wsl_distro", ""),
             kiro_distros,
             tooltip_key="gui.tip.kiro_distro",
             widget_store_name="_kiro_distro_combo",
@@ -352,34 +475,37 @@ class SettingsTabBuilder:
             refresh_button_tooltip=t("gui.tip.refresh_wsl_distros"),
             refresh_button_store_name="_wsl_refresh_btn",
         )
+        if _known_wsl_distros is None:
+            schedule_after = getattr(self.host, "_schedule_app_after", self.host.after)
+            schedule_after(0, _refresh_wsl_distros_with_spinner)
         self._add_entry(
             t("gui.settings.kiro_command"),
             "kiro",
             "cli_command",
-            config.get("kiro", "cli_command", "kiro"),
+            self._config_value("kiro", "cli_command", "kiro"),
             tooltip_key="gui.tip.kiro_command",
         )
         self._add_entry(
             t("gui.settings.kiro_timeout"),
             "kiro",
             "timeout",
-            config.get("kiro", "timeout", "300"),
+            self._config_value("kiro", "timeout", "300"),
             tooltip_key="gui.tip.kiro_timeout",
         )
 
         def _refresh_kiro_with_spinner() -> None:
-            if hasattr(self.host, "_kiro_refresh_btn"):
-                btn = self.host._kiro_refresh_btn
-                btn.configure(state="disabled", text="…")
-                schedule_after = getattr(self.host, "_schedule_app_after", self.host.after)
-                schedule_after(3000, lambda: btn.configure(state="normal", text="↻"))
-            self.host._refresh_kiro_model_list_async()
+            btn = getattr(self.host, "_kiro_refresh_btn", None)
+            if btn is None:
+                self.host._refresh_kiro_model_list_async()
+                return
+            btn.configure(state="disabled", text="…")
+            self.host._refresh_kiro_model_list_async(on_done=functools.partial(_restore_refresh_button, btn))
 
         self._add_combobox(
             t("gui.settings.kiro_model"),
             "kiro",
             "model",
-            config.get("kiro", "model", ""),
+            self._config_value("kiro", "model", ""),
             [],
             tooltip_key="gui.tip.kiro_model",
             widget_store_name="_kiro_model_combo",
@@ -394,30 +520,30 @@ class SettingsTabBuilder:
             t("gui.settings.copilot_path"),
             "copilot",
             "copilot_path",
-            config.get("copilot", "copilot_path", "copilot"),
+            self._config_value("copilot", "copilot_path", "copilot"),
             tooltip_key="gui.tip.copilot_path",
         )
         self._add_entry(
             t("gui.settings.copilot_timeout"),
             "copilot",
             "timeout",
-            config.get("copilot", "timeout", "300"),
+            self._config_value("copilot", "timeout", "300"),
             tooltip_key="gui.tip.copilot_timeout",
         )
 
         def _refresh_copilot_with_spinner() -> None:
-            if hasattr(self.host, "_copilot_refresh_btn"):
-                btn = self.host._copilot_refresh_btn
-                btn.configure(state="disabled", text="…")
-                schedule_after = getattr(self.host, "_schedule_app_after", self.host.after)
-                schedule_after(1000, lambda: btn.configure(state="normal", text="↻"))
-            self.host._refresh_copilot_model_list_async()
+            btn = getattr(self.host, "_copilot_refresh_btn", None)
+            if btn is None:
+                self.host._refresh_copilot_model_list_async()
+                return
+            btn.configure(state="disabled", text="…")
+            self.host._refresh_copilot_model_list_async(on_done=functools.partial(_restore_refresh_button, btn))
 
         self._add_combobox(
             t("gui.settings.copilot_model"),
             "copilot",
             "model",
-            config.get("copilot", "model", "auto"),
+            self._config_value("copilot", "model", "auto"),
             ["auto"],
             tooltip_key="gui.tip.copilot_model",
             widget_store_name="_copilot_model_combo",
@@ -429,7 +555,7 @@ class SettingsTabBuilder:
             t("gui.settings.copilot_tool_file_access"),
             "tool_file_access",
             "enabled",
-            config.get("tool_file_access", "enabled", False),
+            self._config_value("tool_file_access", "enabled", False),
             tooltip_key="gui.tip.copilot_tool_file_access",
         )
 
@@ -439,14 +565,14 @@ class SettingsTabBuilder:
             t("gui.settings.local_api_url"),
             "local_llm",
             "api_url",
-            config.get("local_llm", "api_url", "http://localhost:1234"),
+            self._config_value("local_llm", "api_url", "http://localhost:1234"),
             tooltip_key="gui.tip.local_api_url",
         )
         self._add_dropdown(
             t("gui.settings.local_api_type"),
             "local_llm",
             "api_type",
-            config.get("local_llm", "api_type", "lmstudio"),
+            self._config_value("local_llm", "api_type", "lmstudio"),
             ["lmstudio", "ollama", "openai", "anthropic"],
             tooltip_key="gui.tip.local_api_type",
         )
@@ -454,7 +580,7 @@ class SettingsTabBuilder:
             t("gui.settings.local_model"),
             "local_llm",
             "model",
-            config.get("local_llm", "model", "default"),
+            self._config_value("local_llm", "model", "default"),
             [],
             tooltip_key="gui.tip.local_model",
             widget_store_name="_local_model_combo",
@@ -463,7 +589,7 @@ class SettingsTabBuilder:
             t("gui.settings.local_api_key"),
             "local_llm",
             "api_key",
-            resolve_credential_value(str(config.get("local_llm", "api_key", "") or "")).secret,
+            self._display_value("local_llm", "api_key", ""),
             tooltip_key="gui.tip.local_api_key",
             actions=[
                 {
@@ -486,21 +612,21 @@ class SettingsTabBuilder:
             t("gui.settings.local_timeout"),
             "local_llm",
             "timeout",
-            config.get("local_llm", "timeout", "300"),
+            self._config_value("local_llm", "timeout", "300"),
             tooltip_key="gui.tip.local_timeout",
         )
         self._add_entry(
             t("gui.settings.local_max_tokens"),
             "local_llm",
             "max_tokens",
-            config.get("local_llm", "max_tokens", "4096"),
+            self._config_value("local_llm", "max_tokens", "4096"),
             tooltip_key="gui.tip.local_max_tokens",
         )
         self._add_dropdown(
             t("gui.settings.local_reasoning"),
             "local_llm",
             "reasoning",
-            config.get("local_llm", "reasoning", "default"),
+            self._config_value("local_llm", "reasoning", "default"),
             ["default", "off", "low", "medium", "high", "on"],
             tooltip_key="gui.tip.local_reasoning",
         )
@@ -508,7 +634,7 @@ class SettingsTabBuilder:
             t("gui.settings.local_enable_web_search"),
             "local_llm",
             "enable_web_search",
-            bool(config.get("local_llm", "enable_web_search", True)),
+            bool(self._config_value("local_llm", "enable_web_search", True)),
             tooltip_key="gui.tip.local_enable_web_search",
         )
 
@@ -518,13 +644,13 @@ class SettingsTabBuilder:
             t("gui.settings.local_http_enabled"),
             "local_http",
             "enabled",
-            config.get("local_http", "enabled", False),
+            self._config_value("local_http", "enabled", False),
         )
         self._add_entry(
             t("gui.settings.local_http_port"),
             "local_http",
             "port",
-            str(config.get("local_http", "port", 8765)),
+            str(self._config_value("local_http", "port", 8765)),
         )
 
         ctk.CTkLabel(self.scroll, text=t("gui.settings.local_http_status_label")).grid(
@@ -588,33 +714,31 @@ class SettingsTabBuilder:
             t("gui.settings.rate_limit"),
             "performance",
             "max_requests_per_minute",
-            str(config.get("performance", "max_requests_per_minute", 10)),
+            str(self._config_value("performance", "max_requests_per_minute", 10)),
             tooltip_key="gui.tip.rate_limit",
         )
         self._add_entry(
             t("gui.settings.request_interval"),
             "performance",
             "min_request_interval_seconds",
-            str(config.get("performance", "min_request_interval_seconds", 6.0)),
+            str(self._config_value("performance", "min_request_interval_seconds", 6.0)),
             tooltip_key="gui.tip.request_interval",
         )
-        max_fs_raw = config.get("performance", "max_file_size_mb", 10)
-        max_fs = max_fs_raw // (1024 * 1024) if isinstance(max_fs_raw, int) and max_fs_raw > 100 else max_fs_raw
         self._add_entry(
             t("gui.settings.max_file_size"),
             "performance",
             "max_file_size_mb",
-            str(max_fs),
+            str(self._display_value("performance", "max_file_size_mb", 10)),
             tooltip_key="gui.tip.max_file_size",
         )
         self._add_entry(
             t("gui.settings.batch_size"),
             "processing",
             "batch_size",
-            str(config.get("processing", "batch_size", 5)),
+            str(self._config_value("processing", "batch_size", 5)),
             tooltip_key="gui.tip.batch_size",
         )
-        combine_val = str(config.get("processing", "combine_files", "true")).lower() in ("true", "1", "yes")
+        combine_val = str(self._config_value("processing", "combine_files", "true")).lower() in ("true", "1", "yes")
         self._add_checkbox(
             t("gui.settings.combine_files"),
             "processing",
@@ -629,7 +753,7 @@ class SettingsTabBuilder:
             t("gui.settings.editor_command"),
             "gui",
             "editor_command",
-            config.get("gui", "editor_command", ""),
+            self._config_value("gui", "editor_command", ""),
             tooltip_key="gui.tip.editor_command",
         )
 
@@ -714,10 +838,10 @@ class SettingsTabBuilder:
     def _build_output_formats_section(self) -> None:
         self._section_header(t("gui.settings.section_output_formats"))
 
-        saved_formats = config.get("output", "formats", "json,txt").strip()
+        saved_formats = self._config_value("output", "formats", "json,txt").strip()
         enabled_formats = set(saved_formats.split(",")) if saved_formats else {"json", "txt"}
 
-        InfoTooltip.add(
+        InfoTooltip.lazy_add(
             self.scroll,
             t("gui.tip.output_formats"),
             row=self.row,
@@ -819,7 +943,7 @@ class SettingsTabBuilder:
             self.host._sync_review_to_menu()
 
             schedule_after = getattr(self.host, "_schedule_app_after", self.host.after)
-            schedule_after(500, self.host._auto_populate_models)
+            schedule_after(0, self.host._auto_populate_models)
 
         self.host._populate_addon_diagnostics()
         self.scroll.bind("<Configure>", self.host._schedule_settings_layout_refresh, add="+")
@@ -6,13 +6,13 @@ import customtkinter as ctk  # type: ignore[import-untyped]
 
 from aicodereviewer.addons import get_active_addon_runtime, install_addon_runtime
 from aicodereviewer.config import config
-from aicodereviewer.i18n import t
+from aicodereviewer.i18n import get_locale, t
 from aicodereviewer.registries import get_backend_registry
 from aicodereviewer.review_definitions import get_active_review_pack_paths, install_review_registry, merge_review_pack_paths
 
 from .settings_actions import SettingsPersistenceController
 from .settings_addons import SettingsAddonDiagnosticsRenderer
-from .settings_builder import SettingsTabBuilder
+from .settings_builder import SettingsTabBuilder, _settings_display_value
 from .settings_layout import SettingsLayoutHelper
 from .results_mixin import _NUMERIC_SETTINGS
 
@@ -151,7 +151,10 @@ class SettingsTabMixin:
     def _restore_settings_surface_state(self, state: dict[str, Any] | None) -> None:
         if not state:
             return
-        for (section, key), value in state.get("entries", {}).items():
+        entries = state.get("entries", {})
+        if any(entry_key not in getattr(self, "_setting_entries", {}) for entry_key in entries):
+            self._build_pending_settings_sections()
+        for (section, key), value in entries.items():
             widget = getattr(self, "_setting_entries", {}).get((section, key))
             if widget is None:
                 continue
@@ -225,6 +228,37 @@ class SettingsTabMixin:
         )
         redock_btn.grid(row=0, column=1)
 
+    def _reset_settings_surface_from_config(self) -> None:
+        """Show the current config in the existing settings widgets.
+
+        Falls back to rebuilding the surface when no settings form is built.
+        """
+        entries = getattr(self, "_setting_entries", None)
+        if not entries:
+            self._rebuild_settings_surface_from_config()
+            return
+        backend_display_map = getattr(self, "_backend_display_map", {})
+        section_values: dict[str, dict[str, Any]] = {}
+        entry_values: dict[tuple[str, str], Any] = {}
+        for section, key in entries:
+            values = section_values.get(section)
+            if values is None:
+                values = section_values[section] = config.snapshot(section)
+            entry_values[(section, key)] = _settings_display_value(
+                section,
+                key,
+                values.get(key, ""),
+                backend_display_map=backend_display_map,
+            )
+        saved_formats = str(config.get("output", "formats", "json,txt") or "").strip()
+        enabled_formats = set(saved_formats.split(",")) if saved_formats else {"json", "txt"}
+        self._restore_settings_surface_state(
+            {
+                "entries": entry_values,
+                "formats": {fmt: fmt in enabled_formats for fmt in getattr(self, "_format_vars", {})},
+            }
+        )
+
     def _rebuild_settings_surface_from_config(self) -> None:
         if self._is_settings_detached():
             self._rebuild_detached_settings_surface()
@@ -343,6 +377,27 @@ class SettingsTabMixin:
             display_map[descriptor.key] = builtin_labels.get(descriptor.key, descriptor.display_name)
         return display_map
 
+    def _backend_display_maps(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Return the backend ``(display_map, reverse_map)`` for the current locale.
+
+        The maps are reused until the locale or the registered backends
+        change, and must not be mutated.
+        """
+        cache_key = (
+            get_locale(),
+            tuple(
+                (descriptor.key, descriptor.display_name)
+                for descriptor in get_backend_registry().list_descriptors()
+            ),
+        )
+        cached = getattr(self, "_backend_display_maps_cache", None)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], cached[2]
+        display_map = self._build_backend_display_map()
+        reverse_map = {value: key for key, value in display_map.items()}
+        self._backend_display_maps_cache = (cache_key, display_map, reverse_map)
+        return display_map, reverse_map
+
     def _set_readonly_textbox(self, textbox: Any, text: str) -> None:
         textbox.configure(state="normal")
         textbox.delete("0.0", "end")
@@ -408,11 +463,22 @@ class SettingsTabMixin:
 
     # ── Backend sync helpers ──────────────────────────────────────────────
 
+    def _build_pending_settings_sections(self, backend_key: str | None = None) -> None:
+        """Build deferred backend sections, or only *backend_key*'s when given."""
+        pending = getattr(self, "_settings_pending_sections", {})
+        keys = list(pending) if backend_key is None else [backend_key]
+        for key in keys:
+            build_section = pending.pop(key, None)
+            if build_section is not None:
+                build_section()
+
     def _update_backend_section_indicators(self, *args):
         if not hasattr(self, "_settings_backend_var"):
             return
         display_val = self._settings_backend_var.get()
         current_backend = getattr(self, "_backend_reverse_map", {}).get(display_val, "")
+        if current_backend:
+            self._build_pending_settings_sections(current_backend)
         for backend_key, label in self._backend_section_labels.items():
             if backend_key == current_backend:
                 label.configure(text=t("gui.settings.active_backend"),
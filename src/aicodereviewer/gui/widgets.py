@@ -75,12 +75,32 @@ class InfoTooltip:
     @staticmethod
     def add(parent: Any, text: str, row: int, column: int, **grid_kw: Any):
         """Place an 🛈 label at the given grid position with a hover tooltip."""
+        lbl = InfoTooltip._place_icon(parent, row, column, **grid_kw)
+        _tip = _Tooltip(lbl, text)
+        return lbl
+
+    @staticmethod
+    def lazy_add(parent: Any, text: str, row: int, column: int, **grid_kw: Any):
+        """Like :meth:`add`, but only bind the tooltip on the first hover."""
+        lbl = InfoTooltip._place_icon(parent, row, column, **grid_kw)
+        tips: list[_Tooltip] = []
+
+        def _first_enter(event: Any = None) -> None:
+            if tips:
+                return
+            tips.append(_Tooltip(lbl, text))
+            tips[0]._show(event)
+
+        lbl.bind("<Enter>", _first_enter)
+        return lbl
+
+    @staticmethod
+    def _place_icon(parent: Any, row: int, column: int, **grid_kw: Any):
         lbl = ctk.CTkLabel(parent, text="🛈", width=20,
                            font=ctk.CTkFont(size=14),
                            text_color=("gray50", "gray60"),
                            cursor="question_arrow")
         lbl.grid(row=row, column=column, padx=(0, 4), **grid_kw)
-        _tip = _Tooltip(lbl, text)
         return lbl
 
 
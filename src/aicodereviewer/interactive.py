@@ -7,7 +7,6 @@ each issue, with backup creation and diff preview for fixes.
 """
 import shutil
 import logging
-import difflib
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -215,6 +214,8 @@ def _diagnostic_category_label(category: str) -> str:
 
 
 def _show_diff(original: str, fixed: str, filepath: str):
+    import difflib
+
     name = Path(filepath).name
     diff = list(
         difflib.unified_diff(
@@ -329,6 +329,7 @@ STRINGS: dict[str, str] = {
     "gui.val.type_required":          "Select at least one review type.",
     "gui.val.meta_required":          "Programmers and reviewers are required for a review.",
     "gui.val.spec_read_error":        "Cannot read spec file: {error}",
+    "gui.val.spec_too_large":         "Spec file is larger than {limit} MB.",
     "gui.val.no_report":              "Complete – no report generated.",
     "gui.val.dry_run_done":            "Dry run complete – see Log tab for file listing.",
     "gui.val.report_saved":           "Report saved: {path}",
@@ -1004,6 +1005,8 @@ STRINGS: dict[str, str] = {
     "gui.results.original_code":      "Original",
     "gui.results.fixed_code":         "Fixed",
     "gui.results.no_changes":         "No changes detected.",
+    "gui.results.diff_failed":        "Could not compute the diff: {error}",
+    "gui.results.diff_computing":     "Computing diff…",
 
     # ── Settings – editor ──────────────────────────────────────────────────
     "gui.settings.section_editor":    "Code Editor",
@@ -329,6 +329,7 @@ STRINGS: dict[str, str] = {
     "gui.val.type_required":          "レビュータイプを1つ以上選択してください。",
     "gui.val.meta_required":          "レビューにはプログラマーとレビュアーの入力が必要です。",
     "gui.val.spec_read_error":        "仕様書ファイルを読み込めません: {error}",
+    "gui.val.spec_too_large":         "仕様書ファイルが {limit} MB を超えています。",
     "gui.val.no_report":              "完了 – レポートは生成されませんでした。",
     "gui.val.dry_run_done":            "ドライラン完了 – ファイル一覧はログタブをご覧ください。",
     "gui.val.report_saved":           "レポート保存先: {path}",
@@ -1006,6 +1007,8 @@ STRINGS: dict[str, str] = {
     "gui.results.original_code":      "変更前",
     "gui.results.fixed_code":         "変更後",
     "gui.results.no_changes":         "変更なし。",
+    "gui.results.diff_failed":        "差分を計算できませんでした: {error}",
+    "gui.results.diff_computing":     "差分を計算しています…",
 
     # ── Settings – editor ──────────────────────────────────────────────────
     "gui.settings.section_editor":    "コードエディタ",
@@ -14,6 +14,7 @@ Supports:
 import argparse
 import json
 import logging
+import multiprocessing
 import shutil
 import sys
 import time
@@ -1779,4 +1780,6 @@ def _launch_gui() -> int:
 
 
 if __name__ == "__main__":
+    # The frozen build re-enters here for diff-parsing helper processes.
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -17,7 +17,6 @@ from __future__ import annotations
 import json
 import logging
 import re
-from difflib import SequenceMatcher
 from pathlib import PurePath
 from typing import Any, Dict, List, Optional, Sequence, cast
 
@@ -294,6 +293,8 @@ def _extract_description(text: str, fallback: str) -> str:
 
 def _text_similarity(a: str, b: str) -> float:
     """Quick token-level similarity ratio."""
+    from difflib import SequenceMatcher
+
     return SequenceMatcher(None, a.lower().split(), b.lower().split()).ratio()
 
 
@@ -8,8 +8,11 @@ and parsing diff files to identify changed code for targeted reviews.
 Functions:
     scan_project: Recursively find source files by extension
     parse_diff_file: Parse unified diff format to extract changed files
+    parse_diff_file_lines: Like parse_diff_file, but keep each file's lines unjoined
+    iter_diff_file: Lazily yield (filename, content) pairs from a unified diff
     detect_vcs_type: Detect whether project uses Git or SVN
     get_diff_from_commits: Generate diff from Git or SVN commit/revision range
+    resolve_commit_range: Resolve a Git commit range to fixed commit ids
     scan_project_with_scope: Main entry point for scoped file discovery
 """
 import os
@@ -17,7 +20,7 @@ import re
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -26,15 +29,20 @@ from .config import config
 __all__ = [
     "scan_project",
     "parse_diff_file",
+    "parse_diff_file_lines",
+    "iter_diff_file",
     "parse_diff_file_enhanced",
     "detect_vcs_type",
     "get_diff_from_commits",
+    "resolve_commit_range",
     "get_commit_messages",
     "scan_project_with_scope",
 ]
 
 logger = logging.getLogger(__name__)
 
+_REV_PARSE_TIMEOUT_SECS = 30
+
 
 def scan_project(directory: str) -> List[Path]:
     """
@@ -155,10 +163,20 @@ class EnhancedDiffFile:
     hunks: List[DiffHunk] = field(default_factory=list)
 
 
-# ── Hunk header regex ──────────────────────────────────────────────────────
+# ── Diff header regexes ────────────────────────────────────────────────────
 _HUNK_RE = re.compile(
     r"^@@\s+-(\d+)(?:,\d+)?\s+\+(\d+)(?:,\d+)?\s+@@\s*(.*)"
 )
+_FILE_HEADER_RE = re.compile(r"\+\+\+ [ab]/(.+)")
+
+# Hunk-context signatures, tried in order: Python, JS/TS, Java/C#, then
+# anything else with parens that looks like a function signature.
+_HUNK_CONTEXT_RES = (
+    re.compile(r"((?:def|class|async\s+def)\s+\w+[^:]*)"),
+    re.compile(r"((?:export\s+)?(?:async\s+)?(?:function\*?|const|let|var)\s+\w+[^{]*)"),
+    re.compile(r"((?:public|private|protected|static|final|virtual|override|abstract)\s+.*\w+\s*\([^)]*\))"),
+    re.compile(r"(\w[\w\s<>]*\w\s*\([^)]*\))"),
+)
 
 
 def _extract_function_from_hunk_ctx(header_ctx: str) -> Optional[str]:
@@ -170,22 +188,10 @@ def _extract_function_from_hunk_ctx(header_ctx: str) -> Optional[str]:
     if not header_ctx:
         return None
     header_ctx = header_ctx.strip()
-    # Python: def foo(…) / class Foo
-    m = re.match(r"((?:def|class|async\s+def)\s+\w+[^:]*)", header_ctx)
-    if m:
-        return m.group(1).strip()
-    # JS/TS: function foo / const foo = / export function
-    m = re.match(r"((?:export\s+)?(?:async\s+)?(?:function\*?|const|let|var)\s+\w+[^{]*)", header_ctx)
-    if m:
-        return m.group(1).strip()
-    # Java/C#: access modifier + type + name
-    m = re.match(r"((?:public|private|protected|static|final|virtual|override|abstract)\s+.*\w+\s*\([^)]*\))", header_ctx)
-    if m:
-        return m.group(1).strip()
-    # Anything else with parens looks like a function signature
-    m = re.match(r"(\w[\w\s<>]*\w\s*\([^)]*\))", header_ctx)
-    if m:
-        return m.group(1).strip()
+    for pattern in _HUNK_CONTEXT_RES:
+        m = pattern.match(header_ctx)
+        if m:
+            return m.group(1).strip()
     return header_ctx if len(header_ctx) > 2 else None
 
 
@@ -202,44 +208,78 @@ def parse_diff_file(diff_content: str) -> List[Dict[str, str]]:
     Returns:
         List[Dict[str, str]]: List of dictionaries with 'filename' and 'content' keys
     """
-    files: List[Dict[str, str]] = []
-    lines = diff_content.splitlines()
-    current_file: Optional[str] = None
-    content_accumulator: Dict[str, List[str]] = {}
-    in_hunk = False
+    return [
+        {'filename': fname, 'content': content}
+        for fname, content in iter_diff_file(diff_content)
+    ]
 
-    for line in lines:
-        if line.startswith('+++ '):
-            # Start of file header; extract filename
-            m = re.match(r'\+\+\+ [ab]/(.+)', line)
-            current_file = m.group(1) if m else None
-            if current_file and current_file not in content_accumulator:
-                content_accumulator[current_file] = []
-            in_hunk = False
-            continue
 
-        if line.startswith('@@ '):
-            # Enter a hunk for the current file
-            in_hunk = True
-            continue
+def iter_diff_file(diff_content: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield ``(filename, content)`` for each changed file in a unified diff.
 
-        if current_file and in_hunk:
-            if line.startswith(('+++ ', '--- ', '@@ ')):
-                # Header or next hunk marker
-                if line.startswith('@@ '):
-                    in_hunk = True
-                else:
-                    in_hunk = False
-                continue
-            if line.startswith(('+', ' ')):
-                content_accumulator[current_file].append(line[1:])
-            # skip removed lines starting with '-'
-
-    for fname, parts in content_accumulator.items():
-        if parts:
-            files.append({'filename': fname, 'content': '\n'.join(parts)})
+    The diff is parsed up front (a file may appear in several sections),
+    but each file's content is only joined when the consumer reaches it,
+    so stopping early or skipping entries avoids building unused strings.
 
-    return files
+    Args:
+        diff_content (str): Raw diff content in unified format
+
+    Yields:
+        Tuple[str, str]: Filename and the same content :func:`parse_diff_file` reports
+    """
+    for fname, parts in parse_diff_file_lines(diff_content).items():
+        yield fname, '\n'.join(parts)
+
+
+def parse_diff_file_lines(diff_content: str) -> Dict[str, List[str]]:
+    """
+    Parse unified diff content into the kept lines of each changed file.
+
+    This is :func:`parse_diff_file` without the final join, so callers that
+    only need some of the files can skip building content for the rest;
+    ``'\n'.join(lines)`` gives the same ``content`` string.
+
+    Args:
+        diff_content (str): Raw diff content in unified format
+
+    Returns:
+        Dict[str, List[str]]: Filename to added/context lines, in diff order;
+        files without any kept lines are omitted
+    """
+    # Lines are only kept inside hunks, so a diff without a hunk header
+    # (empty, whitespace, or header-only) has nothing to report.
+    if '@@ ' not in diff_content:
+        return {}
+    content_accumulator: Dict[str, List[str]] = {}
+    current_lines: Optional[List[str]] = None
+    in_hunk = False
+
+    # Dispatch on the first character so most lines cost one slice and one
+    # comparison instead of a chain of startswith calls.
+    for line in diff_content.splitlines():
+        marker = line[:1]
+        if marker == ' ':
+            if in_hunk and current_lines is not None:
+                current_lines.append(line[1:])
+        elif marker == '+':
+            if line.startswith('+++ '):
+                # Start of file header; extract filename
+                m = _FILE_HEADER_RE.match(line)
+                current_lines = content_accumulator.setdefault(m.group(1), []) if m else None
+                in_hunk = False
+            elif in_hunk and current_lines is not None:
+                current_lines.append(line[1:])
+        elif marker == '@':
+            if line.startswith('@@ '):
+                # Enter a hunk for the current file
+                in_hunk = True
+        elif marker == '-':
+            # Removed lines are skipped; a '--- ' header ends the hunk
+            if line.startswith('--- '):
+                in_hunk = False
+
+    return {fname: parts for fname, parts in content_accumulator.items() if parts}
 
 
 def parse_diff_file_enhanced(
@@ -301,7 +341,7 @@ def parse_diff_file_enhanced(
         # ── File header ────────────────────────────────────────────────
         if line.startswith('+++ '):
             _flush_post_context()
-            m = re.match(r'\+\+\+ [ab]/(.+)', line)
+            m = _FILE_HEADER_RE.match(line)
             current_file = m.group(1) if m else None
             if current_file and current_file not in results_map:
                 results_map[current_file] = EnhancedDiffFile(
@@ -551,6 +591,40 @@ def get_diff_from_commits(project_path: str, commit_range: str) -> Optional[str]
         return None
 
 
+def resolve_commit_range(project_path: str, commit_range: str) -> Optional[str]:
+    """
+    Resolve a Git commit range to the commit ids it currently names.
+
+    The result changes whenever any ref in the range moves, so callers can
+    use it to tell whether a previously generated diff is still current.
+
+    Args:
+        project_path (str): Path to the repository (or a subdirectory of it)
+        commit_range (str): Git commit range, e.g. 'HEAD~1..HEAD'
+
+    Returns:
+        Optional[str]: ``git rev-parse`` output for the range, or None for
+        non-Git projects and when the range cannot be resolved quickly
+    """
+    if detect_vcs_type(project_path) != 'git':
+        return None
+
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', commit_range],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            check=True,
+            encoding="utf-8", errors="replace",
+            timeout=_REV_PARSE_TIMEOUT_SECS,
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError) as exc:
+        logger.debug("Could not resolve commit range %s: %s", commit_range, exc)
+        return None
+    return result.stdout.strip() or None
+
+
 def scan_project_with_scope(directory: Optional[str], scope: str = 'project', diff_file: Optional[str] = None, commits: Optional[str] = None) -> List[Any]:
     """
     Scan project files based on the specified review scope.
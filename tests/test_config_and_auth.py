@@ -41,8 +41,42 @@ def test_config_new_sections():
 
 def test_config_set_value():
     config = Config()
-    config.set_value('backend', 'type', 'kiro')
+    assert config.set_value('backend', 'type', 'kiro') is True
     assert config.get('backend', 'type') == 'kiro'
+    assert config.set_value('backend', 'type', 'kiro') is False
+    assert config.set_value('new_section', 'key', 'value') is True
+    assert config.has_unsaved_changes is True
+
+
+def test_config_reset_to_defaults_restores_builtin_values():
+    config = Config()
+    config.set_value('backend', 'type', 'kiro')
+    config.set_value('custom', 'key', 'value')
+
+    config.reset_to_defaults()
+    first = {section: dict(config.config.items(section)) for section in config.config.sections()}
+    config.set_value('gui', 'theme', 'dark')
+    config.reset_to_defaults()
+
+    assert config.get('backend', 'type') == 'bedrock'
+    assert config.get('gui', 'theme') == 'system'
+    assert not config.config.has_section('custom')
+    assert {section: dict(config.config.items(section)) for section in config.config.sections()} == first
+
+
+def test_config_snapshot_and_update():
+    config = Config()
+    config.update('gui', {'project_path': '/work/app', 'refresh_ms': 'oops', 'poll_ms': '250'})
+
+    snapshot = config.snapshot('gui')
+
+    assert snapshot['project_path'] == '/work/app'
+    assert snapshot['poll_ms'] == 250
+    assert snapshot['refresh_ms'] == 'oops'
+    assert config.snapshot('missing') == {}
+
+    config.set_value('gui', 'project_path', '/other')
+    assert snapshot['project_path'] == '/work/app'
 
 
 # ── Auth / Language ────────────────────────────────────────────────────────
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 from aicodereviewer.execution import ReviewExecutionRuntime, ReviewExecutionService, ReviewRequest
 from aicodereviewer.models import ReviewIssue
 
@@ -111,4 +113,50 @@ def test_runtime_skips_artifacts_outside_allowed_roots(tmp_path) -> None:
     runtime.wait_for_job(job.job_id, timeout=2.0)
 
     assert runtime.list_job_artifacts(job.job_id) == []
-    runtime.shutdown(wait=True, timeout=2.0)
\ No newline at end of file
+    runtime.shutdown(wait=True, timeout=2.0)
+
+
+def test_runtime_runs_queued_jobs_on_the_finishing_worker_thread() -> None:
+    started_threads: list[threading.Thread] = []
+    job_threads: list[str] = []
+    release_first = threading.Event()
+
+    def _thread_factory(**kwargs):
+        thread = threading.Thread(**kwargs)
+        started_threads.append(thread)
+        return thread
+
+    def _executor(job, _sink, _cancel_event) -> None:
+        job_threads.append(threading.current_thread().name)
+        if len(job_threads) == 1:
+            release_first.wait(timeout=2.0)
+        job.state = "completed"
+
+    runtime = ReviewExecutionRuntime(
+        execution_service=ReviewExecutionService(scan_fn=lambda *_args: []),
+        backend_factory=lambda _backend_name: object(),
+        thread_factory=_thread_factory,
+    )
+    request = ReviewRequest(
+        path="./proj",
+        scope="project",
+        diff_file=None,
+        commits=None,
+        review_types=["security"],
+        spec_content=None,
+        target_lang="en",
+        backend_name="local",
+        dry_run=True,
+    )
+
+    first = runtime.submit_job(request, executor=_executor)
+    second = runtime.submit_job(request, executor=_executor)
+    assert runtime.get_queue_position(second.job_id) == 1
+    release_first.set()
+    runtime.wait_for_job(first.job_id, timeout=2.0)
+    runtime.wait_for_job(second.job_id, timeout=2.0)
+
+    assert len(started_threads) == 1
+    assert len(job_threads) == 2
+    assert job_threads[0] == job_threads[1]
+    runtime.shutdown(wait=True, timeout=2.0)
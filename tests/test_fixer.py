@@ -189,6 +189,29 @@ class TestApplyAIFix:
         assert result.diagnostic.retryable is True
         assert result.diagnostic.retry_delay_seconds == 30
 
+    def test_generate_ai_fix_result_uses_supplied_code_without_reading(self):
+        mock_client = MagicMock()
+        mock_client.get_fix.return_value = "fixed code"
+
+        issue = ReviewIssue(
+            file_path="/path/to/test.py",
+            issue_type="security",
+            severity="high",
+            description="Test issue",
+            code_snippet="code",
+            ai_feedback="feedback"
+        )
+
+        with patch('builtins.open', MagicMock()) as mock_open, \
+             patch('os.path.getsize', return_value=1000):
+            result = generate_ai_fix_result(
+                issue, mock_client, "security", "en", current_code="cached code"
+            )
+
+        mock_open.assert_not_called()
+        assert result.content == "fixed code"
+        assert mock_client.get_fix.call_args.args[0] == "cached code"
+
     def test_generate_ai_fix_result_rejects_review_json_payload(self):
         mock_client = MagicMock()
         mock_client.get_fix.return_value = (
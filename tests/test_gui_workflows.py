@@ -2097,6 +2097,22 @@ def test_review_validation_uses_localized_selected_file_requirement_toast(
     )
 
 
+def test_review_spec_file_is_read_with_size_limit(
+    harness: GuiTestHarness,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    spec_path = tmp_path / "spec.md"
+    spec_path.write_text("0123456789", encoding="utf-8")
+
+    assert harness.app._load_spec_content(str(spec_path)) == "0123456789"
+
+    monkeypatch.setattr(harness.app, "_MAX_SPEC_BYTES", 4)
+    with pytest.raises(ValueError) as excinfo:
+        harness.app._load_spec_content(str(spec_path))
+    assert str(excinfo.value) == t("gui.val.spec_too_large", limit=0)
+
+
 def test_dry_run_workflow_switches_to_log_tab_and_records_output(
     harness: GuiTestHarness,
     monkeypatch: pytest.MonkeyPatch,
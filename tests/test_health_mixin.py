@@ -5,6 +5,7 @@ from types import SimpleNamespace
 
 import aicodereviewer.gui.health_mixin as health_mixin
 from aicodereviewer.gui.health_mixin import HealthMixin
+from aicodereviewer.gui.review_runtime import ActiveModelRefreshController
 
 
 class _DummyController:
@@ -17,8 +18,9 @@ class _DummyController:
         self.begin_calls.append(backend_name)
         return self.allow_begin
 
-    def finish(self, backend_name: str) -> None:
+    def finish(self, backend_name: str) -> list[Any]:
         self.finish_calls.append(backend_name)
+        return []
 
 
 class _DummyCombo:
@@ -126,6 +128,41 @@ def test_refresh_kiro_model_list_async_skips_work_when_refresh_is_already_active
     assert combo.set_calls == []
 
 
+def test_refresh_kiro_model_list_async_runs_on_done_after_models_are_applied(monkeypatch: Any) -> None:
+    controller = ActiveModelRefreshController()
+    combo = _DummyCombo("claude-sonnet-4")
+    harness = _Harness(controller, combo)  # type: ignore[arg-type]
+    events: list[str] = []
+
+    monkeypatch.setattr(health_mixin, "get_kiro_models", lambda *_args: ["claude-sonnet-4"])
+    monkeypatch.setattr(health_mixin.threading, "Thread", _ImmediateThread)
+    monkeypatch.setattr(
+        harness,
+        "_apply_kiro_models",
+        lambda models: events.append(f"apply:{len(models)}"),
+        raising=False,
+    )
+
+    harness._refresh_kiro_model_list_async(on_done=lambda: events.append("done"))
+
+    assert events == ["apply:1", "done"]
+    assert controller.in_progress == set()
+    assert controller.done_callbacks == {}
+
+
+def test_refresh_kiro_model_list_async_defers_on_done_to_active_refresh() -> None:
+    controller = ActiveModelRefreshController()
+    harness = _Harness(controller, _DummyCombo(""))  # type: ignore[arg-type]
+    events: list[str] = []
+    assert controller.begin("kiro") is True
+
+    harness._refresh_kiro_model_list_async(on_done=lambda: events.append("done"))
+
+    assert events == []
+    harness._finish_model_refresh("kiro")
+    assert events == ["done"]
+
+
 def test_split_fix_hint_url_extracts_before_url_and_after() -> None:
     parts = HealthMixin._split_fix_hint_url(
         "Install the AWS CLI from https://aws.amazon.com/cli/ and run 'aws configure sso'."
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import pytest
+
+from aicodereviewer.gui.popup_surfaces import (
+    PopupSurfaceRecoveryStore,
+    _build_side_by_side_diff,
+    _compile_find_pattern,
+    _content_digest,
+    _find_literal_spans,
+    _line_diff_opcodes,
+    _line_number_labels,
+    _line_start_offsets,
+    _matches_ignoring_trailing_newlines,
+    _shared_user_pane_matcher,
+    _tagged_insert_args,
+    _text_index_for_offset,
+    _UserPaneMatcher,
+    _user_pane_opcodes,
+    _user_pane_rows,
+    _write_text_atomic,
+)
+
+
+def test_line_start_offsets_track_each_line() -> None:
+    assert _line_start_offsets("") == [0]
+    assert _line_start_offsets("ab\ncd\n\nx") == [0, 3, 6, 7]
+
+
+def test_line_number_labels_match_gutter_format() -> None:
+    assert _line_number_labels(1, 4) == ["   1", "   2", "   3"]
+    assert _line_number_labels(9998, 10001) == [f"{line:>4}" for line in range(9998, 10001)]
+    assert _line_number_labels(5, 5) == []
+
+
+def test_text_index_for_offset_maps_to_tk_line_column() -> None:
+    source = "alpha\nbeta\n\ngamma"
+    line_starts = _line_start_offsets(source)
+
+    assert _text_index_for_offset(line_starts, 0) == "1.0"
+    assert _text_index_for_offset(line_starts, source.index("beta")) == "2.0"
+    assert _text_index_for_offset(line_starts, source.index("ta")) == "2.2"
+    assert _text_index_for_offset(line_starts, source.index("gamma") + 2) == "4.2"
+    assert _text_index_for_offset(line_starts, 5) == "1.5"
+    assert _text_index_for_offset(line_starts, source.index("beta"), line_offset=9) == "11.0"
+
+
+def test_compile_find_pattern_escapes_query_and_honours_case() -> None:
+    pattern = _compile_find_pattern("a.b", True)
+
+    assert pattern is _compile_find_pattern("a.b", True)
+    assert [match.start() for match in pattern.finditer("A.B axb a.b")] == [0, 8]
+    assert _compile_find_pattern("a.b", False).findall("A.B a.b") == ["a.b"]
+
+
+def test_content_digest_detects_edits_but_not_identical_text() -> None:
+    original = "def alpha():\n    return 1\n"
+
+    assert _content_digest(original) == _content_digest("".join(["def alpha():\n", "    return 1\n"]))
+    assert _content_digest(original) != _content_digest(original.replace("1", "2"))
+    assert len(_content_digest(original)) == 16
+
+
+def test_find_literal_spans_returns_non_overlapping_matches() -> None:
+    assert _find_literal_spans("aaaa", "aa", False) == [(0, 2), (2, 4)]
+    assert _find_literal_spans("Foo foo FOO", "foo", False) == [(4, 7)]
+    assert _find_literal_spans("Foo foo FOO", "foo", True) == [(0, 3), (4, 7), (8, 11)]
+    assert _find_literal_spans("abc", "x", True) == []
+
+
+def test_find_literal_spans_falls_back_when_lowercasing_changes_offsets() -> None:
+    source = "\u0130x ix"
+
+    assert _find_literal_spans(source, "ix", True) == [(0, 2), (3, 5)]
+
+
+def _apply_opcodes(a_lines: list[str], b_lines: list[str], opcodes) -> list[str]:
+    rebuilt: list[str] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        rebuilt.extend(a_lines[i1:i2] if tag == "equal" else b_lines[j1:j2])
+    return rebuilt
+
+
+def test_matches_ignoring_trailing_newlines_only_tolerates_newline_tail() -> None:
+    assert _matches_ignoring_trailing_newlines("a\nb", "a\nb")
+    assert _matches_ignoring_trailing_newlines("a\nb\n\n", "a\nb")
+    assert _matches_ignoring_trailing_newlines("\n", "")
+    assert not _matches_ignoring_trailing_newlines("a\nb \n", "a\nb")
+    assert not _matches_ignoring_trailing_newlines("a\nbc\n", "a\nb")
+    assert not _matches_ignoring_trailing_newlines("a\n", "a\nb")
+
+
+def test_line_diff_opcodes_trim_common_prefix_and_suffix() -> None:
+    a_lines = ["head", "a", "old", "tail"]
+    b_lines = ["head", "a", "new", "extra", "tail"]
+
+    opcodes = _line_diff_opcodes(a_lines, b_lines)
+
+    assert opcodes[0] == ("equal", 0, 2, 0, 2)
+    assert opcodes[-1] == ("equal", 3, 4, 4, 5)
+    assert _apply_opcodes(a_lines, b_lines, opcodes) == b_lines
+    assert _line_diff_opcodes(["same"], ["same"]) == [("equal", 0, 1, 0, 1)]
+    assert _line_diff_opcodes([], []) == []
+
+
+def test_line_diff_opcodes_cover_both_sequences() -> None:
+    import random
+
+    rng = random.Random(7)
+    for _ in range(50):
+        a_lines = [rng.choice("abcde") for _ in range(rng.randint(0, 12))]
+        b_lines = [rng.choice("abcde") for _ in range(rng.randint(0, 12))]
+        opcodes = _line_diff_opcodes(a_lines, b_lines)
+        assert _apply_opcodes(a_lines, b_lines, opcodes) == b_lines
+        assert sum(i2 - i1 for _tag, i1, i2, _j1, _j2 in opcodes) == len(a_lines)
+
+
+def test_build_side_by_side_diff_pads_and_tags_each_side() -> None:
+    left, right, left_tags, right_tags = _build_side_by_side_diff(
+        ["keep", "old", "gone", "end"],
+        ["keep", "new", "end", "added"],
+    )
+
+    assert len(left) == len(right) == len(left_tags) == len(right_tags)
+    assert left[0] == right[0] == "keep"
+    assert left_tags[0] == right_tags[0] == "ctx"
+    assert [line for line, tag in zip(left, left_tags) if tag == "rem"] == ["old", "gone"]
+    assert [line for line, tag in zip(right, right_tags) if tag == "add"] == ["new", "added"]
+    assert all(line == "" for line, tag in zip(left + right, left_tags + right_tags) if tag == "pad")
+
+
+def test_build_side_by_side_diff_keeps_every_line_in_order() -> None:
+    import random
+
+    rng = random.Random(11)
+    for _ in range(50):
+        a_lines = [rng.choice("abcde") for _ in range(rng.randint(0, 12))]
+        b_lines = [rng.choice("abcde") for _ in range(rng.randint(0, 12))]
+        left, right, left_tags, right_tags = _build_side_by_side_diff(a_lines, b_lines)
+        assert len(left) == len(right) == len(left_tags) == len(right_tags)
+        assert [line for line, tag in zip(left, left_tags) if tag != "pad"] == a_lines
+        assert [line for line, tag in zip(right, right_tags) if tag != "pad"] == b_lines
+        assert all(
+            (left_tag == "ctx") == (right_tag == "ctx")
+            for left_tag, right_tag in zip(left_tags, right_tags)
+        )
+
+
+def test_user_pane_opcodes_rebuild_user_lines_and_merge_blocks() -> None:
+    ai_lines = ["def a():", "", "    return 1", "", "", "def b():", "    return 2"]
+    user_lines = ["def a():", "", "    return 10", "", "", "", "def b():", "    return 2", "x = 1"]
+
+    opcodes = _user_pane_opcodes(ai_lines, user_lines)
+
+    assert _apply_opcodes(ai_lines, user_lines, opcodes) == user_lines
+    assert all(
+        not (left[0] == right[0] and left[2] == right[1] and left[4] == right[3])
+        for left, right in zip(opcodes, opcodes[1:])
+    )
+
+
+def test_user_pane_rows_pad_removed_lines() -> None:
+    ai_lines = ["a", "b", "c", "d"]
+    user_lines = ["a", "B", "d", "e"]
+
+    rows, tags = _user_pane_rows(ai_lines, user_lines, _user_pane_opcodes(ai_lines, user_lines))
+
+    assert len(rows) == len(tags)
+    assert [row for row, tag in zip(rows, tags) if tag != "pad"] == user_lines
+    assert tags.count("pad") == 1
+    assert tags[0] == "ctx"
+
+
+def test_tagged_insert_args_group_runs_by_tag() -> None:
+    args = _tagged_insert_args(["a", "b", "c", "", "d"], ["ctx", "ctx", "add", "pad", "ctx"])
+
+    assert args == ["a\nb\n", (), "c\n", "add", "\n", "pad", "d\n", ()]
+    assert _tagged_insert_args([], []) == []
+
+
+def test_user_pane_opcodes_cover_both_sequences() -> None:
+    import random
+
+    rng = random.Random(5)
+    for _ in range(50):
+        ai_lines = [rng.choice(["a", "b", "", "  ", "c"]) for _ in range(rng.randint(0, 12))]
+        user_lines = [rng.choice(["a", "b", "", "  ", "c"]) for _ in range(rng.randint(0, 12))]
+        opcodes = _user_pane_opcodes(ai_lines, user_lines)
+        assert _apply_opcodes(ai_lines, user_lines, opcodes) == user_lines
+        assert sum(i2 - i1 for _tag, i1, i2, _j1, _j2 in opcodes) == len(ai_lines)
+
+
+def test_user_pane_matcher_reuse_matches_fresh_alignment() -> None:
+    import random
+
+    rng = random.Random(11)
+    ai_lines = [rng.choice(["a", "b", "", "c", "d"]) for _ in range(30)]
+    matcher = _UserPaneMatcher(ai_lines)
+    user_lines = list(ai_lines)
+    for _ in range(40):
+        position = rng.randrange(len(user_lines) + 1)
+        if user_lines and rng.random() < 0.5:
+            del user_lines[min(position, len(user_lines) - 1)]
+        else:
+            user_lines.insert(position, rng.choice(["a", "x", "", "c"]))
+        opcodes = matcher.opcodes(user_lines)
+        assert opcodes == _user_pane_opcodes(ai_lines, user_lines)
+        assert _apply_opcodes(ai_lines, user_lines, opcodes) == user_lines
+
+
+def test_user_pane_opcodes_pad_changed_block_once() -> None:
+    ai_lines = ["a", "b", "c", "d"]
+    user_lines = ["a", "B", "d", "e"]
+    expected = [("equal", 0, 1, 0, 1), ("replace", 1, 3, 1, 2), ("equal", 3, 4, 2, 3), ("insert", 4, 4, 3, 4)]
+
+    assert _user_pane_opcodes(ai_lines, user_lines) == expected
+
+
+def test_shared_user_pane_matcher_reuses_per_file_until_fix_changes(monkeypatch) -> None:
+    monkeypatch.setattr("aicodereviewer.gui.popup_surfaces.USER_PANE_MATCHER_POOL_SIZE", 2)
+    from collections import OrderedDict
+
+    monkeypatch.setattr("aicodereviewer.gui.popup_surfaces._USER_PANE_MATCHERS", OrderedDict())
+
+    first = _shared_user_pane_matcher("a.py", "x\ny", ["x", "y"])
+
+    assert _shared_user_pane_matcher("a.py", "x\ny", ["x", "y"]) is first
+    changed = _shared_user_pane_matcher("a.py", "x\nz", ["x", "z"])
+    assert changed is not first
+    assert changed.ai_lines == ["x", "z"]
+
+    _shared_user_pane_matcher("b.py", "b", ["b"])
+    _shared_user_pane_matcher("c.py", "c", ["c"])
+    assert _shared_user_pane_matcher("a.py", "x\nz", ["x", "z"]) is not changed
+
+
+def test_write_text_atomic_replaces_file_and_keeps_mode(tmp_path) -> None:
+    import os
+    import stat
+
+    target = tmp_path / "script.py"
+    target.write_text("old\n", encoding="utf-8")
+    os.chmod(target, 0o755)
+
+    _write_text_atomic(str(target), "new ✓\n")
+
+    assert target.read_text(encoding="utf-8") == "new ✓\n"
+    assert stat.S_IMODE(target.stat().st_mode) == 0o755
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["script.py"]
+
+
+def test_write_text_atomic_leaves_target_untouched_on_failure(tmp_path, monkeypatch) -> None:
+    target = tmp_path / "a.py"
+    target.write_text("keep\n", encoding="utf-8")
+
+    def _fail_replace(_src, _dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("aicodereviewer.gui.popup_surfaces.os.replace", _fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        _write_text_atomic(str(target), "lost\n")
+
+    assert target.read_text(encoding="utf-8") == "keep\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.py"]
+
+
+def test_write_text_atomic_writes_through_symlink_and_spares_tmp_sibling(tmp_path) -> None:
+    real = tmp_path / "real.py"
+    real.write_text("old\n", encoding="utf-8")
+    link = tmp_path / "link.py"
+    link.symlink_to(real)
+    bystander = tmp_path / "link.py.tmp"
+    bystander.write_text("user data\n", encoding="utf-8")
+
+    _write_text_atomic(str(link), "new\n")
+
+    assert link.is_symlink()
+    assert real.read_text(encoding="utf-8") == "new\n"
+    assert bystander.read_text(encoding="utf-8") == "user data\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["link.py", "link.py.tmp", "real.py"]
+
+
+def test_recovery_store_round_trips_compact_payload(tmp_path) -> None:
+    class _SessionState:
+        def to_serialized_dict(self, *, saved_at):
+            return {"issues": [{"code_snippet": "print('é')\n" * 3}]}
+
+    store = PopupSurfaceRecoveryStore(tmp_path / "popup-recovery.json", _SessionState)
+    store.save_active_popup({"kind": "editor", "content": "x = 'ü'\n"})
+
+    raw = store.path.read_text(encoding="utf-8")
+    loaded = store.load()
+
+    assert "\n  " not in raw and "é" in raw
+    assert loaded is not None
+    assert loaded["active_popup"] == {"kind": "editor", "content": "x = 'ü'\n"}
+    assert loaded["session_state"] == {"issues": [{"code_snippet": "print('é')\n" * 3}]}
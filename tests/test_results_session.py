@@ -14,6 +14,7 @@ class _DummyWidget:
     def __init__(self) -> None:
         self.configured: dict[str, object] = {}
         self.destroyed = False
+        self.grid_forget_calls = 0
 
     def configure(self, **kwargs) -> None:
         self.configured.update(kwargs)
@@ -21,6 +22,9 @@ class _DummyWidget:
     def destroy(self) -> None:
         self.destroyed = True
 
+    def grid_forget(self) -> None:
+        self.grid_forget_calls += 1
+
 
 class _DummyFrame:
     def __init__(self, children=None) -> None:
@@ -53,6 +57,9 @@ class _DummyResultsApp(ResultsTabMixin):
         self.status_var = _DummyStatusVar()
         self.toasts: list[tuple[str, bool]] = []
         self.shown_issues: list[ReviewIssue] = []
+        self._retired_result_widgets: list[object] = []
+        self._retired_result_widget_set: set[object] = set()
+        self._retired_result_widgets_job = None
 
     @property
     def _session_path(self) -> Path:
@@ -141,6 +148,27 @@ def test_save_and_load_session_round_trips_report_context(monkeypatch, tmp_path:
     assert runner.last_job.state == 'awaiting_gui_finalize'
 
 
+def test_save_session_keeps_existing_file_when_encoding_fails(monkeypatch, tmp_path: Path) -> None:
+    session_path = tmp_path / 'session.json'
+    session_path.write_text('{"issues": []}', encoding='utf-8')
+    app = _DummyResultsApp(session_path)
+    app._issues = [ReviewIssue(file_path='a.py', issue_type='security', description='x')]
+    app._get_session_state = lambda: SimpleNamespace(
+        to_serialized_dict=lambda *, saved_at: {"issues": [object()]}
+    )
+    errors: list[str] = []
+    monkeypatch.setattr(
+        'aicodereviewer.gui.results_mixin.messagebox.showerror',
+        lambda _title, message: errors.append(message),
+    )
+
+    app._save_session()
+
+    assert errors
+    assert session_path.read_text(encoding='utf-8') == '{"issues": []}'
+    assert [path.name for path in tmp_path.iterdir()] == ['session.json']
+
+
 def test_finalize_without_report_context_preserves_loaded_issues() -> None:
     app = _DummyResultsApp(Path('session.json'))
     issue = ReviewIssue(file_path='a.py', issue_type='security', description='x')
@@ -209,4 +237,179 @@ def test_load_session_rejects_issue_file_path_outside_workspace(monkeypatch, tmp
     assert errors
     assert 'Session payload file paths must stay within the expected session roots' in errors[0]
     assert app._current_session_runner() is None
-    assert app.shown_issues == []
\ No newline at end of file
+    assert app.shown_issues == []
+
+
+def test_resolve_issue_spawns_external_editor_off_ui_thread(monkeypatch) -> None:
+    app = _DummyResultsApp(Path('session.json'))
+    issue = ReviewIssue(file_path='a.py', issue_type='security', description='x')
+    app._issue_cards = [{"issue": issue}]
+    ui_calls: list[tuple[object, tuple[object, ...]]] = []
+    refreshed: list[int] = []
+    spawned: list[list[str]] = []
+    app._run_on_ui_thread = lambda callback, *args: ui_calls.append((callback, args)) or True
+    app._refresh_status = refreshed.append
+    monkeypatch.setattr('aicodereviewer.gui.results_mixin.config.get', lambda *_args, **_kwargs: 'code')
+    monkeypatch.setattr('aicodereviewer.gui.results_mixin.subprocess.Popen', spawned.append)
+
+    app._resolve_issue(0)
+    app._editor_pool.shutdown(wait=True)
+
+    assert spawned == [['code', 'a.py']]
+    assert len(ui_calls) == 1
+    callback, args = ui_calls[0]
+    callback(*args)
+    assert issue.status == 'resolved'
+    assert issue.resolution_provenance == 'external_editor'
+    assert refreshed == [0]
+
+
+def test_resolve_issue_reports_external_editor_spawn_failure(monkeypatch) -> None:
+    app = _DummyResultsApp(Path('session.json'))
+    issue = ReviewIssue(file_path='a.py', issue_type='security', description='x')
+    app._issue_cards = [{"issue": issue}]
+    app._run_on_ui_thread = lambda callback, *args: callback(*args) or True
+    app._refresh_status = lambda _idx: None
+
+    def _missing_editor(_argv):
+        raise FileNotFoundError('no such editor')
+
+    monkeypatch.setattr('aicodereviewer.gui.results_mixin.config.get', lambda *_args, **_kwargs: 'missing-editor')
+    monkeypatch.setattr('aicodereviewer.gui.results_mixin.subprocess.Popen', _missing_editor)
+
+    app._resolve_issue(0)
+    app._editor_pool.shutdown(wait=True)
+
+    assert app.toasts == [('no such editor', True)]
+    assert issue.status == 'pending'
+
+
+def test_batch_ai_fix_worker_count_follows_parallel_processing_setting(monkeypatch) -> None:
+    settings = {"enable_parallel_processing": False}
+    monkeypatch.setattr(
+        'aicodereviewer.gui.results_mixin.config.get',
+        lambda _section, key, default=None: settings.get(key, default),
+    )
+
+    assert ResultsTabMixin._batch_ai_fix_worker_count(10) == 1
+
+    settings["enable_parallel_processing"] = True
+    assert ResultsTabMixin._batch_ai_fix_worker_count(2) == 2
+    assert ResultsTabMixin._batch_ai_fix_worker_count(10) == 4
+
+
+def test_generate_batch_fix_entry_uses_snippet_for_missing_files() -> None:
+    calls: list[dict[str, object]] = []
+
+    class _Client:
+        def get_fix(self, **kwargs):
+            calls.append(kwargs)
+            return "  fixed = True\n"
+
+    issue = ReviewIssue(
+        file_path='missing/does_not_exist.py',
+        issue_type='security',
+        description='desc',
+        code_snippet='fixed = False\n',
+    )
+
+    entry = ResultsTabMixin._generate_batch_fix_entry(issue, _Client(), 'en')
+
+    assert entry == {"status": "generated", "content": "fixed = True", "diagnostic": None}
+    assert calls[0]["code_content"] == 'fixed = False\n'
+
+
+def test_generate_batch_fix_entry_reports_backend_errors() -> None:
+    class _Client:
+        def get_fix(self, **_kwargs):
+            raise RuntimeError('backend offline')
+
+    issue = ReviewIssue(
+        file_path='missing/does_not_exist.py',
+        issue_type='security',
+        description='desc',
+        code_snippet='fixed = False\n',
+    )
+
+    entry = ResultsTabMixin._generate_batch_fix_entry(issue, _Client(), 'en')
+
+    assert entry["status"] == "failed"
+    assert entry["content"] is None
+    assert entry["diagnostic"] is not None
+
+
+def test_read_batch_fix_sources_reads_shared_files_once(tmp_path) -> None:
+    shared = tmp_path / "shared.py"
+    shared.write_text("shared = 1\n", encoding="utf-8")
+    single = tmp_path / "single.py"
+    single.write_text("single = 1\n", encoding="utf-8")
+    selected = [
+        (0, {"issue": ReviewIssue(file_path=str(shared), issue_type='security', description='a')}),
+        (1, {"issue": ReviewIssue(file_path=str(shared), issue_type='security', description='b')}),
+        (2, {"issue": ReviewIssue(file_path=str(single), issue_type='security', description='c')}),
+        (3, {"issue": ReviewIssue(file_path=str(tmp_path / "gone.py"), issue_type='security', description='d')}),
+        (4, {"issue": ReviewIssue(file_path=str(tmp_path / "gone.py"), issue_type='security', description='e')}),
+    ]
+
+    assert ResultsTabMixin._read_batch_fix_sources(selected) == {str(shared): "shared = 1\n"}
+
+
+def test_validate_loaded_session_state_resolves_each_file_path_once(monkeypatch, tmp_path: Path) -> None:
+    app = _DummyResultsApp(tmp_path / 'session.json')
+    shared_path = str(tmp_path / 'shared.py')
+    session_state = ReviewSessionState(
+        issues=[
+            ReviewIssue(file_path=shared_path, issue_type='security', description='first'),
+            ReviewIssue(file_path=shared_path, issue_type='security', description='second'),
+            ReviewIssue(file_path=str(tmp_path / 'other.py'), issue_type='security', description='third'),
+        ]
+    )
+    validated: list[str] = []
+    original = ResultsTabMixin._validate_session_issue_file_path
+
+    def _counting_validate(path_str: str, *, allowed_roots):
+        validated.append(path_str)
+        return original(path_str, allowed_roots=allowed_roots)
+
+    monkeypatch.setattr(ResultsTabMixin, '_validate_session_issue_file_path', staticmethod(_counting_validate))
+
+    result = app._validate_loaded_session_state(session_state)
+
+    assert validated == [shared_path, str(tmp_path / 'other.py')]
+    assert [issue.description for issue in result.issues] == ['first', 'second', 'third']
+    assert result.issues[0].file_path == result.issues[1].file_path
+
+
+def test_refresh_many_recomputes_buttons_and_filters_once() -> None:
+    app = _DummyResultsApp(Path('session.json'))
+    calls: list[object] = []
+    app._refresh_card_status = calls.append
+    app._update_bottom_buttons = lambda: calls.append('buttons')
+    app._apply_filters = lambda: calls.append('filters')
+
+    app._refresh_many([])
+    assert calls == []
+
+    app._refresh_many([0, 2, 3])
+    assert calls == [0, 2, 3, 'buttons', 'filters']
+
+
+def test_retire_result_widgets_queues_each_widget_once() -> None:
+    app = _DummyResultsApp(Path('session.json'))
+    widgets = [_DummyWidget() for _ in range(3)]
+    app.results_frame = _DummyFrame(widgets)
+    scheduled: list[object] = []
+    app._schedule_app_after = lambda _delay, callback: scheduled.append(callback) or 'job'
+
+    app._retire_result_widgets()
+    app._retire_result_widgets()
+
+    assert app._retired_result_widgets == widgets
+    assert [widget.grid_forget_calls for widget in widgets] == [1, 1, 1]
+    assert len(scheduled) == 1
+
+    scheduled.pop()()
+
+    assert all(widget.destroyed for widget in widgets)
+    assert app._retired_result_widgets == []
+    assert app._retired_result_widget_set == set()
@@ -5,17 +5,23 @@ import threading
 import time
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-from aicodereviewer.execution import ReviewExecutionResult, ReviewExecutionRuntime, ReviewRequest
+from aicodereviewer.execution import JobProgressUpdated, ReviewExecutionResult, ReviewExecutionRuntime, ReviewRequest
 from aicodereviewer.models import ReviewIssue
 from aicodereviewer.gui.review_execution_coordinator import ReviewExecutionCoordinator, ReviewExecutionOutcome
-from aicodereviewer.gui.review_execution_facade import ReviewExecutionFacade
+from aicodereviewer.gui import review_execution_facade
+from aicodereviewer.gui.review_execution_facade import ReviewExecutionFacade, _files_by_relative_name
 from aicodereviewer.gui.review_execution_scheduler import ReviewExecutionScheduler
+from aicodereviewer.gui.review_mixin import ReviewTabMixin
 from aicodereviewer.gui.review_runtime import ActiveReviewController
 from aicodereviewer.http_api import LocalReviewHttpService
 from aicodereviewer.review_definitions import install_review_registry
+from aicodereviewer.scanner import parse_diff_file_lines
 
 
 def test_review_execution_scheduler_uses_runtime_jobs_visible_to_http() -> None:
@@ -138,6 +144,45 @@ def test_review_execution_scheduler_normalizes_no_report_outcomes_into_completed
     assert scheduler.get_submission_snapshot(submission.submission_id) is not None
 
 
+def test_review_execution_scheduler_accepts_specification_review_built_from_gui_params(tmp_path: Path) -> None:
+    install_review_registry([])
+    runtime = ReviewExecutionRuntime()
+    scheduler = ReviewExecutionScheduler(
+        ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController())),
+        runtime,
+    )
+    spec_path = tmp_path / "spec.md"
+    spec_path.write_bytes(b"The tool must log\r\nevery request.")
+    loader = SimpleNamespace(_MAX_SPEC_BYTES=ReviewTabMixin._MAX_SPEC_BYTES)
+    params = {
+        "path": "./project",
+        "scope": "project",
+        "review_types": ["specification"],
+        "spec_content": ReviewTabMixin._load_spec_content(loader, str(spec_path)),  # type: ignore[arg-type]
+        "target_lang": "en",
+        "backend": "local",
+    }
+    seen_specs: list[str | None] = []
+
+    def _execute(job, _cancel_event, _sink):
+        seen_specs.append(job.request.spec_content)
+        return ReviewExecutionOutcome(kind="dry_run_complete")
+
+    submission = scheduler.submit_run(
+        request=ReviewTabMixin._build_review_request(params, dry_run=True),
+        submission_kind="dry_run",
+        execute_run=_execute,
+        on_outcome=lambda _outcome: None,
+        on_error=lambda exc: (_ for _ in ()).throw(exc),
+        on_finished=lambda: None,
+    )
+
+    job = runtime.wait_for_job(submission.submission_id, timeout=2.0)
+
+    assert job.state == "completed"
+    assert seen_specs == ["The tool must log\nevery request."]
+
+
 def test_review_execution_scheduler_normalizes_issue_outcomes_into_pending_runtime_jobs() -> None:
     install_review_registry([])
     runtime = ReviewExecutionRuntime()
@@ -194,4 +239,364 @@ def test_review_execution_scheduler_normalizes_issue_outcomes_into_pending_runti
     assert job.result is not None
     assert job.result.status == "issues_found"
     assert job.result.issue_count == 1
-    assert scheduler.get_submission_snapshot(submission.submission_id) is None
\ No newline at end of file
+    assert scheduler.get_submission_snapshot(submission.submission_id) is None
+
+
+def test_review_execution_facade_scan_function_filters_selected_files(tmp_path: Path) -> None:
+    first = tmp_path / "a.py"
+    second = tmp_path / "b.py"
+    first.write_text("a", encoding="utf-8")
+    second.write_text("b", encoding="utf-8")
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+
+    scan_fn = facade.build_scan_function(
+        directory=str(tmp_path),
+        selected_files=[str(tmp_path / "." / "b.py")],
+        diff_filter_file=None,
+        diff_filter_commits=None,
+        scan_project_with_scope_fn=lambda _directory, _scope, *_args: [first, second],
+        get_diff_from_commits_fn=lambda _directory, _commits: None,
+        parse_diff_file_fn=lambda _content: [],
+    )
+
+    assert scan_fn(str(tmp_path), "project") == [second]
+
+
+def test_review_execution_facade_scan_function_matches_selected_files_through_symlinks(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "a.py").write_text("a", encoding="utf-8")
+    alias = tmp_path / "alias"
+    try:
+        alias.symlink_to(project, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks are not available")
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+
+    scan_fn = facade.build_scan_function(
+        directory=str(alias),
+        selected_files=[str(project / "a.py")],
+        diff_filter_file=None,
+        diff_filter_commits=None,
+        scan_project_with_scope_fn=lambda _directory, _scope, *_args: [alias / "a.py"],
+        get_diff_from_commits_fn=lambda _directory, _commits: None,
+        parse_diff_file_fn=lambda _content: [],
+    )
+
+    assert scan_fn(str(alias), "project") == [alias / "a.py"]
+
+
+def test_review_execution_facade_prefetch_scan_reuses_result_once() -> None:
+    calls: list[tuple[object, ...]] = []
+
+    def _scan(*args: object) -> list[str]:
+        calls.append(args)
+        return [f"scan-{len(calls)}"]
+
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    scan_fn = facade.prefetch_scan(_scan, "./project", "project", None, None)
+
+    assert scan_fn("./project", "project", None, None) == ["scan-1"]
+    assert scan_fn("./project", "project", None, None) == ["scan-2"]
+    assert scan_fn("./other", "project", None, None) == ["scan-3"]
+    assert calls == [
+        ("./project", "project", None, None),
+        ("./project", "project", None, None),
+        ("./other", "project", None, None),
+    ]
+
+
+def test_review_execution_facade_discards_prefetched_scan_when_activation_fails(caplog) -> None:
+    def _scan(*_args: object) -> list[str]:
+        raise RuntimeError("scan failed")
+
+    def _create_client(_backend: str) -> object:
+        raise RuntimeError("backend unavailable")
+
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    scan_fn = facade.prefetch_scan(_scan, "./project", "project", None, None)
+
+    with caplog.at_level("WARNING", logger=review_execution_facade.__name__):
+        with pytest.raises(RuntimeError, match="backend unavailable"):
+            facade.activate_client(scan_fn, "local", _create_client, lambda _status: None)
+        deadline = time.monotonic() + 5
+        while "Discarded project scan failed" not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert "Discarded project scan failed" in caplog.text
+
+
+def test_review_execution_facade_returns_cancelled_before_running_after_activation() -> None:
+    cancel_event = threading.Event()
+    runners: list[object] = []
+
+    def _create_client(_backend: str) -> object:
+        cancel_event.set()
+        return object()
+
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    outcome = facade.execute_run(
+        params={"backend": "local", "path": "./project", "scope": "project"},
+        dry_run=False,
+        cancel_check=cancel_event.is_set,
+        publish_status=lambda _status: None,
+        create_client=_create_client,
+        create_runner=lambda *args, **kwargs: runners.append(args),
+        event_sink=None,
+        scan_project_with_scope_fn=lambda *_args: [],
+        get_diff_from_commits_fn=lambda _directory, _commits: None,
+        parse_diff_file_fn=lambda _content: [],
+    )
+
+    assert outcome.kind == "cancelled"
+    assert runners == []
+
+
+def test_review_execution_facade_reuses_selected_path_keys_for_same_selection(tmp_path: Path) -> None:
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    selection = [str(tmp_path / "a.py"), str(tmp_path / "b.py")]
+
+    first = facade._selected_path_keys(selection)
+
+    assert facade._selected_path_keys(list(selection)) is first
+    assert facade._selected_path_keys(selection[:1]) is not first
+    assert len(facade._selected_keys_cache) == 1
+
+
+def test_review_execution_facade_reuses_commit_diff_while_range_is_unchanged(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("a", encoding="utf-8")
+    diff_calls: list[str] = []
+    resolved = {"value": "sha-2\n^sha-1"}
+
+    def _get_diff(_directory: str, commits: str) -> str:
+        diff_calls.append(commits)
+        return "diff --git a/a.py b/a.py\n"
+
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    scan_fn = facade.build_scan_function(
+        directory=str(tmp_path),
+        selected_files=None,
+        diff_filter_file=None,
+        diff_filter_commits="HEAD~1..HEAD",
+        scan_project_with_scope_fn=lambda _directory, _scope, *_args: [tmp_path / "a.py"],
+        get_diff_from_commits_fn=_get_diff,
+        parse_diff_file_fn=lambda _content: [{"filename": "a.py", "content": "+a"}],
+        resolve_commit_range_fn=lambda _directory, _commits: resolved["value"],
+    )
+
+    assert len(scan_fn(str(tmp_path), "project")) == 1
+    assert len(scan_fn(str(tmp_path), "project")) == 1
+    assert diff_calls == ["HEAD~1..HEAD"]
+
+    resolved["value"] = "sha-3\n^sha-2"
+    scan_fn(str(tmp_path), "project")
+    assert diff_calls == ["HEAD~1..HEAD", "HEAD~1..HEAD"]
+
+
+def test_review_execution_facade_diff_filter_joins_only_matching_files(tmp_path: Path) -> None:
+    diff_path = tmp_path / "changes.diff"
+    diff_path.write_text("diff", encoding="utf-8")
+    scanned_path = tmp_path / "src" / "a.py"
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+
+    scan_fn = facade.build_scan_function(
+        directory=str(tmp_path),
+        selected_files=None,
+        diff_filter_file=str(diff_path),
+        diff_filter_commits=None,
+        scan_project_with_scope_fn=lambda _directory, _scope, *_args: [scanned_path],
+        get_diff_from_commits_fn=lambda _directory, _commits: None,
+        parse_diff_file_fn=lambda _content: (_ for _ in ()).throw(AssertionError("unused")),
+        parse_diff_lines_fn=lambda _content: {"src/a.py": ["one", "two"], "src/b.py": ["three"]},
+    )
+
+    entries = scan_fn(str(tmp_path), "project")
+    rerun_entries = scan_fn(str(tmp_path), "project")
+
+    assert entries == [{"path": scanned_path, "content": "one\ntwo", "filename": "src/a.py"}]
+    assert entries[0]["path"] is scanned_path
+    assert rerun_entries[0]["content"] is entries[0]["content"]
+
+
+def test_review_execution_facade_parses_large_diffs_in_helper_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(review_execution_facade, "_DIFF_PARSE_PROCESS_THRESHOLD", 0)
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    diff_content = "--- a/a.py\n+++ b/a.py\n@@ -1 +1,2 @@\n keep\n+added\n"
+    unused_parser = lambda _content: []
+
+    try:
+        assert facade._parsed_diff(diff_content, unused_parser, parse_diff_file_lines) == {
+            "a.py": ["keep", "added"]
+        }
+        assert facade._diff_parse_pool is not None
+        # Parsers that cannot be sent to the helper process run inline instead.
+        assert facade._parsed_diff("+b", unused_parser, lambda content: {"b.py": [content]}) == {
+            "b.py": ["+b"]
+        }
+    finally:
+        facade.shutdown()
+
+    assert facade._diff_parse_pool is None
+
+
+def test_files_by_relative_name_resolves_relative_run_directory(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    inside = str(tmp_path / "project" / "pkg" / "a.py")
+    outside = str(tmp_path / "other.py")
+
+    assert _files_by_relative_name([inside, outside], "project") == {
+        "pkg/a.py": inside,
+        outside.replace("\\", "/"): outside,
+    }
+
+
+def test_review_execution_facade_reuses_parsed_diff_for_identical_content() -> None:
+    parse_calls: list[str] = []
+
+    def _parse_lines(content: str) -> dict[str, list[str]]:
+        parse_calls.append(content)
+        return {"a.py": [content]}
+
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    unused_parser = lambda _content: []
+
+    first = facade._parsed_diff("+a", unused_parser, _parse_lines)
+
+    assert facade._parsed_diff("".join(["+", "a"]), unused_parser, _parse_lines) is first
+    assert facade._parsed_diff("+b", unused_parser, _parse_lines) == {"a.py": ["+b"]}
+    assert parse_calls == ["+a", "+b"]
+
+
+def test_review_execution_facade_bounds_diff_cache_retention(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(review_execution_facade, "_DIFF_CACHE_MAX_CHARS", 2)
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+    unused_parser = lambda _content: []
+    parse_lines = lambda content: {"a.py": [content]}
+
+    facade._parsed_diff("+a", unused_parser, parse_lines)
+    assert facade._parsed_diff_cache is not None
+
+    facade._parsed_diff("+abc", unused_parser, parse_lines)
+    assert facade._parsed_diff_cache is None
+
+    facade._parsed_diff("+a", unused_parser, parse_lines)
+    facade.build_scan_function(
+        directory=None,
+        selected_files=None,
+        diff_filter_file=None,
+        diff_filter_commits=None,
+        scan_project_with_scope_fn=lambda *_args: [],
+        get_diff_from_commits_fn=lambda _directory, _commits: None,
+        parse_diff_file_fn=lambda _content: [],
+    )
+    assert facade._parsed_diff_cache is None
+
+
+def test_review_execution_facade_diff_filter_matches_paths_inside_and_outside_run_directory(tmp_path: Path) -> None:
+    diff_path = tmp_path / "changes.diff"
+    diff_path.write_text("diff", encoding="utf-8")
+    project = tmp_path / "project"
+    outside = tmp_path / "outside.py"
+    facade = ReviewExecutionFacade(ReviewExecutionCoordinator(ActiveReviewController()))
+
+    scan_fn = facade.build_scan_function(
+        directory=str(project),
+        selected_files=None,
+        diff_filter_file=str(diff_path),
+        diff_filter_commits=None,
+        scan_project_with_scope_fn=lambda _directory, _scope, *_args: [
+            str(project / "pkg" / "mod.py"),
+            str(project / "other.py"),
+            outside,
+        ],
+        get_diff_from_commits_fn=lambda _directory, _commits: None,
+        parse_diff_file_fn=lambda _content: [
+            {"filename": "pkg/mod.py", "content": "+mod"},
+            {"filename": str(outside).replace("\\", "/"), "content": "+outside"},
+        ],
+    )
+
+    assert scan_fn(str(project) + "/", "project") == [
+        {"path": project / "pkg" / "mod.py", "content": "+mod", "filename": "pkg/mod.py"},
+        {"path": outside, "content": "+outside", "filename": str(outside).replace("\\", "/")},
+    ]
+
+
+def test_event_sink_throttles_intermediate_progress_but_keeps_final_update() -> None:
+    controller = ActiveReviewController()
+    coordinator = ReviewExecutionCoordinator(controller)
+    published: list[tuple[float, str]] = []
+    scheduled: list[tuple[float, Any]] = []
+    now = [0.0]
+    sink = coordinator.build_event_sink(
+        lambda fraction, status: published.append((fraction, status)),
+        min_interval=1.0,
+        clock=lambda: now[0],
+        schedule=lambda delay, callback: scheduled.append((delay, callback)),
+    )
+
+    def _emit(current: int, message: str = "Reviewing") -> None:
+        sink.emit(
+            JobProgressUpdated(
+                job_id="job-1",
+                kind="job.progress",
+                current=current,
+                total=4,
+                message=message,
+            )
+        )
+
+    _emit(1)
+    _emit(2)
+    _emit(3, "Collecting")
+    now[0] = 0.5
+    _emit(3, "Collecting")
+    _emit(4, "Collecting")
+    for _delay, callback in scheduled:
+        callback()
+
+    assert controller.progress_current == 4
+    assert published == [
+        (0.25, "Reviewing 1/4"),
+        (0.75, "Collecting 3/4"),
+        (1.0, "Collecting 4/4"),
+    ]
+
+
+def test_event_sink_publishes_trailing_snapshot_after_throttled_update() -> None:
+    controller = ActiveReviewController()
+    controller.begin()
+    coordinator = ReviewExecutionCoordinator(controller)
+    published: list[tuple[float, str]] = []
+    scheduled: list[tuple[float, Any]] = []
+    now = [0.0]
+    sink = coordinator.build_event_sink(
+        lambda fraction, status: published.append((fraction, status)),
+        min_interval=1.0,
+        clock=lambda: now[0],
+        schedule=lambda delay, callback: scheduled.append((delay, callback)),
+    )
+
+    for current, at in ((1, 0.0), (2, 0.25), (3, 0.5)):
+        now[0] = at
+        sink.emit(JobProgressUpdated(job_id="job-1", kind="job.progress", current=current, total=4, message="Reviewing"))
+
+    assert published == [(0.25, "Reviewing 1/4")]
+    assert [delay for delay, _callback in scheduled] == [0.75]
+
+    now[0] = 1.0
+    scheduled[0][1]()
+
+    assert published == [(0.25, "Reviewing 1/4"), (0.75, "Reviewing 3/4")]
+
+    now[0] = 1.25
+    sink.emit(JobProgressUpdated(job_id="job-1", kind="job.progress", current=3, total=4, message="Reviewing"))
+    controller.finish()
+    scheduled[1][1]()
+
+    assert len(published) == 2
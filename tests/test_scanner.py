@@ -7,7 +7,7 @@ import tempfile
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from aicodereviewer.scanner import scan_project, parse_diff_file, get_diff_from_commits, scan_project_with_scope
+from aicodereviewer.scanner import scan_project, parse_diff_file, parse_diff_file_lines, iter_diff_file, get_diff_from_commits, resolve_commit_range, scan_project_with_scope
 
 
 class TestScanProject:
@@ -177,6 +177,51 @@ class TestParseDiffFile:
         assert 'context' in result[0]['content']
 
 
+    def test_parse_diff_file_lines_keeps_unjoined_lines(self):
+        """Line-level parsing should agree with parse_diff_file once joined."""
+        diff_content = """--- a/file1.py
++++ b/file1.py
+@@ -1,1 +1,2 @@
+ print("file1")
++print("added")
+--- a/file2.py
++++ b/file2.py
+"""
+        result = parse_diff_file_lines(diff_content)
+
+        assert result == {'file1.py': ['print("file1")', 'print("added")']}
+        assert [
+            {'filename': name, 'content': '\n'.join(lines)} for name, lines in result.items()
+        ] == parse_diff_file(diff_content)
+
+    def test_parse_diff_file_lines_without_hunks_is_empty(self):
+        """Diffs with no hunk header should yield no files."""
+        header_only = """--- a/file1.py
++++ b/file1.py
+"""
+        assert parse_diff_file_lines("") == {}
+        assert parse_diff_file_lines("   \n") == {}
+        assert parse_diff_file_lines(header_only) == {}
+        assert parse_diff_file(header_only) == []
+
+    def test_iter_diff_file_yields_lazily(self):
+        """The generator form should yield the same pairs parse_diff_file reports."""
+        diff_content = """--- a/file1.py
++++ b/file1.py
+@@ -1,1 +1,2 @@
+ print("file1")
++print("added")
+--- a/file2.py
++++ b/file2.py
+@@ -1,1 +1,1 @@
++print("file2")
+"""
+        entries = iter_diff_file(diff_content)
+
+        assert next(entries) == ('file1.py', 'print("file1")\nprint("added")')
+        assert list(entries) == [('file2.py', 'print("file2")')]
+
+
 class TestGetDiffFromCommits:
     """Test git/svn diff generation functionality"""
 
@@ -218,6 +263,28 @@ class TestGetDiffFromCommits:
         assert result is None
 
 
+    @patch('aicodereviewer.scanner.detect_vcs_type')
+    @patch('subprocess.run')
+    def test_resolve_commit_range_returns_rev_parse_output(self, mock_run, mock_detect_vcs):
+        """Test commit range resolution for git projects"""
+        mock_detect_vcs.return_value = 'git'
+        mock_process = MagicMock()
+        mock_process.stdout = "abc123\n^def456\n"
+        mock_run.return_value = mock_process
+
+        assert resolve_commit_range("/path/to/project", "HEAD~1..HEAD") == "abc123\n^def456"
+        assert mock_run.call_args.args[0] == ['git', 'rev-parse', 'HEAD~1..HEAD']
+
+    @patch('aicodereviewer.scanner.detect_vcs_type')
+    @patch('subprocess.run')
+    def test_resolve_commit_range_skips_non_git_projects(self, mock_run, mock_detect_vcs):
+        """Test commit range resolution is not attempted for SVN projects"""
+        mock_detect_vcs.return_value = 'svn'
+
+        assert resolve_commit_range("/path/to/project", "PREV:HEAD") is None
+        mock_run.assert_not_called()
+
+
 class TestScanProjectWithScope:
     """Test project scanning with different scopes"""
 
@@ -102,6 +102,48 @@ def test_settings_persistence_controller_saves_values_and_refreshes_local_http(t
     assert any(message == t("gui.settings.saved_ok") and not error for message, error in host.toasts)
 
 
+def test_settings_persistence_controller_skips_file_write_when_nothing_changed(tmp_path: Path, monkeypatch: Any) -> None:
+    _install_fake_vars(monkeypatch)
+    monkeypatch.setattr(config, "config_path", tmp_path / "settings-actions-unchanged.ini")
+    config.config.clear()
+    config._set_defaults()  # type: ignore[reportPrivateUsage]
+    host = _FakeHost()
+    controller = SettingsPersistenceController(host, numeric_settings=_NUMERIC_SETTINGS)
+    controller.save()
+
+    save_calls: list[bool] = []
+    monkeypatch.setattr(config, "save", lambda: save_calls.append(True))
+    controller.save()
+
+    assert save_calls == []
+    assert host.toasts[-1] == (t("gui.settings.saved_ok"), False)
+
+
+def test_settings_persistence_controller_retries_file_write_after_failed_save(tmp_path: Path, monkeypatch: Any) -> None:
+    _install_fake_vars(monkeypatch)
+    config_path = tmp_path / "settings-actions-retry.ini"
+    monkeypatch.setattr(config, "config_path", config_path)
+    config.config.clear()
+    config._set_defaults()  # type: ignore[reportPrivateUsage]
+    config.save()
+    host = _FakeHost()
+    controller = SettingsPersistenceController(host, numeric_settings=_NUMERIC_SETTINGS)
+    real_save = config.save
+
+    def _denied_save() -> None:
+        raise PermissionError("config.ini is read-only")
+
+    monkeypatch.setattr(config, "save", _denied_save)
+    controller.save()
+    assert host.toasts[-1][1] is True
+
+    monkeypatch.setattr(config, "save", real_save)
+    controller.save()
+
+    assert host.toasts[-1] == (t("gui.settings.saved_ok"), False)
+    assert "http://127.0.0.1:9999" in config_path.read_text(encoding="utf-8")
+
+
 def test_settings_persistence_controller_reenables_json_when_no_output_format_selected() -> None:
     from _pytest.monkeypatch import MonkeyPatch
 
@@ -134,6 +176,23 @@ def test_settings_persistence_controller_reports_invalid_numeric_value(monkeypat
     assert any("not a valid" in message and error for message, error in host.toasts)
 
 
+def test_settings_persistence_controller_invalid_numeric_value_writes_nothing(tmp_path: Path, monkeypatch: Any) -> None:
+    _install_fake_vars(monkeypatch)
+    monkeypatch.setattr(config, "config_path", tmp_path / "settings-actions-invalid.ini")
+    config.config.clear()
+    config._set_defaults()  # type: ignore[reportPrivateUsage]
+    original_url = config.get("local_llm", "api_url")
+    host = _FakeHost()
+    host._setting_entries[("processing", "batch_size")] = _FakeEntry("many")
+    controller = SettingsPersistenceController(host, numeric_settings=_NUMERIC_SETTINGS)
+
+    controller.save()
+
+    assert config.get("local_llm", "api_url") == original_url
+    assert config.get("gui", "theme") != "dark"
+    assert any(message.startswith("Batch size:") and error for message, error in host.toasts)
+
+
 def test_settings_persistence_controller_rotates_local_llm_api_key(monkeypatch: Any, tmp_path: Path) -> None:
     _install_fake_vars(monkeypatch)
     config_path = tmp_path / "settings-actions-rotate.ini"
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from aicodereviewer.config import config
+from aicodereviewer.gui import settings_builder
+from aicodereviewer.gui.settings_builder import SettingsTabBuilder
+from aicodereviewer.gui.settings_mixin import SettingsTabMixin
+
+
+class _FakeStringVar:
+    def __init__(self, value: str) -> None:
+        self._value = value
+
+    def get(self) -> str:
+        return self._value
+
+    def set(self, value: str) -> None:
+        self._value = value
+
+
+class _FakeHost(SettingsTabMixin):
+    def __init__(self) -> None:
+        self._testing_mode = False
+        self._setting_entries: dict[tuple[str, str], Any] = {}
+        self._settings_pending_sections: dict[str, Any] = {}
+        self._backend_section_labels: dict[str, Any] = {}
+        self._backend_reverse_map = {
+            "Bedrock": "bedrock",
+            "Kiro": "kiro",
+            "Copilot": "copilot",
+            "Local": "local",
+        }
+        self._settings_backend_var = _FakeStringVar("Bedrock")
+        self.layout_refreshes = 0
+
+    def _refresh_settings_tab_layout(self) -> None:
+        self.layout_refreshes += 1
+
+
+def _recording_builder(host: _FakeHost) -> tuple[SettingsTabBuilder, list[tuple[str, int, Any]]]:
+    builder = SettingsTabBuilder(host)
+    builder.row = 7
+    built: list[tuple[str, int, Any]] = []
+
+    def _recorder(backend_key: str, section: str, key: str) -> Any:
+        def _build() -> None:
+            built.append((backend_key, builder.row, builder._config_value(section, key)))
+            builder.row += 3
+
+        return _build
+
+    builder._build_bedrock_section = _recorder("bedrock", "aws", "region")  # type: ignore[method-assign]
+    builder._build_kiro_section = _recorder("kiro", "kiro", "cli_command")  # type: ignore[method-assign]
+    builder._build_copilot_section = _recorder("copilot", "copilot", "timeout")  # type: ignore[method-assign]
+    builder._build_local_llm_section = _recorder("local", "local_llm", "api_url")  # type: ignore[method-assign]
+    return builder, built
+
+
+@pytest.fixture
+def default_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "config", config.config)
+    monkeypatch.setattr(config, "_dirty", config._dirty)
+    config.reset_to_defaults()
+
+
+def test_backend_sections_build_only_active_section_and_reserve_rows(default_config: None) -> None:
+    config.set_value("backend", "type", "kiro")
+    host = _FakeHost()
+    builder, built = _recording_builder(host)
+
+    builder._build_backend_sections()
+
+    rows = settings_builder._BACKEND_SECTION_ROWS
+    assert built == [("kiro", 7 + rows, "kiro-cli")]
+    assert sorted(host._settings_pending_sections) == ["bedrock", "copilot", "local"]
+    assert builder.row == 7 + 4 * rows
+
+
+def test_selecting_backend_builds_deferred_section_in_its_reserved_rows(default_config: None) -> None:
+    host = _FakeHost()
+    builder, built = _recording_builder(host)
+    builder._build_backend_sections()
+    end_row = builder.row
+
+    host._settings_backend_var.set("Local")
+    host._update_backend_section_indicators()
+    host._update_backend_section_indicators()
+
+    rows = settings_builder._BACKEND_SECTION_ROWS
+    assert [entry[:2] for entry in built] == [("bedrock", 7), ("local", 7 + 3 * rows)]
+    assert "local" not in host._settings_pending_sections
+    assert builder.row == end_row
+    assert host.layout_refreshes == 1
+
+
+def test_deferred_section_reads_config_current_at_build_time(default_config: None) -> None:
+    config.set_value("local_llm", "api_url", "http://before:1")
+    host = _FakeHost()
+    builder, built = _recording_builder(host)
+    assert builder._config_value("local_llm", "api_url") == "http://before:1"
+    builder._build_backend_sections()
+
+    config.reset_to_defaults()
+    host._build_pending_settings_sections("local")
+
+    assert built[-1] == ("local", 7 + 3 * settings_builder._BACKEND_SECTION_ROWS, "http://localhost:1234")
+
+
+def test_restoring_state_builds_pending_sections_first(default_config: None) -> None:
+    host = _FakeHost()
+    builder, built = _recording_builder(host)
+    builder._build_backend_sections()
+    host._refresh_local_http_discovery_ui = lambda: None  # type: ignore[method-assign]
+
+    host._restore_settings_surface_state({"entries": {("kiro", "cli_command"): "kiro-x"}, "formats": {}})
+
+    assert [entry[0] for entry in built] == ["bedrock", "kiro", "copilot", "local"]
+    assert host._settings_pending_sections == {}
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from aicodereviewer.config import config
+from aicodereviewer.gui import settings_mixin
+from aicodereviewer.gui.settings_mixin import SettingsTabMixin
+from aicodereviewer.i18n import t
+
+
+class _FakeEntry:
+    def __init__(self, value: str) -> None:
+        self._value = value
+
+    def get(self) -> str:
+        return self._value
+
+    def delete(self, _start: int, _end: str | None = None) -> None:
+        self._value = ""
+
+    def insert(self, _index: int, value: str) -> None:
+        self._value = value
+
+
+class _FakeStringVar:
+    def __init__(self, value: str) -> None:
+        self._value = value
+
+    def get(self) -> str:
+        return self._value
+
+    def set(self, value: str) -> None:
+        self._value = value
+
+
+class _FakeBooleanVar:
+    def __init__(self, value: bool) -> None:
+        self._value = value
+
+    def get(self) -> bool:
+        return self._value
+
+    def set(self, value: bool) -> None:
+        self._value = value
+
+
+class _FakeHost(SettingsTabMixin):
+    def __init__(self) -> None:
+        self._backend_display_map = {"bedrock": "AWS Bedrock", "local": "Local LLM"}
+        self._setting_entries: dict[tuple[str, str], Any] = {
+            ("gui", "theme"): _FakeStringVar(t("gui.settings.ui_theme_dark")),
+            ("gui", "language"): _FakeStringVar(t("gui.settings.ui_lang_ja")),
+            ("backend", "type"): _FakeStringVar("Local LLM"),
+            ("performance", "max_file_size_mb"): _FakeEntry("64"),
+            ("local_llm", "api_key"): _FakeEntry("typed-secret"),
+            ("local_llm", "enable_web_search"): _FakeBooleanVar(False),
+            ("kiro", "cli_command"): _FakeEntry("custom-kiro"),
+        }
+        self._format_vars = {
+            "json": _FakeBooleanVar(False),
+            "txt": _FakeBooleanVar(False),
+            "md": _FakeBooleanVar(True),
+        }
+        self.rebuilt = False
+
+    def _rebuild_settings_surface_from_config(self) -> None:
+        self.rebuilt = True
+
+    def _refresh_local_http_discovery_ui(self) -> None:
+        pass
+
+    def _refresh_settings_tab_layout(self) -> None:
+        pass
+
+
+@pytest.fixture
+def default_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings_mixin.ctk, "StringVar", _FakeStringVar)
+    monkeypatch.setattr(settings_mixin.ctk, "BooleanVar", _FakeBooleanVar)
+    monkeypatch.setattr(config, "config", config.config)
+    monkeypatch.setattr(config, "_dirty", config._dirty)
+    config.reset_to_defaults()
+
+
+def test_reset_settings_surface_from_config_shows_defaults_in_existing_widgets(default_config: None) -> None:
+    host = _FakeHost()
+    widgets = dict(host._setting_entries)
+
+    host._reset_settings_surface_from_config()
+
+    entries = host._setting_entries
+    assert host.rebuilt is False
+    assert all(entries[key] is widget for key, widget in widgets.items())
+    assert entries[("gui", "theme")].get() == t("gui.settings.ui_theme_system")
+    assert entries[("gui", "language")].get() == t("gui.settings.ui_lang_system")
+    assert entries[("backend", "type")].get() == "AWS Bedrock"
+    assert entries[("performance", "max_file_size_mb")].get() == "10"
+    assert entries[("local_llm", "api_key")].get() == ""
+    assert entries[("local_llm", "enable_web_search")].get() is True
+    assert entries[("kiro", "cli_command")].get() == "kiro-cli"
+    assert {fmt: var.get() for fmt, var in host._format_vars.items()} == {
+        "json": True,
+        "txt": True,
+        "md": False,
+    }
+
+
+def test_reset_settings_surface_from_config_rebuilds_when_no_form_exists(default_config: None) -> None:
+    host = _FakeHost()
+    host._setting_entries = {}
+
+    host._reset_settings_surface_from_config()
+
+    assert host.rebuilt is True